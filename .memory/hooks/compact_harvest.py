@@ -14,8 +14,8 @@ Designed to be fast. Skips pipeline (sync/rules/evolution) — it runs
 on next SessionStart anyway.
 """
 
-import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -25,7 +25,10 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 _MEMORY_DIR = _SCRIPT_DIR.parent
 _PROJECT_ROOT = _MEMORY_DIR.parent
 
-MAX_STDIN_SIZE = 10 * 1024 * 1024  # 10 MB
+if str(_MEMORY_DIR) not in sys.path:
+    sys.path.insert(0, str(_MEMORY_DIR))
+
+from lib.hook_io import read_hook_input, write_hook_output  # noqa: E402
 
 ECHO_REMINDER = (
     "[EFM] Before compacting: consider /memory-save if you discovered "
@@ -36,19 +39,17 @@ ECHO_REMINDER = (
 def main():
     # --- Parse stdin ---
     try:
-        raw_input = sys.stdin.read(MAX_STDIN_SIZE + 1)
-        if len(raw_input) > MAX_STDIN_SIZE:
-            sys.exit(0)
-        input_data = json.loads(raw_input)
-    except (json.JSONDecodeError, OSError):
+        input_data = read_hook_input()
+    except (ValueError, OSError):
         input_data = {}
+    if input_data is None:  # Oversized payload
+        sys.exit(0)
 
     # --- Load config ---
     config_path = _MEMORY_DIR / "config.json"
     try:
-        sys.path.insert(0, str(_MEMORY_DIR))
-        from lib.config_presets import load_config
-        config = load_config(config_path)
+        from lib.config_presets import load_config_cached
+        config = load_config_cached(config_path)
     except Exception as e:
         logger.warning("Config load failed, using defaults: %s", e)
         config = {}
@@ -58,24 +59,28 @@ def main():
     # Check if harvest_on_compact is enabled
     if not v3_config.get("harvest_on_compact", True):
         # Disabled: fall back to echo reminder
-        print(json.dumps({"additionalContext": ECHO_REMINDER}))
+        write_hook_output({"additionalContext": ECHO_REMINDER})
         sys.exit(0)
 
     working_dir_rel = v3_config.get("working_memory_dir", ".memory/working")
     working_dir = _PROJECT_ROOT / working_dir_rel
-    findings_path = working_dir / "findings.md"
-    progress_path = working_dir / "progress.md"
 
-    has_session = findings_path.exists() or progress_path.exists()
+    # One directory listing answers both the session and the marker check
+    try:
+        working_names = set(os.listdir(working_dir))
+    except OSError:
+        working_names = set()
 
-    # Ensure working dir exists (for marker file)
-    working_dir.mkdir(parents=True, exist_ok=True)
-    compact_marker = working_dir / ".compact_harvested"
+    has_session = "findings.md" in working_names or "progress.md" in working_names
 
     # Already harvested in this compaction cycle? Skip.
-    if compact_marker.exists():
+    if ".compact_harvested" in working_names:
         sys.exit(0)
 
+    # Ensure working dir exists (for marker file)
+    working_dir.mkdir(parents=True, exist_ok=True)
+    compact_marker = working_dir / ".compact_harvested"
+
     output_parts = []
 
     if has_session:
@@ -128,6 +133,7 @@ def main():
                     drafts_dir,
                     _PROJECT_ROOT,
                     config,
+                    tail_bytes=v3_config.get("scan_tail_bytes", 0),
                 )
                 if report["drafts_created"] > 0:
                     type_summary = ", ".join(
@@ -152,10 +158,10 @@ def main():
 
     # --- Output ---
     if output_parts:
-        print(json.dumps({"additionalContext": "\n".join(output_parts)}))
+        write_hook_output({"additionalContext": "\n".join(output_parts)})
     else:
         # Nothing harvested, still show reminder
-        print(json.dumps({"additionalContext": ECHO_REMINDER}))
+        write_hook_output({"additionalContext": ECHO_REMINDER})
 
     sys.exit(0)
 
@@ -8,7 +8,6 @@ plan mode. Injects prefilled EF Memory context as additionalContext.
 Skips if a session already exists (idempotent).
 """
 
-import json
 import logging
 import sys
 from pathlib import Path
@@ -19,24 +18,24 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 _MEMORY_DIR = _SCRIPT_DIR.parent
 _PROJECT_ROOT = _MEMORY_DIR.parent
 
+if str(_MEMORY_DIR) not in sys.path:
+    sys.path.insert(0, str(_MEMORY_DIR))
 
-MAX_STDIN_SIZE = 10 * 1024 * 1024  # 10 MB
+from lib.hook_io import read_hook_input, write_hook_output  # noqa: E402
 
 
 def main():
     try:
-        raw_input = sys.stdin.read(MAX_STDIN_SIZE + 1)
-        if len(raw_input) > MAX_STDIN_SIZE:
-            sys.exit(0)
-        input_data = json.loads(raw_input)
-    except (json.JSONDecodeError, OSError):
+        input_data = read_hook_input()
+    except (ValueError, OSError):
         # Can't read input — don't block
         sys.exit(0)
+    if input_data is None:  # Oversized payload
+        sys.exit(0)
 
     # Load config (with preset resolution)
     config_path = _MEMORY_DIR / "config.json"
     try:
-        sys.path.insert(0, str(_MEMORY_DIR))
         from lib.config_presets import load_config
         config = load_config(config_path)
     except Exception as e:
@@ -66,7 +65,6 @@ def main():
 
     # Start session
     try:
-        sys.path.insert(0, str(_MEMORY_DIR))
         from lib.working_memory import start_session
 
         report = start_session(
@@ -94,14 +92,14 @@ def main():
         lines.append("Update .memory/working/findings.md with discoveries as you work.")
 
         result = {"additionalContext": "\n".join(lines)}
-        print(json.dumps(result))
+        write_hook_output(result)
 
     except Exception as e:
         # Never block plan mode entry on failure
         result = {
             "additionalContext": f"[EF Memory] Auto-start session failed: {e}"
         }
-        print(json.dumps(result))
+        write_hook_output(result)
 
     sys.exit(0)
 
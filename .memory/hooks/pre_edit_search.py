@@ -9,7 +9,6 @@ additionalContext so Claude sees them before editing.
 Fast path: skips if file is in .memory/, .claude/, or non-code files.
 """
 
-import json
 import logging
 import sys
 from pathlib import Path
@@ -23,17 +22,15 @@ _PROJECT_ROOT = _MEMORY_DIR.parent
 
 sys.path.insert(0, str(_MEMORY_DIR))
 
-
-MAX_STDIN_SIZE = 10 * 1024 * 1024  # 10 MB
+from lib.hook_io import read_hook_input, write_hook_output  # noqa: E402
 
 
 def main():
     try:
-        raw_input = sys.stdin.read(MAX_STDIN_SIZE + 1)
-        if len(raw_input) > MAX_STDIN_SIZE:
-            sys.exit(0)
-        input_data = json.loads(raw_input)
-    except (json.JSONDecodeError, OSError):
+        input_data = read_hook_input()
+    except (ValueError, OSError):
+        sys.exit(0)
+    if input_data is None:  # Oversized payload
         sys.exit(0)
 
     # Extract file path from tool input
@@ -118,7 +115,7 @@ def main():
                     line += f" | Rule: {rule}"
                 lines.append(line)
 
-            print(json.dumps({"additionalContext": "\n".join(lines)}))
+            write_hook_output({"additionalContext": "\n".join(lines)})
     except Exception as e:
         logger.debug("Memory search skipped: %s", e)
 
@@ -17,8 +17,8 @@ Runs only once per session (via the 'once' hook config flag).
 Checks stop_hook_active to prevent infinite loops.
 """
 
-import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -28,17 +28,24 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 _MEMORY_DIR = _SCRIPT_DIR.parent
 _PROJECT_ROOT = _MEMORY_DIR.parent
 
+# Make 'lib' importable once; lib modules are still imported lazily so the
+# no-op paths stay cheap.
+if str(_MEMORY_DIR) not in sys.path:
+    sys.path.insert(0, str(_MEMORY_DIR))
 
-MAX_STDIN_SIZE = 10 * 1024 * 1024  # 10 MB
+from lib.hook_io import (  # noqa: E402
+    STOP_HOOK_ACTIVE_MARKERS,
+    read_hook_input,
+    write_hook_output,
+)
 
 
 def main():
     try:
-        raw_input = sys.stdin.read(MAX_STDIN_SIZE + 1)
-        if len(raw_input) > MAX_STDIN_SIZE:
-            sys.exit(0)
-        input_data = json.loads(raw_input)
-    except (json.JSONDecodeError, OSError):
+        input_data = read_hook_input(skip_markers=STOP_HOOK_ACTIVE_MARKERS)
+    except (ValueError, OSError):
+        sys.exit(0)
+    if input_data is None:  # Oversized payload, or stop_hook_active seen raw
         sys.exit(0)
 
     # Prevent infinite loops: if this hook already fired, let Claude stop
@@ -48,9 +55,8 @@ def main():
     # Load config (with preset resolution)
     config_path = _MEMORY_DIR / "config.json"
     try:
-        sys.path.insert(0, str(_MEMORY_DIR))
-        from lib.config_presets import load_config
-        config = load_config(config_path)
+        from lib.config_presets import load_config_cached
+        config = load_config_cached(config_path)
     except Exception as e:
         logger.warning("Config load failed, using defaults: %s", e)
         config = {}
@@ -58,16 +64,19 @@ def main():
     v3_config = config.get("v3", {})
     working_dir_rel = v3_config.get("working_memory_dir", ".memory/working")
     working_dir = _PROJECT_ROOT / working_dir_rel
-    findings_path = working_dir / "findings.md"
-    progress_path = working_dir / "progress.md"
+
+    # One directory listing answers both the marker and the session check
+    try:
+        working_names = set(os.listdir(working_dir))
+    except OSError:
+        working_names = set()
 
     # Skip if PreCompact already harvested this session
-    compact_marker = working_dir / ".compact_harvested"
-    if compact_marker.exists():
-        compact_marker.unlink(missing_ok=True)
+    if ".compact_harvested" in working_names:
+        (working_dir / ".compact_harvested").unlink(missing_ok=True)
         sys.exit(0)
 
-    has_session = findings_path.exists() or progress_path.exists()
+    has_session = "findings.md" in working_names or "progress.md" in working_names
     if not has_session:
         # No active working memory session — try scanning conversation
         auto_draft = v3_config.get("auto_draft_from_conversation", True)
@@ -76,7 +85,6 @@ def main():
             sys.exit(0)
 
         try:
-            sys.path.insert(0, str(_MEMORY_DIR))
             from lib.transcript_scanner import scan_conversation_for_drafts
 
             drafts_dir = _MEMORY_DIR / "drafts"
@@ -85,6 +93,7 @@ def main():
                 drafts_dir,
                 _PROJECT_ROOT,
                 config,
+                tail_bytes=v3_config.get("scan_tail_bytes", 0),
             )
             if report["drafts_created"] > 0:
                 type_summary = ", ".join(
@@ -102,7 +111,7 @@ def main():
                         f"Drafts require your approval."
                     )
                 }
-                print(json.dumps(result))
+                write_hook_output(result)
         except Exception as e:
             logger.warning("Transcript scan failed: %s", e)
 
@@ -117,7 +126,6 @@ def main():
     if auto_harvest:
         # Full automation: harvest → convert → write → pipeline → clear
         try:
-            sys.path.insert(0, str(_MEMORY_DIR))
             from lib.working_memory import auto_harvest_and_persist, is_session_complete
 
             # Check session completeness
@@ -185,8 +193,6 @@ def main():
 
     # Auto-compact if waste ratio exceeds threshold
     try:
-        if _MEMORY_DIR not in [Path(p) for p in sys.path]:
-            sys.path.insert(0, str(_MEMORY_DIR))
         from lib.compaction import get_compaction_stats, compact
 
         compact_config = config.get("compaction", {})
@@ -210,11 +216,11 @@ def main():
     # --- Unified output: single JSON to stdout ---
     if decision:
         # Block path (auto_harvest=false): output the block decision
-        print(json.dumps(decision))
+        write_hook_output(decision)
     elif output_parts:
         # Non-blocking: merge all parts into one additionalContext
         result = {"additionalContext": "\n".join(output_parts)}
-        print(json.dumps(result))
+        write_hook_output(result)
 
     sys.exit(0)
 
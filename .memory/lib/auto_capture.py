@@ -17,12 +17,13 @@ No external dependencies — pure Python stdlib + internal modules.
 import copy
 import json
 import logging
+import os
 import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .auto_verify import (
     ValidationResult,
@@ -30,6 +31,7 @@ from .auto_verify import (
     validate_schema,
     verify_entry,
 )
+from .events_io import append_lines, serialize_entry
 
 logger = logging.getLogger("efm.auto_capture")
 
@@ -95,6 +97,38 @@ def _sanitize_title(title: str) -> str:
     return result or "untitled"
 
 
+def _draft_names(drafts_dir: Path, stem: str) -> Iterator[Path]:
+    """``{stem}.json``, then ``{stem}_001.json``, ``{stem}_002.json``, ..."""
+    yield drafts_dir / f"{stem}.json"
+    counter = 1
+    while True:
+        yield drafts_dir / f"{stem}_{counter:03d}.json"
+        counter += 1
+
+
+def _write_new_draft(drafts_dir: Path, stem: str, payload: bytes) -> Path:
+    """
+    Write *payload* to the first free name from _draft_names().
+
+    Names are claimed with ``O_CREAT | O_EXCL``, so checking for a free
+    name and creating the file is one atomic step: concurrent writers
+    never overwrite each other's drafts, and no separate exists() probe
+    is needed.  The payload goes out in a single ``os.write`` loop.
+    """
+    for target in _draft_names(drafts_dir, stem):
+        try:
+            fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return target
+
+
 # ---------------------------------------------------------------------------
 # Core functions
 # ---------------------------------------------------------------------------
@@ -107,7 +141,8 @@ def create_draft(entry: dict, drafts_dir: Path) -> DraftInfo:
     1. Validate schema (advisory — record but don't reject)
     2. Add _meta.draft_status and _meta.capture_timestamp
     3. Generate filename: {YYYYMMDD_HHMMSS}_{sanitized_title}.json
-    4. Write pretty-printed JSON (indent=2)
+    4. Write pretty-printed JSON (indent=2) under a name claimed
+       atomically (see _write_new_draft)
 
     Returns DraftInfo with path, entry, validation result.
     Does NOT write to events.jsonl.
@@ -134,28 +169,17 @@ def create_draft(entry: dict, drafts_dir: Path) -> DraftInfo:
     title = entry.get("title", "")
     sanitized = _sanitize_title(title)
     timestamp_str = now.strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp_str}_{sanitized}.json"
 
     # Ensure drafts_dir exists
     drafts_dir.mkdir(parents=True, exist_ok=True)
 
-    # Handle collision (same second + same title)
-    target = drafts_dir / filename
-    counter = 1
-    while target.exists():
-        filename = f"{timestamp_str}_{sanitized}_{counter:03d}.json"
-        target = drafts_dir / filename
-        counter += 1
-
-    # Write
-    target.write_text(
-        json.dumps(entry, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Write (a collision — same second + same title — gets a _NNN suffix)
+    payload = (json.dumps(entry, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    target = _write_new_draft(drafts_dir, f"{timestamp_str}_{sanitized}", payload)
 
     info.path = target
     info.entry = entry
-    info.filename = filename
+    info.filename = target.name
     info.draft_status = "pending"
     info.capture_timestamp = entry["_meta"]["capture_timestamp"]
 
@@ -244,8 +268,7 @@ def approve_draft(draft_path: Path, events_path: Path) -> ApproveResult:
 
     # Append to events.jsonl (create if missing)
     try:
-        with open(events_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        append_lines(events_path, [serialize_entry(entry)])
     except OSError as e:
         result.message = f"Cannot write to events.jsonl: {e}"
         return result
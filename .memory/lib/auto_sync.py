@@ -253,12 +253,15 @@ def _run_sync_step(events_path: Path, config: dict) -> StepResult:
                 logger.warning(f"Embedder not available: {e}")
 
         # Run sync
-        batch_size = embedding_config.get("sync", {}).get("batch_size", 20)
+        sync_config = embedding_config.get("sync", {})
         sync_report = sync_embeddings(
             events_path=events_path,
             vectordb=db,
             embedder=embedder,
-            batch_size=batch_size,
+            batch_size=sync_config.get("batch_size", 20),
+            concurrency=sync_config.get("concurrency", 4),
+            max_batch_chars=sync_config.get("max_batch_chars", 200_000),
+            quantize=embedding_config.get("storage", {}).get("quantize", False),
         )
 
         result.success = len(sync_report.errors) == 0
@@ -371,13 +374,18 @@ def _run_reasoning_step(
     try:
         from .reasoning import build_reasoning_report
         from .llm_provider import create_llm_provider
+        from .prompt_cache import with_response_cache
 
         # Optionally create LLM provider
         llm_provider = None
         reasoning_config = config.get("reasoning", {})
         if reasoning_config.get("enabled", False):
             try:
-                llm_provider = create_llm_provider(reasoning_config)
+                llm_provider = with_response_cache(
+                    create_llm_provider(reasoning_config),
+                    reasoning_config,
+                    events_path.parent / "cache",
+                )
             except Exception as e:
                 logger.warning(f"LLM provider not available: {e}")
 
@@ -15,12 +15,12 @@ import difflib
 import json
 import logging
 import re
-import subprocess
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from .text_builder import build_dedup_text
 
@@ -362,6 +362,8 @@ def verify_source(source_str: str, project_root: Path) -> SourceCheckResult:
 
 def _verify_commit(commit_hash: str, project_root: Path, result: SourceCheckResult) -> SourceCheckResult:
     """Verify a commit hash exists via git."""
+    import subprocess  # ~3 ms to import; only commit sources need it
+
     try:
         proc = subprocess.run(
             ["git", "cat-file", "-t", commit_hash],
@@ -583,7 +585,9 @@ def check_duplicates(
     entry: dict,
     events_path: Path,
     threshold: float = 0.85,
-    _preloaded_entries: Optional[Dict[str, dict]] = None,
+    _preloaded_entries: Optional[Mapping[str, dict]] = None,
+    _dedup_texts: Optional[Dict[str, str]] = None,
+    _dedup_counts: Optional[Dict[str, Counter]] = None,
 ) -> DedupResult:
     """
     Check for near-duplicate entries using text similarity.
@@ -595,8 +599,15 @@ def check_duplicates(
     text similarity is less precise).
 
     Args:
-        _preloaded_entries: Optional pre-loaded entries dict to avoid
+        _preloaded_entries: Optional pre-loaded entries mapping to avoid
             re-reading events.jsonl on every call (used by verify_all_entries).
+            Only iterated, so any Mapping (e.g. a ChainMap) works.
+        _dedup_texts: Optional ``{entry_id: dedup_text}`` cache shared across
+            calls over the same entries; filled on demand.  Callers that
+            replace an entry under an existing id must drop its cached text.
+        _dedup_counts: Optional ``{dedup_text: character counts}`` cache
+            shared across calls, filled on demand.  Keyed by the text
+            itself, so it never goes stale.
     """
     result = DedupResult(threshold=threshold)
     entry_id = entry.get("id", "")
@@ -604,6 +615,9 @@ def check_duplicates(
 
     if not candidate_text:
         return result
+    if _dedup_counts is None:
+        _dedup_counts = {}
+    candidate_counts = Counter(candidate_text)
 
     # Use pre-loaded entries if available, otherwise load from file
     existing = _preloaded_entries if _preloaded_entries is not None else _load_entries_latest_wins(events_path)
@@ -616,13 +630,29 @@ def check_duplicates(
         if existing_entry.get("deprecated", False):
             continue
 
-        existing_text = build_dedup_text(existing_entry)
+        if _dedup_texts is None:
+            existing_text = build_dedup_text(existing_entry)
+        else:
+            existing_text = _dedup_texts.get(existing_id)
+            if existing_text is None:
+                existing_text = _dedup_texts[existing_id] = build_dedup_text(existing_entry)
         if not existing_text:
             continue
 
-        ratio = difflib.SequenceMatcher(
-            None, candidate_text, existing_text
-        ).ratio()
+        # real_quick_ratio() and quick_ratio() (both inlined: lengths, then
+        # the shared character multiset) are upper bounds on ratio(), so
+        # pairs that cannot reach the threshold skip the quadratic
+        # matching-blocks pass.  Character counts are cached per text
+        # instead of being rebuilt by quick_ratio() for every pair.
+        total_len = len(candidate_text) + len(existing_text)
+        if 2.0 * min(len(candidate_text), len(existing_text)) / total_len < threshold:
+            continue
+        existing_counts = _dedup_counts.get(existing_text)
+        if existing_counts is None:
+            existing_counts = _dedup_counts[existing_text] = Counter(existing_text)
+        if 2.0 * sum((candidate_counts & existing_counts).values()) / total_len < threshold:
+            continue
+        ratio = difflib.SequenceMatcher(None, candidate_text, existing_text).ratio()
 
         if ratio >= threshold:
             result.similar_entries.append((existing_id, round(ratio, 4)))
@@ -13,7 +13,7 @@ Usage:
   compact(events_path, archive_dir, config) -> CompactionReport
   get_compaction_stats(events_path)          -> CompactionStats  (read-only)
 
-No external dependencies — pure Python stdlib.
+No external dependencies — pure Python stdlib + internal events_io.
 """
 
 import json
@@ -25,6 +25,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .events_io import append_lines, serialize_entry
+
 logger = logging.getLogger("efm.compaction")
 
 
@@ -143,9 +145,7 @@ def _archive_lines(
     counts: Dict[str, int] = {}
     for quarter, entries in sorted(by_quarter.items()):
         archive_path = archive_dir / f"events_{quarter}.jsonl"
-        with open(archive_path, "a", encoding="utf-8") as f:
-            for entry in entries:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        append_lines(archive_path, [serialize_entry(entry) for entry in entries])
         counts[quarter] = len(entries)
 
     return counts
@@ -159,6 +159,8 @@ def _atomic_rewrite(
     """Atomically rewrite events.jsonl with only the keep entries.
 
     Writes to a .tmp file first, then uses os.replace() for atomic swap.
+    Lines use serialize_entry()'s canonical stdlib form, so kept lines
+    come out byte-identical to how any other writer stored them.
     """
     if sort_by_created_at:
         keep_entries = sorted(
@@ -167,9 +169,8 @@ def _atomic_rewrite(
         )
 
     tmp_path = events_path.with_suffix(".jsonl.tmp")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        for entry in keep_entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(serialize_entry(entry) + b"\n" for entry in keep_entries))
 
     os.replace(str(tmp_path), str(events_path))
 
@@ -12,12 +12,16 @@ Usage:
 Or for in-process resolution:
     from .config_presets import resolve_config
     config = resolve_config(raw_config)
+
+Hooks that may load the same config.json several times per process use
+``load_config_cached()``, which re-parses only when the file changes.
 """
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 logger = logging.getLogger("efm.config_presets")
 
@@ -171,6 +175,33 @@ def load_config(config_path: Path) -> dict:
     return resolve_config(raw)
 
 
+# Per-path cache for load_config_cached(): path -> (st_mtime_ns, st_size, config)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+
+
+def load_config_cached(config_path: Path) -> dict:
+    """Like :func:`load_config`, memoized on the file's mtime and size.
+
+    A single ``os.stat`` decides whether the cached result is still valid;
+    the file is only read and parsed again when it has changed.  The
+    returned dict is shared between callers — treat it as read-only.
+    """
+    key = str(config_path)
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        _CONFIG_CACHE.pop(key, None)
+        return {}
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    config = load_config(config_path)
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+
 def describe_preset(name: str) -> str:
     """Return a one-line human description of a preset."""
     descriptions = {
@@ -7,90 +7,326 @@ sync, and generate_rules with one shared implementation.
 
 All callers apply their own post-filters (deprecated, hard classification, etc.)
 on top of the base latest-wins dict returned here.
+
+Appends go through append_events() / append_lines(), which write a whole
+batch with one O_APPEND write so concurrent writers never interleave inside a line.
 """
 
+import gc
 import json
 import logging
+import mmap
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger("efm.events_io")
 
+# Window size for counting newlines in a mapped file
+_COUNT_CHUNK_BYTES = 1024 * 1024
+
+# Payloads at least this large are decoded with orjson even if nothing else
+# has imported it yet
+_ORJSON_MIN_BYTES = 256 * 1024
+
+_orjson_module = None
+_orjson_checked = False
+
+
+def get_orjson(size: Optional[int] = None):
+    """
+    The optional C-accelerated ``orjson`` module, or None.
+
+    The one place that decides when orjson is worth importing, shared by
+    events.jsonl reads, hook_io and the transcript scanner.  Importing it
+    costs ~8 ms (it pulls in zoneinfo and friends), more than stdlib json
+    spends on a small payload, so for a *size* below ``_ORJSON_MIN_BYTES``
+    it is only returned once something has already loaded it.  Passing no
+    size always imports it.  events.jsonl itself is always written by
+    serialize_entry(), which is stdlib-only.
+    """
+    global _orjson_module, _orjson_checked
+    if not _orjson_checked:
+        if size is not None and size < _ORJSON_MIN_BYTES and "orjson" not in sys.modules:
+            return None
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson_module = orjson
+        _orjson_checked = True
+    return _orjson_module
+
 
 def load_events_latest_wins(
     events_path: Path,
     start_line: int = 0,
     track_lines: bool = False,
     byte_offset: int = 0,
+    count_lines: bool = False,
+    line_map: Optional[Dict[str, int]] = None,
 ) -> Tuple[Dict[str, dict], int, int]:
     """
     Load entries from events.jsonl with latest-wins semantics.
 
+    The file is memory-mapped and walked line by line with ``mmap.find``,
+    so large files are never copied onto the heap as a whole.  Each line
+    is decoded with ``orjson`` when installed (see get_orjson), else
+    stdlib ``json``.
+    The cyclic garbage collector is paused while decoding: decoded JSON
+    cannot form reference cycles, and collections triggered by the burst
+    of new dicts and lists otherwise take about half of the load time.
+
     Args:
         events_path: Path to events.jsonl.
         start_line: Skip JSON parsing for lines before this index (0-based).
                     Ignored if ``byte_offset > 0`` (byte offset takes priority).
         track_lines: If True, each entry dict gets an ``_line`` key
-                     with its 0-based line index.
-        byte_offset: If > 0, seek directly to this byte position instead of
-                     scanning from the beginning.  Much faster for incremental
-                     sync on large files.
+                     with its 0-based line index.  Prefer ``line_map``,
+                     which leaves the entries exactly as stored.
+        byte_offset: If > 0, only parse content after this byte position
+                     instead of from the beginning.  Much faster for
+                     incremental sync on large files.
+        count_lines: If True, also report ``total_lines`` in byte-offset
+                     mode.  Counted with ``bytes.count`` over 1 MiB windows
+                     of the mapped file, without decoding the skipped prefix.
+        line_map: If given, filled with ``{entry_id: line_index}`` (0-based)
+                  for every returned entry.  Like ``_line``, only populated
+                  when scanning from the start of the file.
 
     Returns:
         (entries, total_lines, end_byte_offset)
         - entries: ``{entry_id: latest_entry_dict}`` (includes all entries,
           both active and deprecated — callers filter as needed).
         - total_lines: total number of lines in the file (including blank).
+          0 in byte-offset mode unless ``count_lines`` is set.
         - end_byte_offset: byte position at end of file, for cursor storage.
     """
     entries: Dict[str, dict] = {}
-    total_lines = 0
-    end_offset = 0
 
     if not events_path.exists():
         return entries, 0, 0
 
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
     try:
-        with open(events_path, "r", encoding="utf-8") as f:
-            if byte_offset > 0:
-                # Fast path: seek directly to unprocessed content
-                f.seek(byte_offset)
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        entry_id = entry.get("id")
-                        if entry_id:
-                            entries[entry_id] = entry
-                    except json.JSONDecodeError as e:
-                        logger.debug("Skipping invalid JSON: %s", e)
-                # total_lines not computed in byte-offset mode — callers using
-                # byte_offset rely on end_byte_offset for cursors, not total_lines.
-                total_lines = 0
-            else:
-                # Standard path: scan from beginning
-                for i, line in enumerate(f):
-                    total_lines = i + 1
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if i < start_line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        entry_id = entry.get("id")
-                        if entry_id:
-                            if track_lines:
-                                entry["_line"] = i
-                            entries[entry_id] = entry
-                    except json.JSONDecodeError as e:
-                        logger.debug("Skipping invalid JSON at line %d: %s", i + 1, e)
-
-            end_offset = f.seek(0, 2)  # Seek to end to get byte offset
-
+        with open(events_path, "rb") as f:
+            # mmap cannot map an empty file
+            size = f.seek(0, 2)
+            if size == 0:
+                return entries, 0, 0
+            orjson = get_orjson(size)
+            loads = orjson.loads if orjson is not None else json.loads
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_mapped(
+                    mm, entries, start_line, track_lines, byte_offset, count_lines,
+                    line_map, loads,
+                )
     except OSError:
-        pass
+        return entries, 0, 0
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+# Lines written by our own serializers start with the entry id, as
+# ``{"id": "`` (stdlib json) or ``{"id":"`` (orjson); for those the id is
+# read straight from the bytes and decoding is deferred.
+_ID_KEY = b'{"id":'
+_ID_KEY_LEN = len(_ID_KEY)
+
+
+def _scan_mapped(
+    mm: mmap.mmap,
+    entries: Dict[str, dict],
+    start_line: int,
+    track_lines: bool,
+    byte_offset: int,
+    count_lines: bool,
+    line_map: Optional[Dict[str, int]],
+    loads,
+) -> Tuple[Dict[str, dict], int, int]:
+    """Latest-wins scan over a mapped events.jsonl (see load_events_latest_wins).
+
+    Superseded lines are never JSON-decoded: lines starting with
+    ``{"id": "`` are indexed by the raw id bytes and only the latest line
+    per id is decoded at the end.  Any surprise (invalid JSON in a winning
+    line, an id that does not round-trip) re-runs the scan decoding every
+    line up front.
+    """
+    end_offset = len(mm)
+    ends_with_newline = mm[end_offset - 1] == 0x0A
+
+    latest, total_lines = _index_latest(mm, start_line, byte_offset, loads, defer=True)
+    if not _decode_latest(mm, latest, entries, loads):
+        entries.clear()
+        latest, total_lines = _index_latest(mm, start_line, byte_offset, loads, defer=False)
+        _decode_latest(mm, latest, entries, loads)
+
+    # Line indices are only meaningful when scanning from the start of the file
+    if byte_offset <= 0 and (track_lines or line_map is not None):
+        for entry_id, entry in entries.items():
+            i = latest[entry_id][0]
+            if track_lines:
+                entry["_line"] = i
+            if line_map is not None:
+                line_map[entry_id] = i
+
+    if byte_offset > 0:
+        # total_lines only on request in byte-offset mode — callers using
+        # byte_offset rely on end_byte_offset for cursors, not total_lines.
+        total_lines = 0
+        if count_lines:
+            total_lines = sum(
+                mm[i:i + _COUNT_CHUNK_BYTES].count(b"\n")
+                for i in range(0, end_offset, _COUNT_CHUNK_BYTES)
+            ) + (0 if ends_with_newline else 1)
 
     return entries, total_lines, end_offset
+
+
+def _index_latest(
+    mm: mmap.mmap, start_line: int, byte_offset: int, loads, defer: bool,
+) -> Tuple[dict, int]:
+    """Map each entry id to its latest line; also return the lines walked.
+
+    Values are ``(line_index, start, end, entry)``: *entry* is the decoded
+    dict, or None when decoding was deferred and the line lives at
+    ``mm[start:end]``.
+    """
+    latest: dict = {}
+    end_offset = len(mm)
+    pos = byte_offset if byte_offset > 0 else 0
+    first = 0 if byte_offset > 0 else start_line
+    i = 0
+    while pos < end_offset:
+        nl = mm.find(b"\n", pos)
+        if nl == -1:
+            nl = end_offset
+        if i >= first:
+            id_start = _id_start(mm, pos, nl) if defer else -1
+            if id_start != -1:
+                id_end = mm.find(b'"', id_start, nl)
+                if id_end != -1 and mm.find(b"\\", id_start, id_end) == -1:
+                    if id_end > id_start:
+                        raw_id = mm[id_start:id_end]
+                        latest[raw_id.decode("utf-8", "surrogateescape")] = (i, pos, nl, None)
+                    pos = nl + 1
+                    i += 1
+                    continue
+            line = mm[pos:nl]
+            if line.strip():
+                try:
+                    entry = loads(line)
+                    entry_id = entry.get("id")
+                    if entry_id:
+                        latest[entry_id] = (i, pos, nl, entry)
+                except ValueError as e:
+                    logger.debug("Skipping invalid JSON at line %d: %s", i + 1, e)
+        pos = nl + 1
+        i += 1
+    return latest, i
+
+
+def _id_start(mm: mmap.mmap, pos: int, nl: int) -> int:
+    """Offset of the id value in a line starting with ``{"id":``, else -1."""
+    if mm.find(_ID_KEY, pos, pos + _ID_KEY_LEN) != pos:
+        return -1
+    q = pos + _ID_KEY_LEN
+    if q < nl and mm[q] == 0x20:
+        q += 1
+    if q < nl and mm[q] == 0x22:
+        return q + 1
+    return -1
+
+
+def _decode_latest(
+    mm: mmap.mmap, latest: dict, entries: Dict[str, dict], loads,
+) -> bool:
+    """Fill *entries* from *latest*; False if a deferred line did not decode cleanly."""
+    for entry_id, (_i, start, end, entry) in latest.items():
+        if entry is None:
+            try:
+                entry = loads(mm[start:end])
+            except ValueError:
+                return False
+            if not isinstance(entry, dict) or entry.get("id") != entry_id:
+                return False
+        entries[entry_id] = entry
+    return True
+
+
+def serialize_entry(entry: dict) -> bytes:
+    """
+    Serialize one entry as a UTF-8 JSON line (without the newline).
+
+    Always stdlib ``json`` with ``ensure_ascii=False``, never orjson:
+    events.jsonl is shared through git, so the bytes written for an entry
+    must not depend on which optional packages a teammate has installed.
+
+    Raises:
+        TypeError / ValueError: the entry is not JSON-serializable.
+    """
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+
+def append_events(events_path: Path, entries: List[dict]) -> int:
+    """
+    Append entries to events.jsonl as JSON lines in a single write.
+
+    Every entry is serialized before the file is opened, so an entry that
+    cannot be serialized leaves events.jsonl untouched.  The payload goes
+    through an ``O_APPEND`` descriptor: the kernel positions each write at
+    end-of-file, so readers holding a byte-offset cursor only ever see
+    whole appended lines after their cursor.
+
+    Args:
+        events_path: Path to events.jsonl (created if missing).
+        entries: Entry dicts to append, in order.
+
+    Returns:
+        Number of bytes written.
+
+    Raises:
+        TypeError / ValueError: an entry is not JSON-serializable.
+        OSError: the file cannot be opened or written.
+    """
+    if not entries:
+        return 0
+
+    return append_lines(events_path, [serialize_entry(entry) for entry in entries])
+
+
+def append_lines(events_path: Path, lines: List[bytes]) -> int:
+    """
+    Append already-serialized JSON lines in a single ``O_APPEND`` write.
+
+    For callers that serialize entries themselves (e.g. to skip the ones
+    that fail) but want the same one-write append as append_events().
+
+    Args:
+        events_path: Path to events.jsonl (created if missing).
+        lines: UTF-8 JSON documents without trailing newlines, in order
+               (see serialize_entry).
+
+    Returns:
+        Number of bytes written.
+
+    Raises:
+        OSError: the file cannot be opened or written.
+    """
+    if not lines:
+        return 0
+
+    payload = b"\n".join(lines) + b"\n"
+
+    fd = os.open(events_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    return len(payload)
@@ -0,0 +1,92 @@
+"""
+EF Memory — Shared hook I/O
+
+The Claude Code hooks in .memory/hooks/ each read one JSON payload from
+stdin with the same size guard and answer with one JSON object on stdout.
+That I/O lives here so every hook script stays a thin entry point over
+the lib modules.  ``orjson`` is used when installed and worth its import:
+it parses and serializes bytes directly, but importing it costs ~7 ms
+(it pulls in datetime, uuid and zoneinfo), more than stdlib json needs
+for a typical few-KB hook payload.
+"""
+
+import json
+import sys
+from typing import IO, Optional, Tuple
+
+from .events_io import get_orjson
+
+MAX_STDIN_SIZE = 10 * 1024 * 1024  # 10 MB
+
+# stop_hook_active=true as serialized by Claude Code (with and without a
+# space).  Inside a JSON string the quotes would be escaped, so a match can
+# only be the real key; other spellings fall through to the parsed check.
+STOP_HOOK_ACTIVE_MARKERS = (
+    b'"stop_hook_active": true',
+    b'"stop_hook_active":true',
+)
+
+
+def read_hook_input(
+    stream: Optional[IO] = None,
+    max_size: int = MAX_STDIN_SIZE,
+    skip_markers: Tuple[bytes, ...] = (),
+) -> Optional[dict]:
+    """
+    Read and parse a hook's JSON payload.
+
+    Args:
+        stream: Input stream (defaults to ``sys.stdin``, resolved per call;
+                its binary buffer is read when available).
+        max_size: Payloads larger than this are not parsed.
+        skip_markers: Raw byte sequences that make the hook a no-op.  They
+                      are searched for in the undecoded payload, so the
+                      common exit paths never pay for JSON parsing.
+
+    Returns:
+        The payload dict, or None when it exceeds ``max_size`` or contains
+        one of ``skip_markers`` (hooks exit silently in both cases).
+
+    Raises:
+        ValueError: The payload is not a JSON object.
+        OSError: The stream cannot be read.
+    """
+    if stream is None:
+        stream = sys.stdin
+    stream = getattr(stream, "buffer", stream)
+    raw_input = stream.read(max_size + 1)
+    if len(raw_input) > max_size:
+        return None
+    if isinstance(raw_input, str):
+        raw_input = raw_input.encode("utf-8")
+    if any(marker in raw_input for marker in skip_markers):
+        return None
+    orjson = get_orjson(len(raw_input))
+    if orjson is not None:
+        input_data = orjson.loads(raw_input)
+    else:
+        input_data = json.loads(raw_input)
+    if not isinstance(input_data, dict):
+        raise ValueError("hook input is not a JSON object")
+    return input_data
+
+
+def write_hook_output(result: dict, stream: Optional[IO] = None) -> None:
+    """
+    Write a hook's JSON response as a single line.
+
+    Args:
+        result: JSON-serializable response (``additionalContext``,
+                ``decision``, ...).
+        stream: Output stream (defaults to ``sys.stdout``, resolved per call).
+    """
+    if stream is None:
+        stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    orjson = get_orjson(0)  # only if already loaded: responses are small
+    if orjson is not None and buffer is not None:
+        stream.flush()
+        buffer.write(orjson.dumps(result) + b"\n")
+        buffer.flush()
+    else:
+        stream.write(json.dumps(result) + "\n")
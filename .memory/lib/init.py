@@ -16,6 +16,7 @@ Use force=True to overwrite existing EF Memory sections.
 No external dependencies — pure Python stdlib.
 """
 
+import compileall
 import json
 import logging
 import os
@@ -391,13 +392,16 @@ def scan_project(project_root: Path) -> List[str]:
             missing.append(".memory/working/")
         if ".memory/vectors.db" not in content and "vectors.db" not in content:
             missing.append(".memory/vectors.db")
+        if ".memory/cache/" not in content:
+            missing.append(".memory/cache/")
         if missing:
             suggestions.append(
                 f"Consider adding to .gitignore: {', '.join(missing)}"
             )
     else:
         suggestions.append(
-            "No .gitignore found — consider creating one with .memory/working/ and .memory/vectors.db"
+            "No .gitignore found — consider creating one with .memory/working/, "
+            ".memory/vectors.db and .memory/cache/"
         )
 
     return suggestions
@@ -479,6 +483,22 @@ def _stamp_efm_version(config_path: Path) -> None:
         logger.warning("Could not stamp efm_version: %s", exc)
 
 
+def _precompile_lib(memory_dir: Path) -> None:
+    """Byte-compile .memory/lib so the first hook run skips compilation.
+
+    Hooks start a fresh interpreter on every Claude Code event; with the
+    .pyc files already in __pycache__ even the first invocation after an
+    install or upgrade only unmarshals code objects.
+    """
+    lib_dir = memory_dir / "lib"
+    if not lib_dir.is_dir():
+        return
+    try:
+        compileall.compile_dir(str(lib_dir), maxlevels=0, quiet=2)
+    except OSError as exc:
+        logger.warning("Could not precompile %s: %s", lib_dir, exc)
+
+
 # ---------------------------------------------------------------------------
 # Main init orchestrator
 # ---------------------------------------------------------------------------
@@ -537,9 +557,10 @@ def run_init(
     # --- 5. Project scan (advisory) ---
     report.suggestions = scan_project(project_root)
 
-    # Stamp version
+    # Stamp version and warm the bytecode cache
     if not dry_run:
         _stamp_efm_version(project_root / ".memory" / "config.json")
+        _precompile_lib(project_root / ".memory")
 
     report.duration_ms = (time.monotonic() - start_time) * 1000
     return report
@@ -734,9 +755,10 @@ def run_upgrade(
     # 6. Project scan (advisory)
     report.suggestions = scan_project(project_root)
 
-    # Stamp version
+    # Stamp version and warm the bytecode cache
     if not dry_run:
         _stamp_efm_version(project_root / ".memory" / "config.json")
+        _precompile_lib(project_root / ".memory")
 
     report.duration_ms = (time.monotonic() - start_time) * 1000
     return report
@@ -8,16 +8,97 @@ Usage:
     from llm_provider import create_llm_provider
     llm = create_llm_provider(config["reasoning"])
     # Returns None if no provider is available (graceful degradation)
+
+Providers are memoized per process, so repeated factory calls with the
+same provider/model/key reuse one SDK client and its connections.
 """
 
+import hashlib
+import json
 import os
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger("efm.llm_provider")
 
+# Environment variables each provider falls back to when no api_key_env is set
+_DEFAULT_KEY_ENV_VARS = {
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "openai": ("OPENAI_API_KEY",),
+    "gemini": ("GOOGLE_API_KEY", "GEMINI_API_KEY"),
+}
+
+
+def _snapshot_env() -> Dict[str, Optional[str]]:
+    """Read the well-known provider key variables from os.environ."""
+    return {
+        var: os.environ.get(var)
+        for env_vars in _DEFAULT_KEY_ENV_VARS.values()
+        for var in env_vars
+    }
+
+
+# Well-known provider key variables, read once at import.
+# Call invalidate_env_cache() after changing them in-process.
+_ENV_SNAPSHOT: Dict[str, Optional[str]] = _snapshot_env()
+
+
+def invalidate_env_cache() -> None:
+    """Re-read the provider API key variables from the environment."""
+    _ENV_SNAPSHOT.clear()
+    _ENV_SNAPSHOT.update(_snapshot_env())
+
+
+# Lazily created httpx.Client shared by the Anthropic and OpenAI SDK clients
+_SHARED_HTTP_CLIENT = None
+
+# The SDKs use the injected client's timeout when none is passed, so match
+# their own default (600 s read, 5 s connect): long non-streaming
+# completions must not start timing out because the pool is shared
+_HTTP_TIMEOUT_SECONDS = 600.0
+_HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+def _shared_http_client():
+    """Return the process-wide ``httpx.Client``, or None if httpx is missing.
+
+    Both the anthropic and openai SDKs accept an injected ``http_client``.
+    Sharing one pool keeps TLS connections alive across providers and
+    factory calls.  HTTP/2 is enabled when the optional ``h2`` package is
+    installed.
+    """
+    global _SHARED_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is None:
+        try:
+            import httpx
+        except ImportError:
+            return None
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        _SHARED_HTTP_CLIENT = httpx.Client(
+            http2=http2,
+            timeout=httpx.Timeout(_HTTP_TIMEOUT_SECONDS, connect=_HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _SHARED_HTTP_CLIENT
+
+
+# ollama.Client per host; each client keeps its own keep-alive connection pool
+_OLLAMA_CLIENTS: Dict[str, Any] = {}
+
+
+def _ollama_client(ollama_sdk, host: str):
+    """Return the shared ``ollama.Client`` for *host*, creating it on first use."""
+    client = _OLLAMA_CLIENTS.get(host)
+    if client is None:
+        client = _OLLAMA_CLIENTS[host] = ollama_sdk.Client(host=host)
+    return client
+
 
 # ---------------------------------------------------------------------------
 # Data types
@@ -104,14 +185,18 @@ class AnthropicProvider(LLMProvider):
                 "Install with: pip install anthropic"
             )
 
-        resolved_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        resolved_key = api_key or _ENV_SNAPSHOT.get("ANTHROPIC_API_KEY")
         if not resolved_key:
             raise ValueError(
                 "Anthropic API key not found. Set ANTHROPIC_API_KEY "
                 "environment variable, or pass api_key directly."
             )
 
-        self._client = Anthropic(api_key=resolved_key)
+        client_kwargs = {"api_key": resolved_key}
+        http_client = _shared_http_client()
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self._client = Anthropic(**client_kwargs)
         self._model = model
 
     @property
@@ -172,14 +257,18 @@ class OpenAIProvider(LLMProvider):
                 "Install with: pip install openai"
             )
 
-        resolved_key = api_key or os.environ.get("OPENAI_API_KEY")
+        resolved_key = api_key or _ENV_SNAPSHOT.get("OPENAI_API_KEY")
         if not resolved_key:
             raise ValueError(
                 "OpenAI API key not found. Set OPENAI_API_KEY "
                 "environment variable, or pass api_key directly."
             )
 
-        self._client = OpenAI(api_key=resolved_key)
+        client_kwargs = {"api_key": resolved_key}
+        http_client = _shared_http_client()
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self._client = OpenAI(**client_kwargs)
         self._model = model
 
     @property
@@ -245,7 +334,11 @@ class GeminiLLMProvider(LLMProvider):
                 "Install with: pip install google-genai"
             )
 
-        resolved_key = api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+        resolved_key = (
+            api_key
+            or _ENV_SNAPSHOT.get("GOOGLE_API_KEY")
+            or _ENV_SNAPSHOT.get("GEMINI_API_KEY")
+        )
         if not resolved_key:
             raise ValueError(
                 "Gemini API key not found. Set GOOGLE_API_KEY or GEMINI_API_KEY "
@@ -304,12 +397,18 @@ class OllamaLLMProvider(LLMProvider):
     - llama3.1 (default)
     - mistral
     - qwen2.5
+
+    Every request pins ``num_ctx`` and ``keep_alive``: Ollama reloads the
+    model whenever the context size changes between requests, and unloads
+    it after its default 5 minute idle timeout.
     """
 
     def __init__(
         self,
         model: str = "llama3.1",
         host: str = "http://localhost:11434",
+        num_ctx: int = 8192,
+        keep_alive: str = "30m",
     ):
         try:
             import ollama as ollama_sdk
@@ -319,8 +418,10 @@ class OllamaLLMProvider(LLMProvider):
                 "Install with: pip install ollama"
             )
 
-        self._client = ollama_sdk.Client(host=host)
+        self._client = _ollama_client(ollama_sdk, host)
         self._model = model
+        self._num_ctx = num_ctx
+        self._keep_alive = keep_alive
 
     @property
     def provider_id(self) -> str:
@@ -342,7 +443,8 @@ class OllamaLLMProvider(LLMProvider):
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            options={"num_predict": max_tokens},
+            options={"num_predict": max_tokens, "num_ctx": self._num_ctx},
+            keep_alive=self._keep_alive,
         )
         text = ""
         if isinstance(response, dict):
@@ -382,16 +484,64 @@ _PROVIDER_CONSTRUCTORS = {
     "ollama": lambda cfg: OllamaLLMProvider(
         model=cfg.get("model", "llama3.1"),
         host=cfg.get("host", "http://localhost:11434"),
+        num_ctx=cfg.get("num_ctx", 8192),
+        keep_alive=cfg.get("keep_alive", "30m"),
     ),
 }
 
 
+# Initialized providers: (provider_id, provider settings, key_fingerprint) -> provider
+_PROVIDER_CACHE: Dict[Tuple[str, str, str], LLMProvider] = {}
+
+# Providers that failed with a missing SDK or a config error, same keys.
+# Neither changes within a process for a given key (a new API key is a new
+# key), so later calls skip straight to the next provider in the chain.
+_PROVIDER_FAILURES: Dict[Tuple[str, str, str], str] = {}
+
+
 def _resolve_api_key(provider_config: dict) -> Optional[str]:
-    """Resolve API key from provider config or environment."""
+    """Resolve API key from provider config or environment.
+
+    Well-known provider variables come from the import-time snapshot;
+    any other ``api_key_env`` name is looked up live.
+    """
     env_var = provider_config.get("api_key_env")
-    if env_var:
-        return os.environ.get(env_var)
-    return None
+    if not env_var:
+        return None
+    if env_var in _ENV_SNAPSHOT:
+        return _ENV_SNAPSHOT[env_var]
+    return os.environ.get(env_var)
+
+
+def _provider_cache_key(
+    provider_id: str, provider_config: dict,
+) -> Tuple[str, str, str]:
+    """Cache key for a provider instance.
+
+    The whole provider config is part of the key (as sorted JSON), so any
+    setting a constructor reads (model, host, num_ctx, keep_alive, ...)
+    builds a fresh instance when it changes.  The effective API key is
+    included only as a short BLAKE2b fingerprint, so a rotated key builds a
+    fresh client and the raw key is never stored.
+    """
+    api_key = _resolve_api_key(provider_config)
+    if not api_key:
+        for env_var in _DEFAULT_KEY_ENV_VARS.get(provider_id, ()):
+            api_key = _ENV_SNAPSHOT.get(env_var)
+            if api_key:
+                break
+    fingerprint = (
+        hashlib.blake2b(api_key.encode("utf-8"), digest_size=8).hexdigest()
+        if api_key else ""
+    )
+    settings = json.dumps(provider_config, sort_keys=True, default=str)
+    return (provider_id, settings, fingerprint)
+
+
+def clear_llm_provider_cache() -> None:
+    """Drop all memoized providers (e.g. after changing credentials)."""
+    _PROVIDER_CACHE.clear()
+    _PROVIDER_FAILURES.clear()
 
 
 def create_llm_provider(reasoning_config: dict) -> Optional[LLMProvider]:
@@ -400,6 +550,9 @@ def create_llm_provider(reasoning_config: dict) -> Optional[LLMProvider]:
 
     Tries the primary provider first, then walks the fallback chain.
     Returns None if no provider is available (graceful degradation).
+    Successfully initialized providers are memoized, so later calls with
+    the same provider config and API key return the same instance;
+    a missing SDK or config error is remembered the same way and not retried.
 
     Args:
         reasoning_config: The "reasoning" section of .memory/config.json
@@ -425,17 +578,28 @@ def create_llm_provider(reasoning_config: dict) -> Optional[LLMProvider]:
             continue
 
         provider_cfg = providers_config.get(provider_id, {})
+        cache_key = _provider_cache_key(provider_id, provider_cfg)
+        cached = _PROVIDER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        if cache_key in _PROVIDER_FAILURES:
+            logger.debug(f"Skipping LLM provider '{provider_id}': {_PROVIDER_FAILURES[cache_key]}")
+            continue
+
         try:
             provider = constructor(provider_cfg)
             logger.info(
                 f"LLM provider initialized: {provider.provider_id} "
                 f"({provider.model_name})"
             )
+            _PROVIDER_CACHE[cache_key] = provider
             return provider
         except ImportError as e:
             logger.warning(f"LLM provider '{provider_id}' SDK not installed: {e}")
+            _PROVIDER_FAILURES[cache_key] = f"SDK not installed: {e}"
         except ValueError as e:
             logger.warning(f"LLM provider '{provider_id}' config error: {e}")
+            _PROVIDER_FAILURES[cache_key] = f"config error: {e}"
         except Exception as e:
             logger.warning(f"LLM provider '{provider_id}' init failed: {e}")
 
@@ -0,0 +1,188 @@
+"""
+EF Memory V2 — LLM Response Cache (M6)
+
+Reasoning prompts are pure functions of the entries they cover (see
+prompts.py), so re-running an analysis over an unchanged memory sends
+byte-identical prompts.  CachedLLMProvider answers those repeats from
+.memory/cache/prompts.jsonl instead of calling the provider again.
+
+Keys are exact: a SHA-1 over provider, model, max_tokens and both
+prompts.  Any change to the entries, the template text or the model is a
+miss — a cached response is never re-mapped onto a different entry set,
+since reasoning output must stay grounded in the entries it was given.
+
+No external dependencies — pure Python stdlib.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .events_io import append_events
+from .llm_provider import LLMProvider, LLMResponse
+
+logger = logging.getLogger("efm.prompt_cache")
+
+CACHE_FILE = "prompts.jsonl"
+_DEFAULT_MAX_ENTRIES = 256
+
+
+def prompt_cache_key(
+    provider_id: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+) -> str:
+    """Stable cache key for one completion request."""
+    h = hashlib.sha1()
+    for part in (provider_id, model, str(max_tokens), system_prompt, user_prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class CachedLLMProvider(LLMProvider):
+    """
+    LLMProvider wrapper that serves repeated prompts from a JSONL cache.
+
+    The cache file holds one ``{"key", "text", "model", "provider"}``
+    record per line and is appended to on every miss.  Only the newest
+    ``max_entries`` records are kept; the file is rewritten when it grows
+    past twice that.
+
+    build_reasoning_report() calls complete() from several threads at
+    once, so the counters and the in-memory records are updated under a
+    lock (the provider call itself runs outside it).
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache_dir: Path,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ):
+        self._provider = provider
+        self._cache_path = cache_dir / CACHE_FILE
+        self._max_entries = max_entries
+        self._records: Dict[str, dict] = self._load()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def provider_id(self) -> str:
+        return self._provider.provider_id
+
+    @property
+    def model_name(self) -> str:
+        return self._provider.model_name
+
+    def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+    ) -> LLMResponse:
+        key = prompt_cache_key(
+            self.provider_id, self.model_name,
+            system_prompt, user_prompt, max_tokens,
+        )
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if record is not None:
+            return LLMResponse(
+                text=record["text"],
+                model=record.get("model", self.model_name),
+                provider=record.get("provider", self.provider_id),
+            )
+
+        response = self._provider.complete(system_prompt, user_prompt, max_tokens)
+        if response.text:
+            self._store(key, response)
+        return response
+
+    # --- persistence ---
+
+    def _load(self) -> Dict[str, dict]:
+        """Read cached records (latest wins), compacting an oversized file."""
+        records: Dict[str, dict] = {}
+        if not self._cache_path.exists():
+            return records
+        lines = 0
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict) and record.get("key") and "text" in record:
+                        records.pop(record["key"], None)
+                        records[record["key"]] = record
+        except OSError as exc:
+            logger.warning("Could not read prompt cache %s: %s", self._cache_path, exc)
+            return {}
+
+        if len(records) > self._max_entries:
+            keep = list(records)[-self._max_entries:]
+            records = {k: records[k] for k in keep}
+        if lines > 2 * self._max_entries:
+            self._rewrite(list(records.values()))
+        return records
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        record = {
+            "key": key,
+            "text": response.text,
+            "model": response.model,
+            "provider": response.provider,
+        }
+        with self._lock:
+            self._records[key] = record
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            append_events(self._cache_path, [record])
+        except OSError as exc:
+            logger.warning("Could not write prompt cache %s: %s", self._cache_path, exc)
+
+    def _rewrite(self, records: List[dict]) -> None:
+        """Atomically replace the cache file with *records*."""
+        tmp_path = self._cache_path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self._cache_path)
+        except OSError as exc:
+            logger.warning("Could not compact prompt cache %s: %s", self._cache_path, exc)
+
+
+def with_response_cache(
+    provider: Optional[LLMProvider],
+    reasoning_config: dict,
+    cache_dir: Optional[Path],
+) -> Optional[LLMProvider]:
+    """Wrap *provider* in a CachedLLMProvider when the config enables it.
+
+    Opt-in (``response_cache``, default off): the cache stores raw LLM
+    output, which may quote project content, under ``.memory/cache/``.
+    """
+    if provider is None or cache_dir is None:
+        return provider
+    if not reasoning_config.get("response_cache", False):
+        return provider
+    return CachedLLMProvider(
+        provider,
+        cache_dir,
+        max_entries=reasoning_config.get("response_cache_max_entries", _DEFAULT_MAX_ENTRIES),
+    )
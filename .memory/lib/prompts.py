@@ -37,8 +37,9 @@ def _entries_to_compact_text(entries: list, max_chars: int) -> str:
     """
     Serialize a list of entry dicts to compact text for LLM prompts.
 
-    Each entry is formatted as a brief summary. Entries are added
-    until max_chars is reached.
+    Each entry is formatted as a brief summary, separated by a blank line.
+    Entries are added until max_chars is reached.  Fragments go straight
+    into one list that is joined once, so no per-entry string is rebuilt.
     """
     parts = []
     current_len = 0
@@ -52,25 +53,102 @@ def _entries_to_compact_text(entries: list, max_chars: int) -> str:
         tags = entry.get("tags", [])
         sources = entry.get("source", [])
 
-        line = (
-            f"[{eid}] ({etype}/{classification}/{severity}) "
-            f"{title}"
-        )
+        pieces = [f"[{eid}] ({etype}/{classification}/{severity}) {title}"]
         if rule:
-            line += f"\n  Rule: {rule}"
+            pieces.append(f"\n  Rule: {rule}")
         if tags:
-            line += f"\n  Tags: {', '.join(tags)}"
+            pieces.append(f"\n  Tags: {', '.join(tags)}")
         if sources:
-            line += f"\n  Sources: {', '.join(sources[:3])}"
-        line += "\n"
+            pieces.append(f"\n  Sources: {', '.join(sources[:3])}")
+        pieces.append("\n")
+        entry_len = sum(len(piece) for piece in pieces)
 
-        if current_len + len(line) > max_chars:
+        if parts:
+            parts.append("\n")
+        if current_len + entry_len > max_chars:
             parts.append("... (entries truncated due to token budget)\n")
             break
-        parts.append(line)
-        current_len += len(line)
+        parts.extend(pieces)
+        current_len += entry_len
 
-    return "\n".join(parts)
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# System prompts
+#
+# Module-level constants, so every call sends a byte-identical system
+# prompt: provider-side prefix caching (e.g. OpenAI automatic prompt
+# caching) only hits when the leading text is unchanged.
+# Edit these deliberately — any change invalidates cached prefixes.
+# ---------------------------------------------------------------------------
+
+_SYSTEM_CORRELATION = (
+    "You are an expert analyst for a project memory system. "
+    "Your task is to analyze memory entries and identify meaningful "
+    "relationships beyond simple tag overlap. "
+    "Look for: causal chains, shared root causes, complementary rules, "
+    "and temporal patterns.\n\n"
+    "Return ONLY valid JSON with this structure:\n"
+    '{"groups": [\n'
+    '  {"entry_ids": ["id1", "id2"], '
+    '"relationship": "description", '
+    '"strength": 0.8}\n'
+    "]}"
+)
+
+_SYSTEM_CONTRADICTION = (
+    "You are an expert analyst for a project memory system. "
+    "Your task is to determine if candidate entry pairs actually "
+    "contradict each other. A contradiction means two rules or "
+    "lessons give conflicting guidance for the same situation.\n\n"
+    "Return ONLY valid JSON with this structure:\n"
+    '{"contradictions": [\n'
+    '  {"entry_id_a": "id1", "entry_id_b": "id2", '
+    '"type": "rule_conflict", '
+    '"explanation": "why they conflict", '
+    '"confidence": 0.9}\n'
+    "]}"
+)
+
+_SYSTEM_SYNTHESIS = (
+    "You are an expert analyst for a project memory system. "
+    "Your task is to synthesize a group of related memory entries "
+    "into a single consolidated principle or guideline.\n\n"
+    "Return ONLY valid JSON with this structure:\n"
+    '{"syntheses": [\n'
+    '  {"source_entry_ids": ["id1", "id2", "id3"], '
+    '"proposed_title": "short title", '
+    '"proposed_principle": "the consolidated rule/principle", '
+    '"rationale": "why these entries form a coherent principle"}\n'
+    "]}"
+)
+
+_SYSTEM_RISK = (
+    "You are an expert analyst for a project memory system. "
+    "Your task is to assess risks based on the user's current "
+    "context and retrieved memory entries.\n\n"
+    "Return ONLY valid JSON with this structure:\n"
+    '{"annotations": [\n'
+    '  {"entry_id": "id1", '
+    '"risk_level": "high", '
+    '"annotation": "explanation of the risk", '
+    '"related_entry_ids": ["id2"]}\n'
+    "]}"
+)
+
+_SYSTEM_SINGLE_ENTRY = (
+    "You are an expert analyst for a project memory system. "
+    "Your task is to provide deep analysis of a single memory entry "
+    "in context of related entries.\n\n"
+    "Return ONLY valid JSON with this structure:\n"
+    '{"analysis": {\n'
+    '  "correlations": [{"entry_id": "id", "relationship": "desc"}],\n'
+    '  "contradictions": [{"entry_id": "id", "explanation": "desc"}],\n'
+    '  "risk_level": "low",\n'
+    '  "suggestions": ["suggestion1"]\n'
+    "}}"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -88,19 +166,7 @@ def correlation_prompt(
     Returns:
         (system_prompt, user_prompt)
     """
-    system = (
-        "You are an expert analyst for a project memory system. "
-        "Your task is to analyze memory entries and identify meaningful "
-        "relationships beyond simple tag overlap. "
-        "Look for: causal chains, shared root causes, complementary rules, "
-        "and temporal patterns.\n\n"
-        "Return ONLY valid JSON with this structure:\n"
-        '{"groups": [\n'
-        '  {"entry_ids": ["id1", "id2"], '
-        '"relationship": "description", '
-        '"strength": 0.8}\n'
-        "]}"
-    )
+    system = _SYSTEM_CORRELATION
 
     user = _truncate(
         f"Memory entries:\n{entries_text}\n\n"
@@ -123,19 +189,7 @@ def contradiction_prompt(
     Returns:
         (system_prompt, user_prompt)
     """
-    system = (
-        "You are an expert analyst for a project memory system. "
-        "Your task is to determine if candidate entry pairs actually "
-        "contradict each other. A contradiction means two rules or "
-        "lessons give conflicting guidance for the same situation.\n\n"
-        "Return ONLY valid JSON with this structure:\n"
-        '{"contradictions": [\n'
-        '  {"entry_id_a": "id1", "entry_id_b": "id2", '
-        '"type": "rule_conflict", '
-        '"explanation": "why they conflict", '
-        '"confidence": 0.9}\n'
-        "]}"
-    )
+    system = _SYSTEM_CONTRADICTION
 
     user = _truncate(
         f"Candidate contradiction pairs:\n{candidate_pairs_text}\n\n"
@@ -157,18 +211,7 @@ def synthesis_prompt(
     Returns:
         (system_prompt, user_prompt)
     """
-    system = (
-        "You are an expert analyst for a project memory system. "
-        "Your task is to synthesize a group of related memory entries "
-        "into a single consolidated principle or guideline.\n\n"
-        "Return ONLY valid JSON with this structure:\n"
-        '{"syntheses": [\n'
-        '  {"source_entry_ids": ["id1", "id2", "id3"], '
-        '"proposed_title": "short title", '
-        '"proposed_principle": "the consolidated rule/principle", '
-        '"rationale": "why these entries form a coherent principle"}\n'
-        "]}"
-    )
+    system = _SYSTEM_SYNTHESIS
 
     user = _truncate(
         f"Related entry clusters:\n{cluster_text}\n\n"
@@ -193,18 +236,7 @@ def risk_prompt(
     Returns:
         (system_prompt, user_prompt)
     """
-    system = (
-        "You are an expert analyst for a project memory system. "
-        "Your task is to assess risks based on the user's current "
-        "context and retrieved memory entries.\n\n"
-        "Return ONLY valid JSON with this structure:\n"
-        '{"annotations": [\n'
-        '  {"entry_id": "id1", '
-        '"risk_level": "high", '
-        '"annotation": "explanation of the risk", '
-        '"related_entry_ids": ["id2"]}\n'
-        "]}"
-    )
+    system = _SYSTEM_RISK
 
     user = _truncate(
         f"User query: {query}\n\n"
@@ -229,18 +261,7 @@ def single_entry_prompt(
     Returns:
         (system_prompt, user_prompt)
     """
-    system = (
-        "You are an expert analyst for a project memory system. "
-        "Your task is to provide deep analysis of a single memory entry "
-        "in context of related entries.\n\n"
-        "Return ONLY valid JSON with this structure:\n"
-        '{"analysis": {\n'
-        '  "correlations": [{"entry_id": "id", "relationship": "desc"}],\n'
-        '  "contradictions": [{"entry_id": "id", "explanation": "desc"}],\n'
-        '  "risk_level": "low",\n'
-        '  "suggestions": ["suggestion1"]\n'
-        "}}"
-    )
+    system = _SYSTEM_SINGLE_ENTRY
 
     user = _truncate(
         f"Entry to analyze:\n{entry_text}\n\n"
@@ -17,6 +17,7 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -172,6 +173,7 @@ def _get_reasoning_config(config: dict) -> dict:
         "max_tokens": rc.get("max_tokens", _DEFAULT_MAX_TOKENS),
         "token_budget": rc.get("token_budget", _DEFAULT_TOKEN_BUDGET),
         "contradiction_detection": rc.get("contradiction_detection", True),
+        "parallel_analyses": rc.get("parallel_analyses", True),
     }
 
 
@@ -656,7 +658,8 @@ def assess_risks(
 
     Args:
         query: Original search query.
-        search_results: List of SearchResult-like objects with entry_id.
+        search_results: List of SearchResult-like objects with entry_id,
+                        or plain entry ids.
         entries: {entry_id: entry_dict}
         config: Full config dict.
         llm_provider: Optional LLM provider for enrichment.
@@ -675,7 +678,12 @@ def assess_risks(
 
     # --- Stage 1: Heuristic annotations ---
     for result in search_results:
-        eid = result.entry_id if hasattr(result, "entry_id") else result.get("entry_id", "")
+        if isinstance(result, str):
+            eid = result
+        elif hasattr(result, "entry_id"):
+            eid = result.entry_id
+        else:
+            eid = result.get("entry_id", "")
         entry = entries.get(eid, {})
         if not entry:
             continue
@@ -777,11 +785,15 @@ def build_reasoning_report(
     skip_correlations: bool = False,
     skip_contradictions: bool = False,
     skip_syntheses: bool = False,
+    _preloaded_entries: Optional[Dict[str, dict]] = None,
 ) -> ReasoningReport:
     """
     Build a comprehensive reasoning report.
 
-    Orchestrates all reasoning functions and aggregates results.
+    Orchestrates all reasoning functions and aggregates results.  With an
+    LLM provider, the analyses run on a thread pool so their (network-bound)
+    enrichment calls overlap instead of paying one round-trip after another;
+    ``reasoning.parallel_analyses: false`` runs them one by one.
 
     Args:
         events_path: Path to events.jsonl.
@@ -791,14 +803,16 @@ def build_reasoning_report(
         skip_correlations: Skip correlation analysis.
         skip_contradictions: Skip contradiction detection.
         skip_syntheses: Skip synthesis suggestions.
+        _preloaded_entries: Optional pre-loaded entries dict to avoid
+            re-reading events.jsonl (used by reasoning_cli).
 
     Returns:
         ReasoningReport with all sub-reports.
     """
     t0 = time.monotonic()
 
-    # Load entries
-    entries = _load_entries_latest_wins(events_path)
+    # Load entries (or use preloaded)
+    entries = _preloaded_entries if _preloaded_entries is not None else _load_entries_latest_wins(events_path)
     # Filter deprecated
     active_entries = {
         eid: e for eid, e in entries.items()
@@ -809,25 +823,34 @@ def build_reasoning_report(
     total_llm_calls = 0
     total_tokens = 0
 
-    # Correlation
+    # (report attribute, analysis) for correlation, contradiction, synthesis
+    analyses = []
     if not skip_correlations:
-        corr = find_correlations(active_entries, config, llm_provider)
-        report.correlation_report = corr
-        if corr.mode == "llm_enriched":
-            total_llm_calls += 1
-
-    # Contradiction
+        analyses.append(("correlation_report", find_correlations))
     if not skip_contradictions:
-        contr = detect_contradictions(active_entries, config, llm_provider)
-        report.contradiction_report = contr
-        if contr.mode == "llm_enriched":
-            total_llm_calls += 1
-
-    # Synthesis
+        analyses.append(("contradiction_report", detect_contradictions))
     if not skip_syntheses:
-        synth = suggest_syntheses(active_entries, config, llm_provider)
-        report.synthesis_report = synth
-        if synth.mode == "llm_enriched":
+        analyses.append(("synthesis_report", suggest_syntheses))
+
+    if (
+        llm_provider is not None and len(analyses) > 1
+        and _get_reasoning_config(config)["parallel_analyses"]
+    ):
+        with ThreadPoolExecutor(max_workers=len(analyses)) as pool:
+            futures = [
+                (attr, pool.submit(analyze, active_entries, config, llm_provider))
+                for attr, analyze in analyses
+            ]
+            results = [(attr, future.result()) for attr, future in futures]
+    else:
+        results = [
+            (attr, analyze(active_entries, config, llm_provider))
+            for attr, analyze in analyses
+        ]
+
+    for attr, sub_report in results:
+        setattr(report, attr, sub_report)
+        if sub_report.mode == "llm_enriched":
             total_llm_calls += 1
 
     # Determine overall mode
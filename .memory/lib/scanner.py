@@ -10,15 +10,21 @@ Reuses:
   - auto_verify.validate_schema — schema validation
   - auto_verify.check_duplicates, _load_entries_latest_wins — dedup
   - text_builder.build_dedup_text — similarity input
+  - events_io.serialize_entry, append_lines — canonical single-write append
 
 No external dependencies — pure Python stdlib + internal modules.
 """
 
-import json
+import fnmatch
+import functools
 import logging
 import os
 import re
+import stat
+import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -30,6 +36,8 @@ from .auto_verify import (
     check_duplicates,
     validate_schema,
 )
+from .events_io import append_lines, serialize_entry
+from .text_builder import build_dedup_text
 
 logger = logging.getLogger("efm.scanner")
 
@@ -61,6 +69,14 @@ _DEFAULT_HIGH_VALUE = [
 
 _DEFAULT_MAX_DOCUMENTS = 20
 
+# Threads used to read candidate files; scans smaller than
+# _PARALLEL_MIN_FILES stay on the calling thread
+_DEFAULT_PARALLEL_WORKERS = 8
+_PARALLEL_MIN_FILES = 16
+
+# Result marker for a candidate that could not be read
+_UNREADABLE = object()
+
 # Extension base scores (higher = more likely to contain importable knowledge)
 _EXTENSION_SCORES: Dict[str, float] = {
     ".md": 0.30,
@@ -75,13 +91,19 @@ _EXTENSION_SCORES: Dict[str, float] = {
 _SAMPLE_LINES = 50  # Lines to sample for keyword scoring
 _MAX_FILE_SIZE_BYTES = 5_242_880  # 5 MB default
 _MAX_LINE_COUNT = 100_000
+_READ_CHUNK_BYTES = 64 * 1024  # Binary read size while collecting the sample
+_COUNT_CHUNK_BYTES = 1024 * 1024  # Binary read size for counting the rest
 
 
 # ---------------------------------------------------------------------------
 # Result dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+# __slots__ drop the per-instance __dict__ (one DocumentInfo per candidate
+# file); dataclass(slots=True) needs Python 3.10+, older versions keep dicts.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class DocumentInfo:
     """Information about a discovered document."""
     path: str = ""           # Absolute path
@@ -95,17 +117,17 @@ class DocumentInfo:
     import_count: int = 0    # Existing entries sourcing this file
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanReport:
     """Result of document discovery."""
     documents: List[DocumentInfo] = field(default_factory=list)
     total_scanned: int = 0
-    total_excluded: int = 0
+    total_excluded: int = 0     # Excluded files plus pruned directories
     skipped_oversized: int = 0
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchValidateResult:
     """Result of batch validation and deduplication."""
     valid: List[dict] = field(default_factory=list)
@@ -115,7 +137,7 @@ class BatchValidateResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchWriteResult:
     """Result of batch writing to events.jsonl."""
     written_count: int = 0
@@ -157,55 +179,79 @@ def discover_documents(
     if pattern:
         # User-provided pattern overrides defaults
         file_patterns = [pattern]
-        search_roots = [project_root]
+        search_roots: List[Tuple[Path, Optional[int]]] = [(project_root, None)]
     else:
         supported = import_config.get("supported_sources", ["*.md", "*.py", "*.ts", "*.js", "*.go"])
         doc_roots = import_config.get("doc_roots", ["docs/"])
         # Search each doc_root with each supported extension
         file_patterns = supported
-        search_roots = []
-        for root in doc_roots:
-            root_path = project_root / root
-            if root_path.is_file():
-                # Direct file reference (e.g. "CLAUDE.md")
-                search_roots.append(root_path)
-            elif root_path.is_dir():
-                search_roots.append(root_path)
+        search_roots = _search_roots(project_root, doc_roots)
 
     # Collect all candidate paths
     candidates: Dict[str, Path] = {}  # rel_path -> abs_path
+    sizes: Dict[str, int] = {}        # rel_path -> st_size seen while walking
+
+    # Plain name patterns ("*.md", "**/*.py") are matched in one directory
+    # walk that never descends into excluded directories; patterns with a
+    # path component fall back to Path.glob per pattern.
+    name_patterns, glob_patterns = _split_file_patterns(file_patterns)
+    name_re = _compile_name_patterns(tuple(name_patterns))
+    prune_re = _compile_dir_excludes(tuple(exclude_patterns))
 
-    for search_root in search_roots:
-        if search_root.is_file():
+    for search_root, root_size in search_roots:
+        if root_size is not None:
             # Direct file reference
             rel = str(search_root.relative_to(project_root))
             candidates[rel] = search_root
+            sizes[rel] = root_size
             continue
 
-        for fp in file_patterns:
+        if name_re is not None:
+            rel_root = str(search_root.relative_to(project_root))
+            report.total_excluded += _walk_documents(
+                search_root, "" if rel_root == "." else rel_root,
+                name_re, prune_re, candidates, sizes,
+            )
+
+        for fp in glob_patterns:
             glob_pattern = f"**/{fp}" if not fp.startswith("**/") else fp
             try:
                 for match in search_root.glob(glob_pattern):
-                    if not match.is_file():
+                    # One stat both filters non-files and sizes the match
+                    try:
+                        st = match.stat()
+                    except OSError:
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
                         continue
                     rel = str(match.relative_to(project_root))
                     candidates[rel] = match
+                    sizes[rel] = st.st_size
             except (OSError, ValueError):
                 continue
 
-    # Filter out excluded paths
+    # Filter out excluded paths.  Directory-shaped patterns only depend on
+    # the parent directory, so their verdict is computed once per directory
+    # and shared by sibling files; the rest run once per file.
+    dir_exclude_re = _compile_dir_excludes(tuple(exclude_patterns))
+    file_exclude_re = _compile_file_excludes(tuple(exclude_patterns))
+    dir_verdicts: Dict[str, bool] = {}
     filtered: Dict[str, Path] = {}
     for rel, abs_path in candidates.items():
-        excluded = False
-        for exc in exclude_patterns:
-            # Simple pattern matching: convert glob to a basic check
-            if _matches_exclude(rel, exc):
-                excluded = True
-                break
-        if not excluded:
-            filtered[rel] = abs_path
-        else:
+        posix_rel = _to_posix(rel)
+        parent = posix_rel.rpartition("/")[0]
+        excluded = dir_verdicts.get(parent)
+        if excluded is None:
+            excluded = dir_verdicts[parent] = bool(
+                parent and dir_exclude_re is not None
+                and dir_exclude_re.search(parent + "/")
+            )
+        if not excluded and file_exclude_re is not None:
+            excluded = file_exclude_re.search(posix_rel) is not None
+        if excluded:
             report.total_excluded += 1
+        else:
+            filtered[rel] = abs_path
 
     report.total_scanned = len(filtered)
 
@@ -213,18 +259,35 @@ def discover_documents(
     events_path = project_root / ".memory" / "events.jsonl"
     import_map = check_already_imported(events_path)
 
-    # Score and build DocumentInfo for each file
-    docs: List[DocumentInfo] = []
-    skipped_oversized = 0
-    for rel, abs_path in filtered.items():
+    # Score and build DocumentInfo for each file.  Every file is an
+    # independent open/read/score and file reads release the GIL, so larger
+    # scans overlap them on a thread pool; results keep candidate order.
+    def build(item: Tuple[str, Path]):
+        rel, abs_path = item
         try:
-            info = _build_document_info(abs_path, rel, config, import_map)
-            if info is None:
-                skipped_oversized += 1
-                continue
-            docs.append(info)
+            return _build_document_info(
+                abs_path, rel, config, import_map, size=sizes.get(rel),
+            )
         except (OSError, UnicodeDecodeError):
+            return _UNREADABLE
+
+    items = list(filtered.items())
+    workers = min(scan_config.get("parallel_workers", _DEFAULT_PARALLEL_WORKERS), len(items))
+    if workers > 1 and len(items) >= _PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build, items))
+    else:
+        results = [build(item) for item in items]
+
+    docs: List[DocumentInfo] = []
+    skipped_oversized = 0
+    for info in results:
+        if info is _UNREADABLE:
+            continue
+        if info is None:
+            skipped_oversized += 1
             continue
+        docs.append(info)
 
     # Sort by relevance descending
     docs.sort(key=lambda d: d.relevance_score, reverse=True)
@@ -242,10 +305,14 @@ def _build_document_info(
     rel_path: str,
     config: dict,
     import_map: Dict[str, int],
+    size: Optional[int] = None,
 ) -> Optional[DocumentInfo]:
-    """Build a DocumentInfo for a single file. Returns None if oversized."""
-    stat = abs_path.stat()
-    size = stat.st_size
+    """Build a DocumentInfo for a single file. Returns None if oversized.
+
+    *size* may be passed when the caller already has the file's stat.
+    """
+    if size is None:
+        size = abs_path.stat().st_size
 
     # File size safety check
     max_size = config.get("scan", {}).get("max_file_size_bytes", _MAX_FILE_SIZE_BYTES)
@@ -254,20 +321,10 @@ def _build_document_info(
         return None
 
     # Read content sample
-    content_sample = ""
-    line_count = 0
     try:
-        with open(abs_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = []
-            for i, line in enumerate(f):
-                line_count += 1
-                if i < _SAMPLE_LINES:
-                    lines.append(line)
-                if line_count >= _MAX_LINE_COUNT:
-                    break
-            content_sample = "".join(lines)
+        content_sample, line_count = _read_sample(abs_path)
     except OSError:
-        pass
+        content_sample, line_count = "", 0
 
     # Extract snippet (first heading + first non-empty line)
     snippet = _extract_snippet(content_sample)
@@ -293,66 +350,282 @@ def _build_document_info(
     )
 
 
+def _read_sample(abs_path: Path) -> Tuple[str, int]:
+    """
+    Return the first _SAMPLE_LINES lines of a file and its line count.
+
+    The file is read in binary chunks (64 KiB until the sample is complete,
+    then 1 MiB): lines past the sample are counted with ``bytes.count``
+    and never decoded.  Only the sample is decoded
+    (UTF-8, errors replaced, newlines normalized as in text mode).  The
+    count is capped at _MAX_LINE_COUNT.
+    """
+    sample_parts: List[bytes] = []
+    sample_done = False
+    newlines = 0
+    last_byte = b""
+    with open(abs_path, "rb") as f:
+        while newlines < _MAX_LINE_COUNT:
+            chunk = f.read(_COUNT_CHUNK_BYTES if sample_done else _READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            if not sample_done:
+                pos = -1
+                for _ in range(_SAMPLE_LINES - newlines):
+                    pos = chunk.find(b"\n", pos + 1)
+                    if pos == -1:
+                        break
+                if pos == -1:
+                    sample_parts.append(chunk)
+                else:
+                    sample_parts.append(chunk[:pos + 1])
+                    sample_done = True
+            newlines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+
+    line_count = newlines + (1 if last_byte and last_byte != b"\n" else 0)
+    sample = b"".join(sample_parts).decode("utf-8", errors="replace")
+    if "\r" in sample:
+        sample = sample.replace("\r\n", "\n").replace("\r", "\n")
+    return sample, min(line_count, _MAX_LINE_COUNT)
+
+
 def _extract_snippet(content: str) -> str:
     """Extract first heading and first non-empty content line."""
     heading = ""
     first_line = ""
 
-    for line in content.split("\n"):
-        stripped = line.strip()
+    # Walk line by line with str.find; only the lines inspected are sliced
+    pos = 0
+    end = len(content)
+    while pos <= end:
+        nl = content.find("\n", pos)
+        if nl == -1:
+            nl = end
+        stripped = content[pos:nl].strip()
+        pos = nl + 1
         if not stripped:
             continue
         if not heading and stripped.startswith("#"):
             heading = stripped
-        elif heading and not first_line:
-            first_line = stripped[:120]
-            break
-        elif not heading:
+        else:
             first_line = stripped[:120]
             break
 
-    parts = [p for p in [heading, first_line] if p]
-    return " | ".join(parts) if parts else ""
+    if heading and first_line:
+        return f"{heading} | {first_line}"
+    return heading or first_line
 
 
-def _matches_exclude(rel_path: str, pattern: str) -> bool:
+# Relative paths are matched in '/'-separated form; only platforms with
+# another separator need converting.
+_NEEDS_SEP_NORM = os.sep != "/"
+
+
+def _to_posix(path: str) -> str:
+    """Return *path* with os.sep replaced by '/' (unchanged on POSIX)."""
+    return path.replace(os.sep, "/") if _NEEDS_SEP_NORM else path
+
+
+def _exclude_regex(pattern: str) -> str:
     """
-    Simple check if rel_path matches an exclude pattern.
+    Translate one exclude pattern into a regex over '/'-separated paths.
 
     Supports:
-      - **/dir/** → any path containing /dir/
+      - **/dir/** → any path containing /dir/ (or starting with dir/)
       - **/*.ext → any file ending with .ext
-      - dir/** → path starting with dir/
+      - dir/** → path starting with dir/ (or equal to dir)
+      - anything else → exact match
     """
-    # Normalize separators
-    rel = rel_path.replace(os.sep, "/")
-    pat = pattern.replace(os.sep, "/")
-
-    # **/dir/** → check if /dir/ appears anywhere (or starts with dir/)
+    pat = _to_posix(pattern)
     if pat.startswith("**/") and pat.endswith("/**"):
-        segment = pat[3:-3]  # e.g. "node_modules"
-        return f"/{segment}/" in f"/{rel}" or rel.startswith(f"{segment}/")
+        return f"(?:^|/){re.escape(pat[3:-3])}/"
+    if pat.startswith("**/*.") and "*" not in pat[4:]:
+        return f"{re.escape(pat[4:])}$"
+    if pat.endswith("/**"):
+        return f"^{re.escape(pat[:-3])}(?:/|$)"
+    return f"^{re.escape(pat)}$"
 
-    # **/*.ext → check file extension
-    if pat.startswith("**/") and "*" not in pat[3:]:
-        suffix = pat[3:]  # e.g. "*.md" — but this case is unlikely for excludes
-        if suffix.startswith("*."):
-            ext = suffix[1:]  # ".md"
-            return rel.endswith(ext)
 
-    # dir/** → starts with dir/
-    if pat.endswith("/**"):
-        prefix = pat[:-3]
-        return rel.startswith(prefix + "/") or rel == prefix
+@functools.lru_cache(maxsize=32)
+def _compile_excludes(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """Compile exclude patterns into one alternation; None if there are none."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{_exclude_regex(p)})" for p in patterns))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_dir_excludes(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile the directory-shaped exclude patterns (**/dir/**, dir/**).
+
+    A directory whose path + "/" matches this regex only contains excluded
+    files, so the walk can skip it without listing it.
+    """
+    dir_patterns = tuple(
+        p for p in patterns
+        if _to_posix(p).endswith("/**")
+    )
+    return _compile_excludes(dir_patterns)
+
+
+def _search_roots(
+    project_root: Path, doc_roots: List[str],
+) -> List[Tuple[Path, Optional[int]]]:
+    """
+    Resolve import.doc_roots to the existing files and directories to scan.
+
+    Returns ``(path, size)`` pairs: *size* is the file size for a direct
+    file reference and None for a directory (one stat per root).  Repeated
+    roots and directories nested inside another directory root are
+    dropped, so no part of the tree is walked twice.
+    """
+    roots: Dict[Path, Optional[int]] = {}
+    for root in doc_roots:
+        root_path = project_root / root
+        if root_path in roots:
+            continue
+        try:
+            st = root_path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            # Direct file reference (e.g. "CLAUDE.md")
+            roots[root_path] = st.st_size
+        elif stat.S_ISDIR(st.st_mode):
+            roots[root_path] = None
+    dirs = {r for r, size in roots.items() if size is None}
+    return [
+        (r, size) for r, size in roots.items()
+        if size is not None or not any(parent in dirs for parent in r.parents)
+    ]
+
+
+def _split_file_patterns(patterns: List[str]) -> Tuple[List[str], List[str]]:
+    """Split file patterns into name-only patterns and ones with a path component."""
+    name_patterns: List[str] = []
+    glob_patterns: List[str] = []
+    for p in patterns:
+        name = p[3:] if p.startswith("**/") else p
+        if name and "/" not in name and "**" not in name:
+            name_patterns.append(p)
+        else:
+            glob_patterns.append(p)
+    return name_patterns, glob_patterns
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_file_excludes(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile the exclude patterns that depend on the file itself.
+
+    Complements _compile_dir_excludes(): a path is excluded by the full
+    pattern set iff its parent directory + "/" matches the directory regex
+    or the path matches this one.  ``dir/**`` contributes ``^dir$`` here,
+    since it also matches a file named exactly ``dir``.
+    """
+    parts = []
+    for p in patterns:
+        pat = _to_posix(p)
+        if pat.endswith("/**"):
+            if not pat.startswith("**/"):
+                parts.append(f"^{re.escape(pat[:-3])}$")
+        else:
+            parts.append(f"(?:{_exclude_regex(p)})")
+    if not parts:
+        return None
+    return re.compile("|".join(parts))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_name_patterns(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile file patterns that only constrain the file name into one regex.
+
+    Returns None when there are no patterns or any has a directory
+    component; _split_file_patterns() keeps those for Path.glob instead.
+    """
+    names = []
+    for p in patterns:
+        name = p[3:] if p.startswith("**/") else p
+        if not name or "/" in name or "**" in name:
+            return None
+        names.append(fnmatch.translate(name))
+    if not names:
+        return None
+    return re.compile("|".join(names))
+
+
+def _walk_documents(
+    root: Path,
+    rel_root: str,
+    name_re: "re.Pattern[str]",
+    prune_re: Optional["re.Pattern[str]"],
+    candidates: Dict[str, Path],
+    sizes: Dict[str, int],
+) -> int:
+    """
+    Collect files under *root* whose name matches *name_re*.
+
+    Iterative ``os.scandir`` walk: every directory is listed once for all
+    patterns, symlinked directories are not followed (as with ``Path.glob``)
+    and directories matching *prune_re* are skipped entirely.
 
-    # Exact match fallback
-    return rel == pat
+    Returns:
+        Number of pruned directories.
+    """
+    pruned = 0
+    stack = [(str(root), _to_posix(rel_root))]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        continue
+                    if prune_re is not None and prune_re.search(rel + "/"):
+                        pruned += 1
+                        continue
+                    stack.append((entry.path, rel))
+                elif name_re.match(entry.name) and entry.is_file():
+                    if _NEEDS_SEP_NORM:
+                        rel = rel.replace("/", os.sep)
+                    candidates[rel] = Path(entry.path)
+                    sizes[rel] = entry.stat().st_size
+            except OSError:
+                continue
+    return pruned
+
+
+def _matches_exclude(rel_path: str, pattern: str) -> bool:
+    """Check if rel_path matches a single exclude pattern (see _exclude_regex)."""
+    exclude_re = _compile_excludes((pattern,))
+    return exclude_re.search(_to_posix(rel_path)) is not None
 
 
 # ---------------------------------------------------------------------------
 # Relevance scoring
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
+def _upper_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Upper-cased relevance keywords, cached per keyword set.
+
+    Each keyword is counted with ``str.count`` (a C substring search) over
+    one upper-cased copy of the sample.  A single case-insensitive regex
+    alternation measured ~10x slower on 4 KB samples, and would stop
+    counting overlapping keywords independently.
+    """
+    return tuple(kw.upper() for kw in keywords)
+
+
 def score_relevance(
     file_path: Path,
     content_sample: str,
@@ -384,12 +657,17 @@ def score_relevance(
         # ALL-CAPS filenames (e.g. ARCHITECTURE.md) get a smaller boost
         score += 0.15
 
-    # 3. Keyword density in content sample
+    # 3. Keyword density in content sample.  With scan.score_scan_threshold
+    # set, high-value files already at that score are assumed dense and
+    # the sample is not scanned (off by default: ties those files at the top).
+    scan_threshold = scan_config.get("score_scan_threshold")
+    if scan_threshold is not None and name in high_value and score >= scan_threshold:
+        logger.debug("Skipping keyword scan for high-value file %s", file_path)
+        return min(score + 0.40, 1.0)
+
     if content_sample:
         upper_content = content_sample.upper()
-        keyword_hits = 0
-        for kw in keywords:
-            keyword_hits += upper_content.count(kw.upper())
+        keyword_hits = sum(map(upper_content.count, _upper_keywords(tuple(keywords))))
 
         # Normalize: ~10+ hits → full 0.40 score
         density_score = min(keyword_hits / 10.0, 1.0) * 0.40
@@ -402,6 +680,11 @@ def score_relevance(
 # Already-imported check
 # ---------------------------------------------------------------------------
 
+# Per-path cache for check_already_imported(): path -> (st_mtime_ns, st_size, counts)
+_IMPORTED_CACHE: Dict[str, Tuple[int, int, Dict[str, int]]] = {}
+_IMPORTED_CACHE_MAX = 8
+
+
 def check_already_imported(events_path: Path) -> Dict[str, int]:
     """
     Parse source references in events.jsonl to build a map of
@@ -412,7 +695,32 @@ def check_already_imported(events_path: Path) -> Dict[str, int]:
       - path#Heading:L10-L20 → path
       - path#Heading → path
       - path::function → path
+
+    Memoized on the file's mtime and size (every append changes both), so
+    back-to-back scans parse events.jsonl once.  The returned dict is
+    shared between callers — treat it as read-only.
     """
+    key = str(events_path)
+    try:
+        st = os.stat(events_path)
+    except OSError:
+        _IMPORTED_CACHE.pop(key, None)
+        return {}
+
+    cached = _IMPORTED_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    counts = _count_imported_sources(events_path)
+    _IMPORTED_CACHE.pop(key, None)
+    while len(_IMPORTED_CACHE) >= _IMPORTED_CACHE_MAX:
+        _IMPORTED_CACHE.pop(next(iter(_IMPORTED_CACHE)))
+    _IMPORTED_CACHE[key] = (st.st_mtime_ns, st.st_size, counts)
+    return counts
+
+
+def _count_imported_sources(events_path: Path) -> Dict[str, int]:
+    """Uncached body of check_already_imported()."""
     counts: Dict[str, int] = {}
 
     entries = _load_entries_latest_wins(events_path)
@@ -430,6 +738,13 @@ def check_already_imported(events_path: Path) -> Dict[str, int]:
     return counts
 
 
+# Trailing line range of a source reference (path:L10 or path:L10-L20)
+_LINE_RANGE_RE = re.compile(r":L\d+(?:-L\d+)?$")
+
+# Source references that do not point at a file
+_NON_FILE_SOURCE_PREFIXES = ("commit ", "PR ", "PR#")
+
+
 def _extract_file_from_source(source: str) -> Optional[str]:
     """Extract the file path portion from a normalized source reference."""
     s = source.strip()
@@ -437,19 +752,21 @@ def _extract_file_from_source(source: str) -> Optional[str]:
         return None
 
     # Skip non-file sources (commit, PR)
-    if s.startswith("commit ") or s.startswith("PR ") or s.startswith("PR#"):
+    if s.startswith(_NON_FILE_SOURCE_PREFIXES):
         return None
 
     # path::function → path
-    if "::" in s:
-        return s.split("::")[0]
+    sep = s.find("::")
+    if sep != -1:
+        return s[:sep]
 
     # path#anchor:L10-L20 or path#anchor → path
-    if "#" in s:
-        return s.split("#")[0]
+    sep = s.find("#")
+    if sep != -1:
+        return s[:sep]
 
     # path:L10-L20 → path
-    line_match = re.search(r":L\d+(-L\d+)?$", s)
+    line_match = _LINE_RANGE_RE.search(s)
     if line_match:
         return s[:line_match.start()]
 
@@ -461,6 +778,47 @@ def _extract_file_from_source(source: str) -> Optional[str]:
 # Batch validation and deduplication
 # ---------------------------------------------------------------------------
 
+# Per-path cache for batch_validate(): path -> (st_mtime_ns, st_size,
+# entries, dedup texts, character counts)
+_CORPUS_CACHE: Dict[str, Tuple[int, int, Dict[str, dict], Dict[str, str], Dict[str, Counter]]] = {}
+_CORPUS_CACHE_MAX = 8
+
+
+def _load_dedup_corpus(
+    events_path: Path,
+) -> Tuple[Dict[str, dict], Dict[str, str], Dict[str, Counter]]:
+    """
+    Latest-wins entries of events.jsonl with their dedup texts and the
+    shared character-count cache for check_duplicates().
+
+    Memoized on the file's mtime and size like check_already_imported(),
+    so repeated batch_validate() calls parse an unchanged events.jsonl
+    once.  The entries and texts dicts are copies (batch_validate() adds
+    batch entries to them); the counts cache is keyed by text and shared.
+    """
+    key = str(events_path)
+    try:
+        st = os.stat(events_path)
+    except OSError:
+        _CORPUS_CACHE.pop(key, None)
+        return {}, {}, {}
+
+    cached = _CORPUS_CACHE.get(key)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        entries = _load_entries_latest_wins(events_path)
+        texts = {
+            entry_id: build_dedup_text(entry)
+            for entry_id, entry in entries.items()
+            if not entry.get("deprecated", False)
+        }
+        cached = (st.st_mtime_ns, st.st_size, entries, texts, {})
+        _CORPUS_CACHE.pop(key, None)
+        while len(_CORPUS_CACHE) >= _CORPUS_CACHE_MAX:
+            _CORPUS_CACHE.pop(next(iter(_CORPUS_CACHE)))
+        _CORPUS_CACHE[key] = cached
+    return dict(cached[2]), dict(cached[3]), cached[4]
+
+
 def batch_validate(
     entries: List[dict],
     events_path: Path,
@@ -471,8 +829,7 @@ def batch_validate(
 
     For each entry:
     1. Schema validation via validate_schema()
-    2. Dedup against existing events.jsonl
-    3. Cross-dedup against other entries in the batch
+    2. Dedup against existing events.jsonl and earlier entries in the batch
 
     Returns categorized results: valid, duplicates, invalid.
     """
@@ -481,11 +838,12 @@ def batch_validate(
 
     threshold = config.get("automation", {}).get("dedup_threshold", 0.85)
 
-    # Pre-load existing entries once
-    existing = _load_entries_latest_wins(events_path)
-
-    # Track validated entries for cross-dedup within batch
-    validated_so_far: Dict[str, dict] = {}
+    # Pre-load existing entries once (cached while events.jsonl is
+    # unchanged).  Accepted batch entries are added to the same dict, so one
+    # dedup pass covers both events.jsonl and earlier entries in this batch
+    # (a batch entry shadows a stored one with its id, as it will once
+    # written).
+    prior, dedup_texts, dedup_counts = _load_dedup_corpus(events_path)
 
     for entry in entries:
         entry_id = entry.get("id", "")
@@ -496,30 +854,22 @@ def batch_validate(
             result.invalid.append((entry, validation))
             continue
 
-        # 2. Dedup against existing events.jsonl
+        # 2. Dedup against existing events.jsonl and earlier batch entries
         dedup = check_duplicates(
             entry, events_path,
             threshold=threshold,
-            _preloaded_entries=existing,
+            _preloaded_entries=prior,
+            _dedup_texts=dedup_texts,
+            _dedup_counts=dedup_counts,
         )
         if dedup.is_duplicate:
             result.duplicates.append((entry, dedup))
             continue
 
-        # 3. Cross-dedup against earlier entries in this batch
-        if validated_so_far:
-            cross_dedup = check_duplicates(
-                entry, events_path,
-                threshold=threshold,
-                _preloaded_entries=validated_so_far,
-            )
-            if cross_dedup.is_duplicate:
-                result.duplicates.append((entry, cross_dedup))
-                continue
-
         result.valid.append(entry)
         if entry_id:
-            validated_so_far[entry_id] = entry
+            prior[entry_id] = entry
+            dedup_texts.pop(entry_id, None)
 
     result.duration_ms = (time.monotonic() - start_time) * 1000
     return result
@@ -537,7 +887,8 @@ def batch_write(
     Append a batch of entries to events.jsonl.
 
     Creates events.jsonl if it doesn't exist.
-    Each entry is written as a single JSON line.
+    Each entry is written as a single JSON line; the whole batch goes out
+    in one append.
     """
     result = BatchWriteResult()
 
@@ -547,18 +898,24 @@ def batch_write(
     # Ensure parent directory exists
     events_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Serialize first, skipping entries that cannot be encoded, then
+    # append everything with one write.
+    lines: List[bytes] = []
+    entry_ids: List[str] = []
+    for entry in entries:
+        try:
+            lines.append(serialize_entry(entry))
+        except (TypeError, ValueError) as e:
+            result.errors.append(f"Cannot serialize entry: {e}")
+            continue
+        entry_ids.append(entry.get("id", "unknown"))
+
     try:
-        with open(events_path, "a", encoding="utf-8") as f:
-            for entry in entries:
-                try:
-                    line = json.dumps(entry, ensure_ascii=False)
-                    f.write(line + "\n")
-                    entry_id = entry.get("id", "unknown")
-                    result.entry_ids.append(entry_id)
-                    result.written_count += 1
-                except (TypeError, ValueError) as e:
-                    result.errors.append(f"Cannot serialize entry: {e}")
+        append_lines(events_path, lines)
     except OSError as e:
         result.errors.append(f"Cannot write to {events_path}: {e}")
+        return result
 
+    result.entry_ids = entry_ids
+    result.written_count = len(lines)
     return result
@@ -0,0 +1,125 @@
+"""
+EF Memory — events.jsonl Snapshot Cache
+
+The read-only CLIs (reasoning_cli, ...) load the whole latest-wins entry
+map on every invocation, usually from a file that has not changed since
+the previous run.  load_entries_cached() keeps a snapshot of that map in
+.memory/cache/ and serves it while events.jsonl is unchanged, skipping
+JSON parsing altogether.
+
+Snapshots are written with ``marshal``, which only rebuilds plain data
+(unlike ``pickle``, loading a snapshot can never run code) and decodes
+the entry map roughly twice as fast as JSONL.  Each snapshot records the
+events file's inode, mtime and size; any change is a miss and rewrites
+it.  Small files are always parsed directly — below ``_MIN_SNAPSHOT_BYTES``
+parsing is as fast as reading the snapshot back.
+
+Snapshots are machine-local (the marshal format is tied to the Python
+version): ``.memory/cache/`` belongs in .gitignore, which init suggests.
+
+No external dependencies — pure Python stdlib.
+"""
+
+import gc
+import hashlib
+import logging
+import marshal
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from .events_io import load_events_latest_wins
+
+logger = logging.getLogger("efm.snapshot_cache")
+
+# events.jsonl files smaller than this are parsed without a snapshot
+_MIN_SNAPSHOT_BYTES = 1024 * 1024
+
+
+def _snapshot_path(events_path: Path, cache_dir: Path) -> Path:
+    """One snapshot file per events path, overwritten when the file changes."""
+    digest = hashlib.sha1(str(events_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"entries-{digest}.marshal"
+
+
+def load_entries_cached(
+    events_path: Path,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, dict]:
+    """
+    Latest-wins entries of *events_path*, served from a snapshot when unchanged.
+
+    Same result as ``auto_verify._load_entries_latest_wins``; each call
+    returns fresh dicts, so callers may mutate them.
+
+    Args:
+        events_path: Path to events.jsonl.
+        cache_dir: Snapshot directory (defaults to ``cache/`` next to
+                   events.jsonl, i.e. ``.memory/cache/``).
+    """
+    try:
+        st = os.stat(events_path)
+    except OSError:
+        return {}
+    if st.st_size < _MIN_SNAPSHOT_BYTES:
+        entries, _total, _offset = load_events_latest_wins(events_path)
+        return entries
+
+    if cache_dir is None:
+        cache_dir = events_path.parent / "cache"
+    snapshot_path = _snapshot_path(events_path, cache_dir)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    entries = _read_snapshot(snapshot_path, stamp)
+    if entries is not None:
+        return entries
+
+    entries, _total, _offset = load_events_latest_wins(events_path)
+    _write_snapshot(snapshot_path, stamp, entries)
+    return entries
+
+
+def _read_snapshot(snapshot_path: Path, stamp: tuple) -> Optional[Dict[str, dict]]:
+    """Entries from *snapshot_path* if it was taken at *stamp*, else None."""
+    try:
+        data = snapshot_path.read_bytes()
+    except OSError:
+        return None
+    # Same reasoning as events_io: decoded data cannot form cycles
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        snapshot = marshal.loads(data)
+    except (EOFError, ValueError, TypeError):
+        # Truncated file or a marshal format from another Python version
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    if (
+        not isinstance(snapshot, tuple) or len(snapshot) != 2
+        or snapshot[0] != stamp or not isinstance(snapshot[1], dict)
+    ):
+        return None
+    return snapshot[1]
+
+
+def _write_snapshot(snapshot_path: Path, stamp: tuple, entries: Dict[str, dict]) -> None:
+    """Atomically replace the snapshot; failures only cost the next run a parse."""
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        data = marshal.dumps((stamp, entries))
+    except ValueError as exc:
+        # An entry holding a value marshal cannot represent
+        logger.debug("Not snapshotting %s: %s", snapshot_path, exc)
+        return
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as exc:
+        logger.warning("Could not write snapshot %s: %s", snapshot_path, exc)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
@@ -21,9 +21,10 @@ import hashlib
 import json
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from .embedder import EmbeddingProvider
 from .vectordb import VectorDB
@@ -31,6 +32,9 @@ from .text_builder import build_embedding_text, build_fts_fields
 
 logger = logging.getLogger("efm.sync")
 
+# FTS rows buffered before one upsert_fts_many() call
+_FTS_FLUSH_ROWS = 500
+
 
 @dataclass
 class SyncReport:
@@ -47,8 +51,88 @@ class SyncReport:
 
 
 def _compute_text_hash(text: str) -> str:
-    """SHA-256 hash of the embedding text (first 16 hex chars)."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    """SHA-256 hash of the embedding text (first 16 hex chars).
+
+    The hash is stored in vectors.db, so changing the algorithm would
+    re-embed every entry once.  SHA-256 also benchmarks faster than
+    blake2b/md5 from hashlib on typical entry texts (SHA-NI); only the
+    8 digest bytes that are kept get hex-encoded.
+    """
+    return hashlib.sha256(text.encode("utf-8")).digest()[:8].hex()
+
+
+def _pack_batches(
+    items: Iterable[tuple],
+    batch_size: int,
+    max_chars: int,
+) -> Iterator[list]:
+    """
+    Group embedding work items into batches for embed_documents().
+
+    A batch is closed at *batch_size* items or once adding the next text
+    would exceed *max_chars* characters, whichever comes first (a single
+    oversized text still gets a batch of its own).  Batches are yielded
+    as soon as they close, so *items* may be produced lazily.
+    """
+    current: list = []
+    chars = 0
+    for item in items:
+        size = len(item[2])
+        if current and (len(current) >= batch_size or chars + size > max_chars):
+            yield current
+            current = []
+            chars = 0
+        current.append(item)
+        chars += size
+    if current:
+        yield current
+
+
+def _store_batch(
+    vectordb: VectorDB,
+    embedder: EmbeddingProvider,
+    batch: list,
+    results: Optional[list],
+    exc: Optional[Exception],
+    batch_start: int,
+    report: SyncReport,
+    quantize: bool = False,
+) -> None:
+    """Store one embedded batch (or record its failure) in *report*."""
+    if exc is not None:
+        error_msg = f"Batch embed failed (items {batch_start}-{batch_start + len(batch)}): {exc}"
+        logger.error(error_msg)
+        report.errors.append(error_msg)
+        return
+
+    vectors = [
+        (entry_id, text_hash, result.dimensions, result.vector)
+        for (entry_id, _entry, _text, text_hash, _is_new), result in zip(batch, results)
+    ]
+    try:
+        failed = vectordb.upsert_vectors(
+            vectors,
+            provider=embedder.provider_id,
+            model=embedder.model_name,
+            quantize=quantize,
+        )
+    except Exception as e:
+        error_msg = f"Failed to store vectors (items {batch_start}-{batch_start + len(batch)}): {e}"
+        logger.error(error_msg)
+        report.errors.append(error_msg)
+        return
+
+    for entry_id, e in failed:
+        error_msg = f"Failed to store vector for {entry_id}: {e}"
+        logger.error(error_msg)
+        report.errors.append(error_msg)
+
+    failed_ids = {entry_id for entry_id, _ in failed}
+    new_count = sum(
+        1 for item in batch[:len(vectors)] if item[4] and item[0] not in failed_ids
+    )
+    report.entries_added += new_count
+    report.entries_updated += len(vectors) - len(failed) - new_count
 
 
 def _read_events(
@@ -59,11 +143,13 @@ def _read_events(
     """
     Read events.jsonl and resolve latest-wins semantics.
 
-    Thin wrapper around :func:`events_io.load_events_latest_wins`.
+    Thin wrapper around :func:`events_io.load_events_latest_wins`, which
+    memory-maps the file, starts at *byte_offset*, decodes lines with
+    orjson when installed and only decodes the latest line per entry id.
 
     Returns:
         (entries_dict, total_lines, end_byte_offset)
-        entries_dict: {entry_id: latest_entry_dict} (with ``_line`` metadata)
+        entries_dict: {entry_id: latest_entry_dict}
         total_lines: total number of lines in file
         end_byte_offset: byte position at end of file for cursor storage
     """
@@ -71,7 +157,6 @@ def _read_events(
     return load_events_latest_wins(
         events_path,
         start_line=start_line,
-        track_lines=True,
         byte_offset=byte_offset,
     )
 
@@ -82,6 +167,9 @@ def sync_embeddings(
     embedder: Optional[EmbeddingProvider] = None,
     force_full: bool = False,
     batch_size: int = 20,
+    concurrency: int = 4,
+    max_batch_chars: int = 200_000,
+    quantize: bool = False,
 ) -> SyncReport:
     """
     Synchronize events.jsonl → vectors.db.
@@ -91,7 +179,12 @@ def sync_embeddings(
         vectordb: Open VectorDB instance
         embedder: Optional embedding provider (None = FTS-only mode)
         force_full: If True, ignore cursor and reprocess all entries
-        batch_size: Number of texts to embed per API call
+        batch_size: Maximum number of texts to embed per API call
+        concurrency: Maximum embedding calls in flight at once
+        max_batch_chars: Character budget per API call (keeps large
+                         entries from producing oversized requests)
+        quantize: Store vectors as int8 with a per-vector scale (a quarter
+                  of the float32 size; see vectordb.quantize_vector)
 
     Returns:
         SyncReport with operation summary
@@ -124,78 +217,92 @@ def sync_embeddings(
         else:
             active_entries[entry_id] = entry
 
-    # Handle deprecated entries (mark in vectors + remove from FTS)
-    vectordb.begin_batch()
-    for entry_id in deprecated_ids:
-        vectordb.mark_deprecated(entry_id)
-        vectordb.delete_fts(entry_id)
-        report.entries_deprecated += 1
-    vectordb.end_batch()
-
-    # Prepare embedding batches
-    to_embed: list[tuple[str, dict, str, str]] = []  # (entry_id, entry, text, text_hash)
-
-    vectordb.begin_batch()
-    for entry_id, entry in active_entries.items():
-        embed_text = build_embedding_text(entry)
-        text_hash = _compute_text_hash(embed_text)
-
-        # Check if content has changed (hash mismatch or new entry)
-        if not vectordb.needs_update(entry_id, text_hash):
-            report.entries_skipped += 1
-            continue
-
-        # Update FTS only for changed/new entries (not all active entries)
-        fts_fields = build_fts_fields(entry)
-        vectordb.upsert_fts(
-            entry_id=entry_id,
-            title=fts_fields["title"],
-            text=fts_fields["text"],
-            tags=fts_fields["tags"],
-        )
-
-        if embedder is None:
-            report.entries_fts_only += 1
-            continue
-
-        to_embed.append((entry_id, entry, embed_text, text_hash))
-    vectordb.end_batch()
-
-    # Batch embed and store
-    for batch_start in range(0, len(to_embed), batch_size):
-        batch = to_embed[batch_start:batch_start + batch_size]
-        texts = [item[2] for item in batch]
-
+    # Stored hashes for all active entries, fetched in a few IN (...) queries.
+    # The hash is over the embedding text, not the raw entry: building that
+    # text costs about as much as serializing the entry with sorted keys,
+    # and no-change incremental syncs never get here (the byte cursor is at EOF).
+    stored_hashes = vectordb.get_text_hashes(list(active_entries))
+
+    def prepare():
+        """Update FTS for changed entries; yield the ones to embed.
+
+        Items are ``(entry_id, entry, text, text_hash, is_new)``.  FTS rows
+        are written in bulk, ``_FTS_FLUSH_ROWS`` at a time.
+        """
+        fts_rows: List[Tuple[str, str, str, str]] = []
+        for entry_id, entry in active_entries.items():
+            embed_text = build_embedding_text(entry)
+            text_hash = _compute_text_hash(embed_text)
+
+            # Check if content has changed (hash mismatch or new entry)
+            if stored_hashes.get(entry_id) == text_hash:
+                report.entries_skipped += 1
+                continue
+
+            # Update FTS only for changed/new entries (not all active entries)
+            fts_fields = build_fts_fields(entry)
+            fts_rows.append(
+                (entry_id, fts_fields["title"], fts_fields["text"], fts_fields["tags"])
+            )
+            if len(fts_rows) >= _FTS_FLUSH_ROWS:
+                vectordb.upsert_fts_many(fts_rows)
+                fts_rows = []
+
+            if embedder is None:
+                report.entries_fts_only += 1
+                continue
+
+            yield (entry_id, entry, embed_text, text_hash, entry_id not in stored_hashes)
+
+        if fts_rows:
+            vectordb.upsert_fts_many(fts_rows)
+
+    def embed(batch):
         try:
-            results = embedder.embed_documents(texts)
+            return embedder.embed_documents([item[2] for item in batch]), None
         except Exception as e:
-            error_msg = f"Batch embed failed (items {batch_start}-{batch_start + len(batch)}): {e}"
-            logger.error(error_msg)
-            report.errors.append(error_msg)
-            continue
-
+            return None, e
+
+    # Embedding calls are network-bound.  With concurrency > 1 each batch
+    # goes to a thread pool as soon as it is packed, so API calls overlap
+    # the hashing and FTS writes for the remaining entries; otherwise
+    # batches are embedded one by one after preparation.  Either way,
+    # vectors are stored on this thread in batch order.
+    pool = (
+        ThreadPoolExecutor(max_workers=concurrency)
+        if embedder is not None and concurrency > 1 else None
+    )
+    pending: List[tuple] = []  # (batch, Future or None)
+    try:
+        # Deprecations and FTS updates go into one transaction.  Vectors
+        # are committed per embedded batch below, so the write lock is
+        # never held while waiting on embedding API calls.
         vectordb.begin_batch()
-        for (entry_id, entry, embed_text, text_hash), result in zip(batch, results):
-            try:
-                is_new = not vectordb.has_vector(entry_id)
-                vectordb.upsert_vector(
-                    entry_id=entry_id,
-                    text_hash=text_hash,
-                    provider=embedder.provider_id,
-                    model=embedder.model_name,
-                    dimensions=result.dimensions,
-                    embedding=result.vector,
-                    deprecated=False,
+        try:
+            # Handle deprecated entries (mark in vectors + remove from FTS)
+            vectordb.mark_deprecated_many(deprecated_ids)
+            vectordb.delete_fts_many(deprecated_ids)
+            report.entries_deprecated += len(deprecated_ids)
+
+            for batch in _pack_batches(prepare(), batch_size, max_batch_chars):
+                future: Optional[Future] = (
+                    pool.submit(embed, batch) if pool is not None else None
                 )
-                if is_new:
-                    report.entries_added += 1
-                else:
-                    report.entries_updated += 1
-            except Exception as e:
-                error_msg = f"Failed to store vector for {entry_id}: {e}"
-                logger.error(error_msg)
-                report.errors.append(error_msg)
-        vectordb.end_batch()
+                pending.append((batch, future))
+        finally:
+            vectordb.end_batch()
+
+        batch_start = 0
+        for batch, future in pending:
+            results, exc = future.result() if future is not None else embed(batch)
+            _store_batch(
+                vectordb, embedder, batch, results, exc, batch_start, report,
+                quantize,
+            )
+            batch_start += len(batch)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     # Update sync cursor only if no errors occurred.
     # When errors exist, don't advance — failed entries will be retried
@@ -17,9 +17,12 @@ Integration:
 Safety:
   - Rules echo filtering: strips auto-injected rule content before scanning
   - Dedup: checks against existing events.jsonl and pending drafts
-  - Performance: skips transcripts >10MB
+  - Performance: skips transcripts >10MB, or reads only the last
+    v3.scan_tail_bytes of the file when that is set; only lines
+    containing ``"assistant"`` are JSON-parsed
 
-No external dependencies — pure Python stdlib + internal modules.
+No external dependencies — pure Python stdlib + internal modules
+(``orjson`` is used for large transcripts when installed).
 """
 
 import json
@@ -28,11 +31,21 @@ from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 
+from .events_io import get_orjson
+
 logger = logging.getLogger("efm.transcript_scanner")
 
 # Safety: skip transcripts larger than 10 MB to avoid blocking stop
 _MAX_TRANSCRIPT_BYTES = 10 * 1024 * 1024
 
+# Raw bytes every assistant line contains; lines without it are never parsed.
+# Searched over the whole line, not a prefix: Claude Code writes the
+# top-level "type" key after the (possibly huge) "message" object.
+_ASSISTANT_MARKER = b'"assistant"'
+
+# Read buffer for streaming transcripts line by line
+_READ_BUFFER_BYTES = 1024 * 1024
+
 # Markers that identify auto-injected rule content from .claude/rules/ef-memory/
 # These lines (and their surrounding block) are stripped to prevent re-harvesting
 # existing rules that were injected into the conversation context.
@@ -61,6 +74,9 @@ def _strip_rules_echo(text: str) -> str:
     Returns:
         Text with rule-injected blocks removed.
     """
+    if not any(marker in text for marker in _RULES_ECHO_MARKERS):
+        return text
+
     lines = text.splitlines()
     filtered: List[str] = []
     skip_block = False
@@ -80,7 +96,7 @@ def _strip_rules_echo(text: str) -> str:
     return "\n".join(filtered)
 
 
-def read_transcript_messages(transcript_path: Path) -> List[str]:
+def read_transcript_messages(transcript_path: Path, tail_bytes: int = 0) -> List[str]:
     """Read a Claude Code transcript JSONL and extract assistant message texts.
 
     The JSONL format contains one JSON object per line. Each object has a
@@ -91,6 +107,12 @@ def read_transcript_messages(transcript_path: Path) -> List[str]:
         {"type": "assistant", "message": {"content": [{"type": "text", "text": "..."}]}}
         {"type": "human", "message": {"content": [{"type": "text", "text": "..."}]}}
 
+    Args:
+        transcript_path: Path to the conversation JSONL file.
+        tail_bytes: If > 0, only read the last *tail_bytes* of the file
+            (starting at the first complete line).  The read is bounded,
+            so the 10 MB size limit does not apply.
+
     Returns:
         List of text strings from assistant turns only.
         Returns [] on any error (graceful degradation).
@@ -100,62 +122,80 @@ def read_transcript_messages(transcript_path: Path) -> List[str]:
 
     try:
         file_size = transcript_path.stat().st_size
-        if file_size > _MAX_TRANSCRIPT_BYTES:
+        if file_size == 0:
+            return []
+        tail_start = max(0, file_size - tail_bytes) if tail_bytes > 0 else 0
+        if tail_bytes <= 0 and file_size > _MAX_TRANSCRIPT_BYTES:
             logger.info(
                 f"Transcript too large ({file_size / 1024 / 1024:.1f} MB), "
                 f"skipping scan"
             )
             return []
-        if file_size == 0:
-            return []
     except OSError:
         return []
 
+    orjson = get_orjson(file_size - tail_start)
+    loads = orjson.loads if orjson is not None else json.loads
+
     texts: List[str] = []
     try:
-        with open(transcript_path, "r", encoding="utf-8") as f:
+        # Streamed line by line: memory stays at one line (plus the read
+        # buffer) instead of the whole file and a split() copy of it
+        with open(transcript_path, "rb", buffering=_READ_BUFFER_BYTES) as f:
+            if tail_start > 0:
+                # Drop the partial line unless the tail starts on a line boundary
+                f.seek(tail_start - 1)
+                if f.read(1) != b"\n":
+                    f.readline()
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                if obj.get("type") != "assistant":
-                    continue
-
-                message = obj.get("message", {})
-                content = message.get("content", [])
-                if isinstance(content, str):
-                    texts.append(content)
-                    continue
-
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text = block.get("text", "")
-                        if text:
-                            texts.append(text)
-    except (OSError, UnicodeDecodeError) as e:
+                # Assistant turns carry "type": "assistant"; every other line
+                # (user turns, tool results, progress) is skipped unparsed
+                if _ASSISTANT_MARKER in line:
+                    _collect_assistant_texts(line, loads, texts)
+    except OSError as e:
         logger.warning(f"Cannot read transcript: {e}")
         return []
 
     return texts
 
 
+def _collect_assistant_texts(line: bytes, loads, texts: List[str]) -> None:
+    """Append the text blocks of one transcript line if it is an assistant turn."""
+    try:
+        obj = loads(line)
+    except ValueError:  # invalid JSON or UTF-8: skip the line
+        return
+
+    if not isinstance(obj, dict) or obj.get("type") != "assistant":
+        return
+
+    message = obj.get("message", {})
+    content = message.get("content", [])
+    if isinstance(content, str):
+        texts.append(content)
+        return
+
+    for block in content:
+        if isinstance(block, dict) and block.get("type") == "text":
+            text = block.get("text", "")
+            if text:
+                texts.append(text)
+
+
 def scan_conversation_for_drafts(
     transcript_path: Path,
     drafts_dir: Path,
     project_root: Path,
     config: dict,
+    tail_bytes: int = 0,
 ) -> Dict:
     """Scan conversation transcript for memory-worthy patterns and create drafts.
 
     Steps:
         1. read_transcript_messages() → list of assistant texts
-        2. Concatenate and strip rules echo content
-        3. _extract_candidates() — reuse 6 harvest patterns from working_memory
+        2. Keep turns with a harvest keyword; strip rules echo from each
+        3. _extract_candidates() — reuse 6 harvest patterns from working_memory,
+           turn by turn (the turns are never joined into one string)
         4. Dedup against existing events.jsonl and pending drafts
         5. create_draft() — write to .memory/drafts/ (never events.jsonl)
 
@@ -164,6 +204,8 @@ def scan_conversation_for_drafts(
         drafts_dir: Path to .memory/drafts/
         project_root: Project root for source normalization
         config: EF Memory config dict
+        tail_bytes: If > 0, only scan the last *tail_bytes* of the
+            transcript (see :func:`read_transcript_messages`)
 
     Returns:
         {
@@ -181,24 +223,32 @@ def scan_conversation_for_drafts(
     }
 
     # Step 1: Read transcript
-    texts = read_transcript_messages(transcript_path)
+    texts = read_transcript_messages(transcript_path, tail_bytes=tail_bytes)
     if not texts:
         return result
 
-    # Step 2: Concatenate and strip rules echo
-    full_text = "\n\n".join(texts)
-    full_text = _strip_rules_echo(full_text)
-
-    # Step 3: Extract candidates (reuse working_memory patterns)
     try:
-        from .working_memory import _extract_candidates, _convert_candidate_to_entry
+        from .working_memory import (
+            _HARVEST_KEYWORDS,
+            _convert_candidate_to_entry,
+            _extract_candidates,
+        )
     except ImportError as e:
         result["errors"].append(f"Cannot import working_memory: {e}")
         return result
 
+    # Step 2: Drop turns without any harvest keyword (stripping can only
+    # remove text, so they cannot yield candidates), then strip rules echo
+    # per turn (echo blocks never span turns)
+    texts = [
+        t for t in texts if any(kw in t for kw in _HARVEST_KEYWORDS)
+    ]
+    texts = [t for t in map(_strip_rules_echo, texts) if t]
+
+    # Step 3: Extract candidates (reuse working_memory patterns)
     source_hint = f"conversation:{transcript_path.stem}"
     seen_titles: set = set()
-    candidates = _extract_candidates(full_text, source_hint, seen_titles)
+    candidates = _extract_candidates(texts, source_hint, seen_titles)
     result["candidates_found"] = len(candidates)
 
     if not candidates:
@@ -230,7 +280,9 @@ def scan_conversation_for_drafts(
         pass  # If drafts dir doesn't exist yet, no problem
 
     # Step 5: Convert, dedup, and create drafts
-    type_counts: Counter = Counter()
+    created_types: List[str] = []
+    dedup_texts: Dict[str, str] = {}  # shared across candidates (same entries)
+    dedup_counts: Dict[str, Counter] = {}
     for candidate in candidates:
         try:
             # Skip if a pending draft with the same title already exists
@@ -243,6 +295,8 @@ def scan_conversation_for_drafts(
             dedup = check_duplicates(
                 entry, events_path, dedup_threshold,
                 _preloaded_entries=preloaded,
+                _dedup_texts=dedup_texts,
+                _dedup_counts=dedup_counts,
             )
             if dedup.is_duplicate:
                 logger.info(
@@ -251,16 +305,16 @@ def scan_conversation_for_drafts(
                 )
                 continue
 
-            draft_info = create_draft(entry, drafts_dir)
-            if draft_info.path.exists():
-                result["drafts_created"] += 1
-                type_counts[candidate.suggested_type] += 1
-                # Track this title to avoid duplicates within the same scan
-                existing_draft_titles.add(candidate.title)
+            # create_draft() raises if the file cannot be written
+            create_draft(entry, drafts_dir)
+            created_types.append(candidate.suggested_type)
+            # Track this title to avoid duplicates within the same scan
+            existing_draft_titles.add(candidate.title)
         except Exception as e:
             result["errors"].append(
                 f"Draft failed for '{candidate.title[:50]}': {e}"
             )
 
-    result["draft_types"] = dict(type_counts)
+    result["drafts_created"] = len(created_types)
+    result["draft_types"] = dict(Counter(created_types))
     return result
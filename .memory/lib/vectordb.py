@@ -5,7 +5,8 @@ SQLite-based vector storage with FTS5 full-text search.
 Pure Python cosine similarity — no numpy, no native extensions.
 
 Storage:
-- vectors table: entry_id → embedding blob (struct-packed float32)
+- vectors table: entry_id → embedding blob (struct-packed float32, or
+                 int8 with a per-vector scale when sync quantizes)
 - fts_entries:   FTS5 virtual table for BM25 keyword search
 - sync_state:    tracks incremental sync cursor
 
@@ -19,11 +20,20 @@ import struct
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger("efm.vectordb")
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
+
+# Ids per "IN (...)" lookup; stays below SQLite's historic 999-variable limit
+_IN_CHUNK = 500
+
+# Covering (entry_id, text_hash) index used by the hash lookups
+_HASH_INDEX = "idx_vectors_entry_hash"
+
+# Bytes of the database file SQLite may memory-map for reads (256 MiB)
+_MMAP_SIZE = 256 * 1024 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +50,26 @@ def unpack_vector(blob: bytes, dimensions: int) -> List[float]:
     return list(struct.unpack(f"{dimensions}f", blob))
 
 
+def quantize_vector(vec: List[float]) -> Tuple[bytes, float]:
+    """
+    Quantize a vector to int8 with one scale: ``vec[i] ≈ q[i] * scale``.
+
+    Returns the packed int8 blob (a quarter of the float32 size) and the
+    scale.  Cosine similarity is scale-invariant, so search can compare
+    the int8 values directly.
+    """
+    # max()/min() run in C; cheaper than abs() on every component
+    peak = max(max(vec), -min(vec)) if vec else 0.0
+    scale = peak / 127.0 if peak > 0.0 else 1.0
+    inv = 127.0 / peak if peak > 0.0 else 1.0
+    return struct.pack(f"{len(vec)}b", *[round(v * inv) for v in vec]), scale
+
+
+def dequantize_vector(blob: bytes, scale: float) -> List[float]:
+    """Inverse of quantize_vector (up to rounding error)."""
+    return [q * scale for q in memoryview(blob).cast("b")]
+
+
 def cosine_similarity(a: List[float], b: List[float]) -> float:
     """
     Compute cosine similarity between two vectors.
@@ -62,6 +92,30 @@ def cosine_similarity(a: List[float], b: List[float]) -> float:
     return dot / math.sqrt(norm_a * norm_b)
 
 
+def _encode_vector(embedding: List[float], quantize: bool) -> Tuple[bytes, Optional[float]]:
+    """Blob and scale for the vectors table (scale is None for float32)."""
+    if quantize:
+        return quantize_vector(embedding)
+    return pack_vector(embedding), None
+
+
+_UPSERT_VECTOR_SQL = """
+    INSERT INTO vectors (entry_id, text_hash, provider, model,
+                         dimensions, embedding, scale, deprecated,
+                         created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(entry_id) DO UPDATE SET
+        text_hash  = excluded.text_hash,
+        provider   = excluded.provider,
+        model      = excluded.model,
+        dimensions = excluded.dimensions,
+        embedding  = excluded.embedding,
+        scale      = excluded.scale,
+        deprecated = excluded.deprecated,
+        updated_at = excluded.updated_at
+"""
+
+
 # ---------------------------------------------------------------------------
 # VectorDB
 # ---------------------------------------------------------------------------
@@ -71,7 +125,8 @@ class VectorDB:
     SQLite-based vector storage with optional FTS5 support.
 
     Tables:
-    - vectors:     entry embeddings (struct-packed float32 blobs)
+    - vectors:     entry embeddings (struct-packed float32 blobs; int8
+                   blobs where ``scale`` is set, see quantize_vector)
     - fts_entries: FTS5 full-text search index
     - sync_state:  incremental sync tracking
     """
@@ -81,6 +136,10 @@ class VectorDB:
         self._conn: Optional[sqlite3.Connection] = None
         self._fts5_available: bool = True
         self._batch_depth: int = 0
+        # Table clause for hash lookups; names the covering index once
+        # ensure_schema() has created it (SQLite's planner would otherwise
+        # pick the primary-key index and read every row)
+        self._hash_table: str = "vectors"
 
     # --- Lifecycle ---
 
@@ -88,8 +147,12 @@ class VectorDB:
         """Open or create the database."""
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self._db_path))
+        # WAL + synchronous=NORMAL: commits append to the WAL without an
+        # fsync (only checkpoints sync), so frequent small commits stay cheap
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
 
     def close(self) -> None:
         """Close the database connection."""
@@ -137,6 +200,7 @@ class VectorDB:
                 model       TEXT NOT NULL,
                 dimensions  INTEGER NOT NULL,
                 embedding   BLOB NOT NULL,
+                scale       REAL,
                 deprecated  INTEGER DEFAULT 0,
                 created_at  TEXT NOT NULL,
                 updated_at  TEXT NOT NULL
@@ -148,6 +212,14 @@ class VectorDB:
             ON vectors(deprecated)
         """)
 
+        # Covering index for hash lookups (needs_update, get_text_hashes):
+        # answered from index pages without touching the blob-heavy rows
+        self._conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {_HASH_INDEX}
+            ON vectors(entry_id, text_hash)
+        """)
+        self._hash_table = f"vectors INDEXED BY {_HASH_INDEX}"
+
         # FTS5 — graceful fallback if not available
         try:
             self._conn.execute("""
@@ -181,8 +253,13 @@ class VectorDB:
 
         Future migrations go here, keyed by version number.
         """
-        # Future migrations go here
-        pass
+        if from_version < 2:
+            # v2: int8 vectors carry their scale (NULL = float32 blob)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(vectors)")
+            }
+            if columns and "scale" not in columns:
+                self._conn.execute("ALTER TABLE vectors ADD COLUMN scale REAL")
 
     # --- Batch transaction support ---
 
@@ -213,40 +290,66 @@ class VectorDB:
         dimensions: int,
         embedding: List[float],
         deprecated: bool = False,
+        quantize: bool = False,
     ) -> None:
-        """Insert or update a vector embedding."""
+        """Insert or update a vector embedding (as int8 if *quantize*)."""
         self._require_conn()
         now = datetime.now(timezone.utc).isoformat()
-        blob = pack_vector(embedding)
+        blob, scale = _encode_vector(embedding, quantize)
         self._conn.execute(
-            """
-            INSERT INTO vectors (entry_id, text_hash, provider, model,
-                                 dimensions, embedding, deprecated, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(entry_id) DO UPDATE SET
-                text_hash  = excluded.text_hash,
-                provider   = excluded.provider,
-                model      = excluded.model,
-                dimensions = excluded.dimensions,
-                embedding  = excluded.embedding,
-                deprecated = excluded.deprecated,
-                updated_at = excluded.updated_at
-            """,
+            _UPSERT_VECTOR_SQL,
             (entry_id, text_hash, provider, model, dimensions,
-             blob, int(deprecated), now, now),
+             blob, scale, int(deprecated), now, now),
         )
         self._auto_commit()
 
+    def upsert_vectors(
+        self,
+        vectors: List[Tuple[str, str, int, List[float]]],
+        provider: str,
+        model: str,
+        quantize: bool = False,
+    ) -> List[Tuple[str, Exception]]:
+        """
+        Insert or update many active vectors with one ``executemany``.
+
+        Args:
+            vectors: ``(entry_id, text_hash, dimensions, embedding)`` tuples.
+            provider, model, quantize: As for upsert_vector, shared by all rows.
+
+        Returns:
+            ``(entry_id, error)`` for each embedding that could not be
+            packed; those rows are skipped and the rest are still written.
+        """
+        self._require_conn()
+        now = datetime.now(timezone.utc).isoformat()
+        rows = []
+        failed: List[Tuple[str, Exception]] = []
+        for entry_id, text_hash, dimensions, embedding in vectors:
+            try:
+                blob, scale = _encode_vector(embedding, quantize)
+            except (struct.error, TypeError, ValueError) as e:
+                failed.append((entry_id, e))
+                continue
+            rows.append((entry_id, text_hash, provider, model, dimensions,
+                         blob, scale, 0, now, now))
+        self._conn.executemany(_UPSERT_VECTOR_SQL, rows)
+        self._auto_commit()
+        return failed
+
     def get_vector(self, entry_id: str) -> Optional[List[float]]:
         """Get the embedding vector for an entry, or None."""
         self._require_conn()
         row = self._conn.execute(
-            "SELECT embedding, dimensions FROM vectors WHERE entry_id = ?",
+            "SELECT embedding, dimensions, scale FROM vectors WHERE entry_id = ?",
             (entry_id,),
         ).fetchone()
         if row is None:
             return None
-        return unpack_vector(row[0], row[1])
+        blob, dims, scale = row
+        if scale is not None:
+            return dequantize_vector(blob, scale)
+        return unpack_vector(blob, dims)
 
     def has_vector(self, entry_id: str) -> bool:
         """Check if a vector exists for the given entry."""
@@ -261,20 +364,48 @@ class VectorDB:
         """Check if the vector needs updating (hash mismatch or missing)."""
         self._require_conn()
         row = self._conn.execute(
-            "SELECT text_hash FROM vectors WHERE entry_id = ?",
+            f"SELECT text_hash FROM {self._hash_table} WHERE entry_id = ?",
             (entry_id,),
         ).fetchone()
         if row is None:
             return True  # Missing — needs creation
         return row[0] != text_hash  # Hash changed — needs update
 
+    def get_text_hashes(self, entry_ids: List[str]) -> Dict[str, str]:
+        """
+        Stored text_hash per entry id, for the ids that have a vector.
+
+        Looks up ``_IN_CHUNK`` ids per query, so a sync over N entries costs
+        ceil(N / _IN_CHUNK) statements instead of N needs_update() calls.
+        """
+        self._require_conn()
+        hashes: Dict[str, str] = {}
+        for i in range(0, len(entry_ids), _IN_CHUNK):
+            chunk = entry_ids[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            hashes.update(self._conn.execute(
+                f"SELECT entry_id, text_hash FROM {self._hash_table} "
+                f"WHERE entry_id IN ({placeholders})",
+                chunk,
+            ).fetchall())
+        return hashes
+
     def mark_deprecated(self, entry_id: str) -> None:
         """Mark a vector as deprecated (excluded from search, kept for dedup)."""
+        self.mark_deprecated_many([entry_id])
+
+    def mark_deprecated_many(self, entry_ids: List[str]) -> None:
+        """mark_deprecated() for many ids, ``_IN_CHUNK`` ids per UPDATE."""
         self._require_conn()
-        self._conn.execute(
-            "UPDATE vectors SET deprecated = 1, updated_at = ? WHERE entry_id = ?",
-            (datetime.now(timezone.utc).isoformat(), entry_id),
-        )
+        now = datetime.now(timezone.utc).isoformat()
+        for i in range(0, len(entry_ids), _IN_CHUNK):
+            chunk = entry_ids[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(
+                f"UPDATE vectors SET deprecated = 1, updated_at = ? "
+                f"WHERE entry_id IN ({placeholders})",
+                [now, *chunk],
+            )
         self._auto_commit()
 
     def delete_vector(self, entry_id: str) -> None:
@@ -295,16 +426,25 @@ class VectorDB:
         Brute-force cosine similarity search over all vectors.
 
         Returns list of (entry_id, similarity_score) sorted by score descending.
+        int8 vectors are compared as stored: their scale cancels out of
+        the cosine.
         """
         self._require_conn()
         where = "WHERE deprecated = 0" if exclude_deprecated else ""
         rows = self._conn.execute(
-            f"SELECT entry_id, embedding, dimensions FROM vectors {where}"
+            f"SELECT entry_id, embedding, dimensions, scale FROM vectors {where}"
         ).fetchall()
 
         scored = (
-            (cosine_similarity(query_vec, unpack_vector(blob, dims)), entry_id)
-            for entry_id, blob, dims in rows
+            (
+                cosine_similarity(
+                    query_vec,
+                    unpack_vector(blob, dims) if scale is None
+                    else memoryview(blob).cast("b"),
+                ),
+                entry_id,
+            )
+            for entry_id, blob, dims, scale in rows
         )
         top = heapq.nlargest(limit, scored, key=lambda x: x[0])
         return [(entry_id, sim) for sim, entry_id in top]
@@ -313,28 +453,49 @@ class VectorDB:
 
     def upsert_fts(self, entry_id: str, title: str, text: str, tags: str) -> None:
         """Insert or update FTS5 index entry."""
+        self.upsert_fts_many([(entry_id, title, text, tags)])
+
+    def upsert_fts_many(self, rows: List[Tuple[str, str, str, str]]) -> None:
+        """
+        upsert_fts() for many ``(entry_id, title, text, tags)`` rows.
+
+        FTS5 doesn't support UPSERT, so old rows are deleted in bulk
+        (see delete_fts_many) and the new ones inserted with executemany.
+        """
         if not self._fts5_available:
             return
         self._require_conn()
-
-        # FTS5 doesn't support UPSERT, so delete+insert
-        self._conn.execute(
-            "DELETE FROM fts_entries WHERE entry_id = ?", (entry_id,)
-        )
-        self._conn.execute(
-            "INSERT INTO fts_entries (entry_id, title, text, tags) VALUES (?, ?, ?, ?)",
-            (entry_id, title, text, tags),
-        )
-        self._auto_commit()
+        self.begin_batch()
+        try:
+            self.delete_fts_many([row[0] for row in rows])
+            self._conn.executemany(
+                "INSERT INTO fts_entries (entry_id, title, text, tags) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        finally:
+            self.end_batch()
 
     def delete_fts(self, entry_id: str) -> None:
         """Delete an FTS entry."""
+        self.delete_fts_many([entry_id])
+
+    def delete_fts_many(self, entry_ids: List[str]) -> None:
+        """
+        delete_fts() for many ids, ``_IN_CHUNK`` ids per DELETE.
+
+        entry_id is UNINDEXED in the FTS table, so every DELETE scans it;
+        batching turns one scan per id into one per chunk.
+        """
         if not self._fts5_available:
             return
         self._require_conn()
-        self._conn.execute(
-            "DELETE FROM fts_entries WHERE entry_id = ?", (entry_id,)
-        )
+        for i in range(0, len(entry_ids), _IN_CHUNK):
+            chunk = entry_ids[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(
+                f"DELETE FROM fts_entries WHERE entry_id IN ({placeholders})",
+                chunk,
+            )
         self._auto_commit()
 
     def search_fts(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
@@ -25,7 +25,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger("efm.working_memory")
 
@@ -124,6 +124,22 @@ _ERROR_FIX_PATTERN = re.compile(
     r"(?:Error|ERROR|Fix|FIX|Fixed|Bug|BUG|Resolved)\s*[:：]\s*(.+)", re.MULTILINE
 )
 
+# Literal keywords each harvest pattern needs in order to match.  A
+# substring test (C fast-search) is far cheaper than a regex pass, so a
+# pattern whose keywords are all absent from the text is never run.
+_LESSON_KEYWORDS = ("LESSON", "lesson", "Lesson")
+_CONSTRAINT_KEYWORDS = ("CONSTRAINT", "constraint", "Constraint", "INVARIANT", "invariant")
+_DECISION_KEYWORDS = ("DECISION", "decision", "Decision", "Decided", "decided")
+_WARNING_KEYWORDS = ("WARNING", "warning", "Warning", "RISK", "risk", "Risk", "DANGER", "danger")
+_MUST_KEYWORDS = ("MUST", "NEVER", "ALWAYS")
+_ERROR_FIX_KEYWORDS = ("Error", "ERROR", "Fix", "FIX", "Bug", "BUG", "Resolved")
+
+# Union of the keywords above: text containing none of them yields no candidates
+_HARVEST_KEYWORDS = tuple(dict.fromkeys(
+    _LESSON_KEYWORDS + _CONSTRAINT_KEYWORDS + _DECISION_KEYWORDS
+    + _WARNING_KEYWORDS + _MUST_KEYWORDS + _ERROR_FIX_KEYWORDS
+))
+
 # Markdown cleanup patterns (precompiled for performance)
 _RE_PIPE = re.compile(r'\|')
 _RE_BOLD_ITALIC = re.compile(r'\*{1,2}')
@@ -614,15 +630,24 @@ def _search_for_prefill(
 # Harvest extraction helpers
 # ---------------------------------------------------------------------------
 
+def _gated_finditer(pattern: "re.Pattern", keywords: Tuple[str, ...], texts: Sequence[str]):
+    """``pattern.finditer`` over each of *texts* that contains one of *keywords*."""
+    for text in texts:
+        if any(kw in text for kw in keywords):
+            yield from pattern.finditer(text)
+
+
 def _extract_candidates(
-    text: str,
+    text: Union[str, Sequence[str]],
     source_hint: str,
     seen_titles: Optional[set] = None,
 ) -> List[HarvestCandidate]:
     """Extract memory candidates from text using pattern matching.
 
     Args:
-        text: Text content to scan for patterns.
+        text: Text content to scan for patterns, or a sequence of texts
+            (e.g. conversation turns) scanned one by one without being
+            joined.  Patterns never match across texts.
         source_hint: Source file path for candidate attribution.
         seen_titles: Optional shared set for cross-file deduplication.
             If provided, titles already in the set are skipped, and
@@ -631,9 +656,10 @@ def _extract_candidates(
     candidates = []
     if seen_titles is None:
         seen_titles = set()
+    texts = (text,) if isinstance(text, str) else text
 
     # Pattern 1: Explicit LESSON: markers
-    for match in _LESSON_PATTERN.finditer(text):
+    for match in _gated_finditer(_LESSON_PATTERN, _LESSON_KEYWORDS, texts):
         title = match.group(1).strip()
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
@@ -649,7 +675,7 @@ def _extract_candidates(
             ))
 
     # Pattern 2: Explicit CONSTRAINT/INVARIANT: markers
-    for match in _CONSTRAINT_PATTERN.finditer(text):
+    for match in _gated_finditer(_CONSTRAINT_PATTERN, _CONSTRAINT_KEYWORDS, texts):
         title = match.group(1).strip()
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
@@ -665,7 +691,7 @@ def _extract_candidates(
             ))
 
     # Pattern 3: Explicit DECISION: markers
-    for match in _DECISION_PATTERN.finditer(text):
+    for match in _gated_finditer(_DECISION_PATTERN, _DECISION_KEYWORDS, texts):
         title = match.group(1).strip()
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
@@ -681,7 +707,7 @@ def _extract_candidates(
             ))
 
     # Pattern 4: WARNING/RISK markers
-    for match in _WARNING_PATTERN.finditer(text):
+    for match in _gated_finditer(_WARNING_PATTERN, _WARNING_KEYWORDS, texts):
         title = match.group(1).strip()
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
@@ -696,15 +722,23 @@ def _extract_candidates(
                 extraction_reason="Explicit WARNING/RISK: marker",
             ))
 
-    # Pattern 5: MUST/NEVER/ALWAYS statements (if not already captured)
-    for match in _MUST_PATTERN.finditer(text):
+    # Pattern 5: MUST/NEVER/ALWAYS statements (if not already captured).
+    # Cleaned text has no newlines, so "contained in some candidate title"
+    # is one substring search over the newline-joined titles, extended as
+    # candidates are added, instead of a Python-level loop per match.
+    titles_blob = ""
+    titles_joined = 0
+    for match in _gated_finditer(_MUST_PATTERN, _MUST_KEYWORDS, texts):
         statement = match.group(1).strip()
         statement = _clean_markdown_artifacts(statement)
         if len(statement) < 15:
             continue
         if statement and statement not in seen_titles:
+            if titles_joined < len(candidates):
+                titles_blob += "\n" + "\n".join(c.title for c in candidates[titles_joined:])
+                titles_joined = len(candidates)
             # Check not already captured by other patterns
-            if not any(statement in c.title for c in candidates):
+            if statement not in titles_blob:
                 seen_titles.add(statement)
                 candidates.append(HarvestCandidate(
                     suggested_type="constraint",
@@ -717,7 +751,7 @@ def _extract_candidates(
                 ))
 
     # Pattern 6: Error/Fix patterns → lesson candidates
-    for match in _ERROR_FIX_PATTERN.finditer(text):
+    for match in _gated_finditer(_ERROR_FIX_PATTERN, _ERROR_FIX_KEYWORDS, texts):
         title = match.group(1).strip()
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
@@ -1073,11 +1107,11 @@ def auto_harvest_and_persist(
     # Write high-confidence entries to events.jsonl
     if entries_to_write:
         try:
-            with open(events_path, "a") as f:
+            from .events_io import append_events
+            if conversation_id:
                 for entry in entries_to_write:
-                    if conversation_id:
-                        entry.setdefault("_meta", {})["conversation_id"] = conversation_id
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    entry.setdefault("_meta", {})["conversation_id"] = conversation_id
+            append_events(events_path, entries_to_write)
             result["entries_written"] = len(entries_to_write)
         except Exception as e:
             result["errors"].append(f"Write failed: {e}")
@@ -11,7 +11,6 @@ Usage:
     python3 .memory/scripts/compact_cli.py --help       # Show help
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -22,6 +21,16 @@ _PROJECT_ROOT = _MEMORY_DIR.parent
 sys.path.insert(0, str(_MEMORY_DIR))
 
 from lib.compaction import compact, get_compaction_stats
+from lib.config_presets import load_config_cached
+
+
+# Boolean flags → args key (anything else is ignored)
+_FLAGS = {
+    "--dry-run": "dry_run",
+    "--stats": "stats",
+    "--help": "help",
+    "-h": "help",
+}
 
 
 def _parse_args(argv: list) -> dict:
@@ -32,20 +41,18 @@ def _parse_args(argv: list) -> dict:
         "help": False,
     }
     for arg in argv[1:]:
-        if arg == "--dry-run":
-            args["dry_run"] = True
-        elif arg == "--stats":
-            args["stats"] = True
-        elif arg in ("--help", "-h"):
-            args["help"] = True
+        key = _FLAGS.get(arg)
+        if key is not None:
+            args[key] = True
     return args
 
 
 def _load_config() -> dict:
-    config_path = _MEMORY_DIR / "config.json"
+    """Load EF Memory config (presets resolved); ``{}`` if it is unusable."""
     try:
-        return json.loads(config_path.read_text())
-    except Exception:
+        return load_config_cached(_MEMORY_DIR / "config.json")
+    except (ValueError, OSError) as exc:
+        print(f"WARNING: Could not parse config.json: {exc}", file=sys.stderr)
         return {}
 
 
@@ -34,6 +34,23 @@ from lib.config_presets import VALID_PRESET_NAMES, describe_preset, load_config
 from lib.init import run_init
 
 
+# Boolean flags → args key
+_FLAGS = {
+    "--help": "help",
+    "-h": "help",
+    "--dry-run": "dry_run",
+    "--force": "force",
+    "--upgrade": "upgrade",
+}
+
+# Options taking a value (``--opt value`` or ``--opt=value``) →
+# (args key, error printed when the value is missing)
+_VALUE_FLAGS = {
+    "--target": ("target", "ERROR: --target requires a path argument"),
+    "--preset": ("preset", "ERROR: --preset requires a value (minimal|standard|full)"),
+}
+
+
 def _parse_args(argv: list) -> dict:
     """Simple argument parser."""
     args = {
@@ -47,35 +64,23 @@ def _parse_args(argv: list) -> dict:
     i = 0
     while i < len(argv):
         arg = argv[i]
-        if arg in ("--help", "-h"):
-            args["help"] = True
-        elif arg == "--dry-run":
-            args["dry_run"] = True
-        elif arg == "--force":
-            args["force"] = True
-        elif arg == "--upgrade":
-            args["upgrade"] = True
-        elif arg == "--target":
+        if arg in _FLAGS:
+            args[_FLAGS[arg]] = True
+        elif arg in _VALUE_FLAGS:
+            key, missing = _VALUE_FLAGS[arg]
             if i + 1 < len(argv):
-                args["target"] = argv[i + 1]
+                args[key] = argv[i + 1]
                 i += 1
             else:
-                print("ERROR: --target requires a path argument")
+                print(missing)
                 sys.exit(1)
-        elif arg.startswith("--target="):
-            args["target"] = arg.split("=", 1)[1]
-        elif arg == "--preset":
-            if i + 1 < len(argv):
-                args["preset"] = argv[i + 1]
-                i += 1
-            else:
-                print("ERROR: --preset requires a value (minimal|standard|full)")
+        else:
+            name, eq, value = arg.partition("=")
+            if eq and name in _VALUE_FLAGS:
+                args[_VALUE_FLAGS[name][0]] = value
+            elif arg.startswith("--"):
+                print(f"ERROR: Unknown option: {arg}")
                 sys.exit(1)
-        elif arg.startswith("--preset="):
-            args["preset"] = arg.split("=", 1)[1]
-        elif arg.startswith("--"):
-            print(f"ERROR: Unknown option: {arg}")
-            sys.exit(1)
         i += 1
     return args
 
@@ -17,13 +17,15 @@ Usage:
 
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
-# Add .memory/ to import path
-_SCRIPT_DIR = Path(__file__).resolve().parent
-_MEMORY_DIR = _SCRIPT_DIR.parent
-sys.path.insert(0, str(_MEMORY_DIR))
+# Add .memory/ to import path (os.path: one realpath() call, no
+# intermediate Path objects on the startup path)
+_MEMORY_DIR_STR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_MEMORY_DIR = Path(_MEMORY_DIR_STR)
+sys.path.insert(0, _MEMORY_DIR_STR)
 
 from lib.reasoning import (
     build_reasoning_report,
@@ -32,8 +34,20 @@ from lib.reasoning import (
     suggest_syntheses,
     assess_risks,
 )
-from lib.auto_verify import _load_entries_latest_wins
+from lib.snapshot_cache import load_entries_cached
 from lib.llm_provider import create_llm_provider
+from lib.prompt_cache import with_response_cache
+
+
+# Boolean flags → args key
+_FLAGS = {
+    "--help": "help",
+    "-h": "help",
+    "--correlations": "correlations",
+    "--contradictions": "contradictions",
+    "--syntheses": "syntheses",
+    "--no-llm": "no_llm",
+}
 
 
 def _parse_args(argv: list) -> dict:
@@ -49,14 +63,8 @@ def _parse_args(argv: list) -> dict:
     i = 0
     while i < len(argv):
         arg = argv[i]
-        if arg in ("--help", "-h"):
-            args["help"] = True
-        elif arg == "--correlations":
-            args["correlations"] = True
-        elif arg == "--contradictions":
-            args["contradictions"] = True
-        elif arg == "--syntheses":
-            args["syntheses"] = True
+        if arg in _FLAGS:
+            args[_FLAGS[arg]] = True
         elif arg == "--risks":
             # Next argument is the query string
             if i + 1 < len(argv) and not argv[i + 1].startswith("--"):
@@ -64,8 +72,6 @@ def _parse_args(argv: list) -> dict:
                 i += 1
             else:
                 args["risks"] = ""
-        elif arg == "--no-llm":
-            args["no_llm"] = True
         elif arg.startswith("--"):
             print(f"ERROR: Unknown option: {arg}")
             sys.exit(1)
@@ -80,7 +86,11 @@ def _get_llm_provider(config: dict, no_llm: bool):
     reasoning_config = config.get("reasoning", {})
     if not reasoning_config.get("enabled", False):
         return None
-    return create_llm_provider(reasoning_config)
+    return with_response_cache(
+        create_llm_provider(reasoning_config),
+        reasoning_config,
+        _MEMORY_DIR / "cache",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -139,22 +149,26 @@ def _print_syntheses(report):
     print(f"\n  Duration: {report.duration_ms:.0f}ms")
 
 
+# Icon and tag printed before each risk annotation, by risk level
+_LEVEL_LABELS = {
+    "high": "🔴 [HIGH]",
+    "medium": "🟡 [MEDIUM]",
+    "low": "🟢 [LOW]",
+    "info": "ℹ️  [INFO]",
+}
+
+
 def _print_risks(report):
     """Print risk assessment."""
     print(f"Risk Assessment  [{report.mode}]")
     print(f"  Query: {report.query}")
     print(f"  Annotations: {len(report.annotations)}")
 
-    level_icons = {
-        "high": "🔴",
-        "medium": "🟡",
-        "low": "🟢",
-        "info": "ℹ️ ",
-    }
-
     for ann in report.annotations:
-        icon = level_icons.get(ann.risk_level, "?")
-        print(f"\n  {icon} [{ann.risk_level.upper()}] {ann.entry_id}")
+        label = _LEVEL_LABELS.get(ann.risk_level)
+        if label is None:
+            label = f"? [{ann.risk_level.upper()}]"
+        print(f"\n  {label} {ann.entry_id}")
         print(f"     {ann.annotation}")
         if ann.related_entry_ids:
             print(f"     Related: {', '.join(ann.related_entry_ids)}")
@@ -210,18 +224,29 @@ def main():
         print(__doc__.strip())
         sys.exit(0)
 
+    # Reports are printed line by line; on a terminal stdout is
+    # line-buffered, i.e. one write() per line.  Buffer them instead —
+    # the buffer is flushed at exit.
+    if sys.stdout.isatty() and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     # Resolve paths
     project_root = _MEMORY_DIR.parent
     events_path = _MEMORY_DIR / "events.jsonl"
 
     # Load config
     config_path = _MEMORY_DIR / "config.json"
-    config = {}
-    if config_path.exists():
+    try:
         config = json.loads(config_path.read_text())
-
-    # Check for events
-    if not events_path.exists() or events_path.stat().st_size <= 1:
+    except FileNotFoundError:
+        config = {}
+
+    # Check for events (one stat covers existence and size)
+    try:
+        events_size = os.stat(events_path).st_size
+    except FileNotFoundError:
+        events_size = 0
+    if events_size <= 1:
         print("No entries in events.jsonl. Nothing to analyze.")
         sys.exit(0)
 
@@ -230,16 +255,17 @@ def main():
     mode_label = "heuristic" if llm_provider is None else "LLM-enriched"
 
     # Load entries for sub-commands
-    entries = _load_entries_latest_wins(events_path)
+    entries = load_entries_cached(events_path)
     active = {eid: e for eid, e in entries.items() if not e.get("deprecated", False)}
 
     if llm_provider is None and not args["no_llm"]:
         reasoning_cfg = config.get("reasoning", {})
         if not reasoning_cfg.get("enabled", False):
             print("Note: LLM reasoning disabled (reasoning.enabled=false in config)."
-                  " Running in heuristic-only mode.\n")
+                  " Running in heuristic-only mode.\n", flush=True)
         else:
-            print("Note: LLM provider not available. Running in heuristic-only mode.\n")
+            print("Note: LLM provider not available. Running in heuristic-only mode.\n",
+                  flush=True)
 
     # --- Mode: --correlations ---
     if args["correlations"]:
@@ -261,15 +287,8 @@ def main():
 
     # --- Mode: --risks "query" ---
     if args["risks"] is not None:
-        from dataclasses import dataclass
-
-        @dataclass
-        class _SimpleResult:
-            entry_id: str
-
         query = args["risks"] or "general"
-        results = [_SimpleResult(entry_id=eid) for eid in active]
-        report = assess_risks(query, results, active, config, llm_provider=llm_provider)
+        report = assess_risks(query, list(active), active, config, llm_provider=llm_provider)
         _print_risks(report)
         sys.exit(0)
 
@@ -277,6 +296,7 @@ def main():
     report = build_reasoning_report(
         events_path, config, project_root,
         llm_provider=llm_provider,
+        _preloaded_entries=entries,
     )
     _print_reasoning_report(report)
 
@@ -15,14 +15,19 @@ Usage:
 
 import json
 import logging
+import os
+import re
 import sys
 from pathlib import Path
 
-# Add .memory/ to import path
-_SCRIPT_DIR = Path(__file__).resolve().parent
-_MEMORY_DIR = _SCRIPT_DIR.parent
-sys.path.insert(0, str(_MEMORY_DIR))
+# Add .memory/ to import path (os.path: one realpath() call, no
+# intermediate Path objects on the startup path)
+_MEMORY_DIR_STR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_MEMORY_DIR = Path(_MEMORY_DIR_STR)
+sys.path.insert(0, _MEMORY_DIR_STR)
 
+from lib.config_presets import load_config_cached
+from lib.events_io import get_orjson
 from lib.scanner import (
     batch_validate,
     batch_write,
@@ -30,6 +35,20 @@ from lib.scanner import (
 )
 
 
+# Boolean flags → args key
+_FLAGS = {
+    "--help": "help",
+    "-h": "help",
+    "--json": "json",
+}
+
+# Options taking a value (``--opt value`` or ``--opt=value``) →
+# (args key, error printed when the value is missing)
+_VALUE_FLAGS = {
+    "--pattern": ("pattern", "ERROR: --pattern requires a value"),
+}
+
+
 def _parse_args(argv: list) -> dict:
     """Simple argument parser."""
     args = {
@@ -43,24 +62,25 @@ def _parse_args(argv: list) -> dict:
     i = 0
     while i < len(argv):
         arg = argv[i]
-        if arg in ("--help", "-h"):
-            args["help"] = True
-        elif arg == "--json":
-            args["json"] = True
-        elif arg == "--pattern":
+        if arg in _FLAGS:
+            args[_FLAGS[arg]] = True
+        elif arg in _VALUE_FLAGS:
+            key, missing = _VALUE_FLAGS[arg]
             if i + 1 < len(argv):
-                args["pattern"] = argv[i + 1]
+                args[key] = argv[i + 1]
                 i += 1
             else:
-                print("ERROR: --pattern requires a value")
+                print(missing)
                 sys.exit(1)
-        elif arg.startswith("--pattern="):
-            args["pattern"] = arg.split("=", 1)[1]
-        elif arg.startswith("--"):
-            print(f"ERROR: Unknown option: {arg}")
-            sys.exit(1)
         else:
-            positionals.append(arg)
+            name, eq, value = arg.partition("=")
+            if eq and name in _VALUE_FLAGS:
+                args[_VALUE_FLAGS[name][0]] = value
+            elif arg.startswith("--"):
+                print(f"ERROR: Unknown option: {arg}")
+                sys.exit(1)
+            else:
+                positionals.append(arg)
         i += 1
 
     if positionals:
@@ -70,14 +90,12 @@ def _parse_args(argv: list) -> dict:
 
 
 def _load_config() -> dict:
-    """Load EF Memory config."""
-    config_path = _MEMORY_DIR / "config.json"
-    if config_path.exists():
-        try:
-            return json.loads(config_path.read_text())
-        except (json.JSONDecodeError, OSError) as exc:
-            print(f"WARNING: Could not parse config.json: {exc}", file=sys.stderr)
-    return {}
+    """Load EF Memory config (presets resolved); ``{}`` if it is unusable."""
+    try:
+        return load_config_cached(_MEMORY_DIR / "config.json")
+    except (ValueError, OSError) as exc:
+        print(f"WARNING: Could not parse config.json: {exc}", file=sys.stderr)
+        return {}
 
 
 def _resolve_project_root() -> Path:
@@ -85,16 +103,72 @@ def _resolve_project_root() -> Path:
     return _MEMORY_DIR.parent
 
 
-def _read_entries_from_stdin() -> list:
-    """Read JSON array of entries from stdin."""
+# Rough encoded size of one discover document (paths, snippet, indent)
+_DOC_JSON_BYTES = 400
+
+# 19+ digit runs may be integers beyond 64 bits, which orjson decodes as
+# floats; such input (or a digit run inside a string) is parsed by stdlib
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _print_json(output: dict, size_hint: int = 0) -> None:
+    """Print *output* as 2-space indented JSON for Claude to parse.
+
+    ``json.dumps`` falls back to its pure-Python encoder whenever
+    ``indent`` is set, so large outputs are encoded with ``orjson`` (same
+    layout, written as bytes) when it is installed.  *size_hint* is the
+    expected output size; as elsewhere, small outputs stay on stdlib json
+    rather than pay the orjson import (see events_io.get_orjson).  Callers
+    only pass a hint for data that cannot hold NaN/Infinity or integers
+    beyond 64 bits, where the two encoders would differ.
+    """
+    orjson = get_orjson(size_hint)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json.dumps(output, indent=2, ensure_ascii=False))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n")
+    buffer.flush()
+
+
+def _loads(data: bytes) -> tuple:
+    """Parse JSON *data*; returns ``(value, decoded_by_orjson)``.
+
+    orjson is used for large payloads without long digit runs.  Anything
+    it rejects (a BOM, NaN, invalid JSON) is re-parsed with stdlib json.
+    """
+    orjson = get_orjson(len(data))
+    if orjson is not None and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data), True
+        except ValueError:
+            pass  # stdlib json is more lenient and words the error
+    return json.loads(data), False
+
+
+def _read_entries_from_stdin() -> tuple:
+    """Read JSON array of entries from stdin.
+
+    Large inputs are parsed from the raw bytes with ``orjson`` when
+    installed, skipping the text decode (see _loads).
+
+    Returns:
+        ``(entries, orjson_size)``: *orjson_size* is the input size when
+        orjson decoded it (so the entries hold no NaN/Infinity or huge
+        integers and may be echoed through orjson), else 0.
+    """
+    stream = getattr(sys.stdin, "buffer", sys.stdin)
     try:
-        data = sys.stdin.read()
-        entries = json.loads(data)
+        data = stream.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        entries, by_orjson = _loads(data)
         if not isinstance(entries, list):
             print("ERROR: Expected JSON array of entries on stdin", file=sys.stderr)
             sys.exit(1)
-        return entries
-    except json.JSONDecodeError as e:
+        return entries, (len(data) if by_orjson else 0)
+    except ValueError as e:  # JSONDecodeError, or bytes that are not UTF-8
         print(f"ERROR: Invalid JSON on stdin: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -130,7 +204,7 @@ def cmd_discover(args: dict) -> None:
                 for d in report.documents
             ],
         }
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        _print_json(output, len(report.documents) * _DOC_JSON_BYTES)
     else:
         # Human-readable table
         print(f"\nEF Memory — Document Scanner")
@@ -155,7 +229,7 @@ def cmd_discover(args: dict) -> None:
 
 def cmd_validate(args: dict) -> None:
     """Validate entries from stdin."""
-    entries = _read_entries_from_stdin()
+    entries, orjson_size = _read_entries_from_stdin()
     config = _load_config()
     project_root = _resolve_project_root()
     events_path = project_root / ".memory" / "events.jsonl"
@@ -188,12 +262,13 @@ def cmd_validate(args: dict) -> None:
             for entry, val in result.invalid
         ],
     }
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    # Echoes the input entries, so it is about as large as the input
+    _print_json(output, orjson_size)
 
 
 def cmd_commit(args: dict) -> None:
     """Write entries from stdin and run pipeline."""
-    entries = _read_entries_from_stdin()
+    entries, _orjson_size = _read_entries_from_stdin()
     config = _load_config()
     project_root = _resolve_project_root()
     events_path = project_root / ".memory" / "events.jsonl"
@@ -232,7 +307,7 @@ def cmd_commit(args: dict) -> None:
             "steps_failed": pipeline_report.steps_failed,
         }
 
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    _print_json(output)
 
 
 # ---------------------------------------------------------------------------
@@ -268,12 +268,17 @@ def main():
             from lib.reasoning import annotate_search_results
             from lib.auto_verify import _load_entries_latest_wins
             from lib.llm_provider import create_llm_provider
+            from lib.prompt_cache import with_response_cache
 
             entries = _load_entries_latest_wins(events_path)
             reasoning_config = config.get("reasoning", {})
             llm_prov = None
             if reasoning_config.get("enabled", False):
-                llm_prov = create_llm_provider(reasoning_config)
+                llm_prov = with_response_cache(
+                    create_llm_provider(reasoning_config),
+                    reasoning_config,
+                    _MEMORY_DIR / "cache",
+                )
 
             annotations = annotate_search_results(
                 report.results, entries, config,
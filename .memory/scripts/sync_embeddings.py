@@ -50,6 +50,7 @@ def main():
 
     config = json.loads(config_path.read_text())
     embedding_config = config.get("embedding", {})
+    sync_config = embedding_config.get("sync", {})
 
     # Resolve DB path (relative to project root, not memory dir)
     project_root = _MEMORY_DIR.parent
@@ -88,7 +89,10 @@ def main():
             vectordb=vectordb,
             embedder=None,
             force_full=force_full,
-            batch_size=embedding_config.get("sync", {}).get("batch_size", 20),
+            batch_size=sync_config.get("batch_size", 20),
+            concurrency=sync_config.get("concurrency", 4),
+            max_batch_chars=sync_config.get("max_batch_chars", 200_000),
+            quantize=embedding_config.get("storage", {}).get("quantize", False),
         )
         _print_report(report)
         vectordb.close()
@@ -109,7 +113,10 @@ def main():
         vectordb=vectordb,
         embedder=embedder,
         force_full=force_full,
-        batch_size=embedding_config.get("sync", {}).get("batch_size", 20),
+        batch_size=sync_config.get("batch_size", 20),
+        concurrency=sync_config.get("concurrency", 4),
+        max_batch_chars=sync_config.get("max_batch_chars", 200_000),
+        quantize=embedding_config.get("storage", {}).get("quantize", False),
     )
 
     _print_report(report)
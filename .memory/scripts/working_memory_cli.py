@@ -16,13 +16,15 @@ Usage:
 
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
-# Add .memory/ to import path
-_SCRIPT_DIR = Path(__file__).resolve().parent
-_MEMORY_DIR = _SCRIPT_DIR.parent
-sys.path.insert(0, str(_MEMORY_DIR))
+# Add .memory/ to import path (os.path: one realpath() call, no
+# intermediate Path objects on the startup path)
+_MEMORY_DIR_STR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_MEMORY_DIR = Path(_MEMORY_DIR_STR)
+sys.path.insert(0, _MEMORY_DIR_STR)
 
 from lib.working_memory import (
     clear_session,
@@ -34,6 +36,9 @@ from lib.working_memory import (
 )
 
 
+_COMMANDS = frozenset(("start", "resume", "status", "harvest", "clear", "read-plan"))
+
+
 def _parse_args(argv: list) -> dict:
     """Simple argument parser."""
     args = {
@@ -52,7 +57,7 @@ def _parse_args(argv: list) -> dict:
             return args
 
     cmd = argv[0]
-    if cmd in ("start", "resume", "status", "harvest", "clear", "read-plan"):
+    if cmd in _COMMANDS:
         args["command"] = cmd
     else:
         print(f"ERROR: Unknown command: {cmd}")
@@ -8,8 +8,11 @@ Run from project root:
 """
 
 import sys
+import json
 import math
 import hashlib
+import functools
+import operator
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
@@ -87,7 +90,11 @@ SAMPLE_ENTRIES = [
 ]
 
 
-@dataclass
+# Same as lib.scanner: slots where the running Python supports them
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class _EmbeddingResult:
     vector: List[float]
     model: str
@@ -132,23 +139,40 @@ class MockEmbedder:
 
     def _text_to_vector(self, text: str) -> List[float]:
         """Generate a deterministic vector from text using simple hashing."""
-        h = hashlib.sha256(text.encode()).digest()
-        vec = [0.0] * self._dims
-        for i in range(self._dims):
-            byte_idx = i % len(h)
-            vec[i] = (h[byte_idx] - 128) / 128.0
-            vec[i] += (i % 7 - 3) * 0.01
-        norm = math.sqrt(sum(v * v for v in vec))
-        if norm > 0:
-            vec = [v / norm for v in vec]
-        return vec
+        # A fresh list per call: callers may mutate their vectors
+        return list(_compute_vector(text, self._dims))
+
+
+# Module-level so the cache is shared by every MockEmbedder instance —
+# the suite embeds the same sample entries over and over.
+@functools.lru_cache(maxsize=4096)
+def _compute_vector(text: str, dims: int) -> Tuple[float, ...]:
+    """
+    Normalized vector whose component i is
+    ``(h[i % 32] - 128) / 128 + (i % 7 - 3) * 0.01`` for h = sha256(text),
+    built from the tiled digest and a cached ramp with ``map`` instead of
+    a per-component Python loop.
+    """
+    h = hashlib.sha256(text.encode()).digest()
+    tiled = [(b - 128) / 128.0 for b in h] * -(-dims // len(h))
+    vec = list(map(operator.add, tiled, _vector_ramp(dims)))
+    norm = math.sqrt(sum(map(operator.mul, vec, vec)))
+    if norm > 0:
+        return tuple(v / norm for v in vec)
+    return tuple(vec)
+
+
+@functools.lru_cache(maxsize=None)
+def _vector_ramp(dims: int) -> Tuple[float, ...]:
+    """The ``(i % 7 - 3) * 0.01`` offsets MockEmbedder adds to each component."""
+    return tuple((i % 7 - 3) * 0.01 for i in range(dims))
 
 
 # ---------------------------------------------------------------------------
 # Mock LLM Provider (M6)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class _LLMResponse:
     """Mirrors lib.llm_provider.LLMResponse for test independence."""
     text: str
@@ -163,6 +187,8 @@ class MockLLMProvider:
 
     def __init__(self, responses: Optional[Dict[str, str]] = None):
         self._responses = responses or {}
+        # (lowercased keyword, response) in match order
+        self._keywords = [(k.lower(), v) for k, v in self._responses.items()]
         self._default_response = '{"result": "mock analysis"}'
         self._call_count = 0
         self._calls: List[Tuple[str, str]] = []
@@ -183,9 +209,10 @@ class MockLLMProvider:
     ) -> _LLMResponse:
         self._call_count += 1
         self._calls.append((system_prompt, user_prompt))
-        # Match response by keyword in user_prompt
-        for keyword, response_text in self._responses.items():
-            if keyword.lower() in user_prompt.lower():
+        # Match response by keyword in user_prompt (first keyword wins)
+        prompt = user_prompt.lower()
+        for keyword, response_text in self._keywords:
+            if keyword in prompt:
                 text = response_text
                 break
         else:
@@ -194,8 +221,9 @@ class MockLLMProvider:
             text=text,
             model="mock-llm-v1",
             provider="mock",
-            input_tokens=len(user_prompt.split()),
-            output_tokens=len(text.split()),
+            # ~4 characters per token, as tokenizer-less estimates go
+            input_tokens=max(1, len(user_prompt) // 4),
+            output_tokens=max(1, len(text) // 4),
         )
 
 
@@ -262,3 +290,10 @@ SAMPLE_ENTRIES_EXTENDED = SAMPLE_ENTRIES + [
         "_meta": {},
     },
 ]
+
+# The sample corpora as events.jsonl content, serialized once for the
+# many tests that write them out unchanged
+SAMPLE_ENTRIES_JSONL = "".join(json.dumps(e) + "\n" for e in SAMPLE_ENTRIES).encode("utf-8")
+SAMPLE_ENTRIES_EXTENDED_JSONL = "".join(
+    json.dumps(e) + "\n" for e in SAMPLE_ENTRIES_EXTENDED
+).encode("utf-8")
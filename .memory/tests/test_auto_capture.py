@@ -148,6 +148,16 @@ class TestCreateDraft(unittest.TestCase):
         self.assertTrue(new_dir.exists())
         self.assertTrue(info.path.exists())
 
+    def test_name_collision_gets_suffix(self):
+        from lib.auto_capture import _write_new_draft
+        self.drafts_dir.mkdir()
+        paths = [_write_new_draft(self.drafts_dir, "20260101_000000_t", b"{}\n") for _ in range(3)]
+        self.assertEqual(
+            [p.name for p in paths],
+            ["20260101_000000_t.json", "20260101_000000_t_001.json", "20260101_000000_t_002.json"],
+        )
+        self.assertTrue(all(p.read_bytes() == b"{}\n" for p in paths))
+
     def test_entry_preserved_in_file(self):
         entry = _make_valid_entry()
         info = create_draft(entry, self.drafts_dir)
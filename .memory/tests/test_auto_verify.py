@@ -462,6 +462,54 @@ class TestCheckDuplicates(unittest.TestCase):
         r = check_duplicates(candidate, self.events_path)
         self.assertFalse(r.is_duplicate)
 
+    def test_dedup_texts_cache_filled_and_reused(self):
+        existing = _make_valid_entry()
+        preloaded = {existing["id"]: existing}
+        texts = {}
+        candidate = _make_valid_entry(id="lesson-inc036-eeeeeeee")
+        r1 = check_duplicates(candidate, self.events_path, _preloaded_entries=preloaded, _dedup_texts=texts)
+        self.assertIn(existing["id"], texts)
+        texts[existing["id"]] = "something else entirely"
+        r2 = check_duplicates(candidate, self.events_path, _preloaded_entries=preloaded, _dedup_texts=texts)
+        self.assertTrue(r1.is_duplicate)
+        self.assertFalse(r2.is_duplicate)
+
+    def test_bounds_match_full_ratio(self):
+        """The length / quick_ratio prefilters never change the result."""
+        import difflib
+        from lib.text_builder import build_dedup_text
+        titles = [
+            "Shift before rolling",
+            "Shift before rolling windows",
+            "Always shift before computing rolling windows on time series",
+            "Rolling before shift leaks future data",
+            "Unrelated note about cache TTLs",
+        ]
+        prior = {f"e{i}": {"id": f"e{i}", "title": t} for i, t in enumerate(titles)}
+        candidate = {"id": "cand", "title": "Shift before rolling window"}
+        cand_text = build_dedup_text(candidate)
+        for threshold in (0.3, 0.5, 0.7, 0.85, 0.95):
+            expected = sorted(
+                (
+                    (eid, round(r, 4)) for eid, e in prior.items()
+                    if (r := difflib.SequenceMatcher(
+                        None, cand_text, build_dedup_text(e)).ratio()) >= threshold
+                ),
+                key=lambda x: x[1], reverse=True,
+            )
+            r = check_duplicates(candidate, self.events_path, threshold=threshold,
+                                 _preloaded_entries=prior)
+            self.assertEqual(r.similar_entries, expected, threshold)
+
+    def test_preloaded_accepts_any_mapping(self):
+        from collections import ChainMap
+        existing = _make_valid_entry()
+        candidate = _make_valid_entry(id="lesson-inc036-ffffffff")
+        prior = ChainMap({}, {existing["id"]: existing})
+        r = check_duplicates(candidate, self.events_path, _preloaded_entries=prior)
+        self.assertTrue(r.is_duplicate)
+        self.assertEqual(r.similar_entries[0][0], existing["id"])
+
 
 # ---------------------------------------------------------------------------
 # TestCheckVerifyCommand
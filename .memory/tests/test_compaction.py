@@ -187,6 +187,21 @@ class TestCompact(unittest.TestCase):
         ids = {e["id"] for e in result}
         self.assertEqual(ids, {"a", "b"})
 
+    def test_rewrite_keeps_canonical_line_format(self):
+        """Kept and archived lines are the stdlib json form, orjson or not."""
+        keep = _make_entry("a", title="缓存失效", created_at="2026-01-01T10:00:00Z")
+        old = _make_entry("b", deprecated=True, created_at="2026-01-02T10:00:00Z")
+        _write_events(self.events_path, [keep, old])
+        original = self.events_path.read_bytes().splitlines(keepends=True)
+
+        fake_orjson = unittest.mock.MagicMock()
+        with unittest.mock.patch("lib.events_io.get_orjson", return_value=fake_orjson):
+            compact(self.events_path, self.archive_dir, self.config)
+
+        fake_orjson.dumps.assert_not_called()
+        self.assertEqual(self.events_path.read_bytes(), original[0])
+        self.assertEqual((self.archive_dir / "events_2026Q1.jsonl").read_bytes(), original[1])
+
     def test_idempotent(self):
         """Compacting already-compact file produces no change."""
         entries = [
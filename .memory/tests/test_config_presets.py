@@ -10,6 +10,7 @@ from lib.config_presets import (
     _deep_merge,
     describe_preset,
     load_config,
+    load_config_cached,
     resolve_config,
 )
 
@@ -174,6 +175,51 @@ class TestLoadConfig:
         assert result == data
 
 
+class TestLoadConfigCached:
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_config_cached(tmp_path / "nonexistent.json") == {}
+
+    def test_same_result_as_load_config(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        cfg.write_text(json.dumps({"preset": "standard"}))
+        assert load_config_cached(cfg) == load_config(cfg)
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        cfg.write_text(json.dumps({"version": "1.5"}))
+        first = load_config_cached(cfg)
+        second = load_config_cached(cfg)
+        assert first is second
+
+    def test_changed_file_reparsed(self, tmp_path):
+        cfg = tmp_path / "config.json"
+        cfg.write_text(json.dumps({"version": "1.5"}))
+        load_config_cached(cfg)
+        cfg.write_text(json.dumps({"version": "2.0", "preset": "full"}))
+        result = load_config_cached(cfg)
+        assert result["version"] == "2.0"
+        assert result["reasoning"]["enabled"] is True
+
+
+class TestCliLoadConfig:
+    """scan_cli / compact_cli degrade to ``{}`` on an unusable config."""
+
+    @pytest.mark.parametrize("script", ["scan_cli", "compact_cli"])
+    def test_unknown_preset_warns_and_returns_empty(self, script, tmp_path, monkeypatch, capsys):
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(
+            script, Path(__file__).resolve().parent.parent / "scripts" / f"{script}.py",
+        )
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+
+        (tmp_path / "config.json").write_text(json.dumps({"preset": "bogus"}))
+        monkeypatch.setattr(mod, "_MEMORY_DIR", tmp_path)
+
+        assert mod._load_config() == {}
+        assert "Unknown preset 'bogus'" in capsys.readouterr().err
+
+
 # ---------------------------------------------------------------------------
 # describe_preset
 # ---------------------------------------------------------------------------
@@ -11,14 +11,22 @@ Run:
 import json
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # Ensure .memory/ is on the import path so 'lib' is importable
 _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.events_io import load_events_latest_wins
+from lib import events_io
+from lib.events_io import (
+    append_events,
+    append_lines,
+    load_events_latest_wins,
+    serialize_entry,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -26,24 +34,20 @@ from lib.events_io import load_events_latest_wins
 # ---------------------------------------------------------------------------
 
 def _make_entry(entry_id, title="Test entry", **kwargs):
-    """Create a minimal valid entry dict."""
-    entry = {"id": entry_id, "type": "lesson", "title": title}
-    entry.update(kwargs)
-    return entry
+    """Create a minimal valid entry dict ("id" first, as our serializers write it)."""
+    return {"id": entry_id, "type": "lesson", "title": title, **kwargs}
 
 
 def _write_jsonl(path, lines):
-    """Write a list of strings (raw lines) to a file."""
-    with open(path, "w", encoding="utf-8") as f:
-        for line in lines:
-            f.write(line + "\n")
+    """Write a list of strings (raw lines) to a file; return its size in bytes."""
+    payload = "".join(line + "\n" for line in lines).encode("utf-8")
+    path.write_bytes(payload)
+    return len(payload)
 
 
 def _write_entries(path, entries):
-    """Write a list of entry dicts as JSONL."""
-    with open(path, "w", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(json.dumps(entry) + "\n")
+    """Write a list of entry dicts as JSONL; return the file size in bytes."""
+    return _write_jsonl(path, [json.dumps(entry) for entry in entries])
 
 
 # ---------------------------------------------------------------------------
@@ -183,6 +187,35 @@ class TestStartLineAndTrackLines:
         assert entries["line-1"]["_line"] == 1
         assert entries["line-2"]["_line"] == 2
 
+    def test_line_map_leaves_entries_untouched(self, tmp_path):
+        """line_map reports line indices without adding keys to entries."""
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [
+            _make_entry("a", title="v1"),
+            _make_entry("b"),
+            _make_entry("a", title="v2"),
+        ])
+
+        line_map = {}
+        entries, _, _ = load_events_latest_wins(events_file, line_map=line_map)
+
+        assert line_map == {"a": 2, "b": 1}
+        assert "_line" not in entries["a"]
+        assert "_line" not in entries["b"]
+
+    def test_line_map_empty_in_byte_offset_mode(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [_make_entry("a"), _make_entry("b")])
+        offset = len(events_file.read_bytes().split(b"\n")[0]) + 1
+
+        line_map = {}
+        entries, _, _ = load_events_latest_wins(
+            events_file, byte_offset=offset, line_map=line_map,
+        )
+
+        assert set(entries) == {"b"}
+        assert line_map == {}
+
 
 # ---------------------------------------------------------------------------
 # Tests — Byte offset path
@@ -198,9 +231,8 @@ class TestByteOffset:
         e2 = _make_entry("old-2", title="Already synced too")
 
         # Write initial entries
-        _write_entries(events_file, [e1, e2])
         # Record the byte offset after initial entries
-        initial_size = events_file.stat().st_size
+        initial_size = _write_entries(events_file, [e1, e2])
 
         # Append new entries
         with open(events_file, "a", encoding="utf-8") as f:
@@ -237,6 +269,34 @@ class TestByteOffset:
         # end_offset should still reflect file size
         assert end_offset == events_file.stat().st_size
 
+    def test_byte_offset_past_end(self, tmp_path):
+        """A stale cursor beyond EOF (e.g. after compaction) yields no entries."""
+        events_file = tmp_path / "events.jsonl"
+        size = _write_entries(events_file, [_make_entry("a")])
+
+        entries, total_lines, end_offset = load_events_latest_wins(
+            events_file, byte_offset=size + 100
+        )
+
+        assert entries == {}
+        assert end_offset == size
+
+    def test_byte_offset_count_lines(self, tmp_path):
+        """count_lines=True reports the whole-file line count in byte-offset mode."""
+        events_file = tmp_path / "events.jsonl"
+        offset = _write_entries(events_file, [_make_entry("a"), _make_entry("b")])
+        with open(events_file, "a", encoding="utf-8") as f:
+            f.write("\n")
+            f.write(json.dumps(_make_entry("c")))  # no trailing newline
+
+        entries, total_lines, end_offset = load_events_latest_wins(
+            events_file, byte_offset=offset, count_lines=True
+        )
+
+        assert set(entries.keys()) == {"c"}
+        assert total_lines == 4
+        assert end_offset == events_file.stat().st_size
+
 
 # ---------------------------------------------------------------------------
 # Tests — Invalid / malformed data handling
@@ -317,6 +377,32 @@ class TestInvalidData:
         assert set(entries.keys()) == {"ok-1", "ok-2", "ok-3"}
         assert total_lines == 7
 
+    def test_invalid_utf8_line_skipped(self, tmp_path):
+        """A line with undecodable bytes is skipped, not fatal."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_bytes(
+            json.dumps(_make_entry("ok-1")).encode() + b"\n"
+            + b'{"id": "bad-\xff"}\n'
+            + json.dumps(_make_entry("ok-2")).encode() + b"\n"
+        )
+
+        entries, total_lines, end_offset = load_events_latest_wins(events_file)
+
+        assert set(entries.keys()) == {"ok-1", "ok-2"}
+        assert total_lines == 3
+
+    def test_last_line_without_newline_counted(self, tmp_path):
+        """A final line without trailing newline is still parsed and counted."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_text(
+            json.dumps(_make_entry("e1")) + "\n" + json.dumps(_make_entry("e2"))
+        )
+
+        entries, total_lines, end_offset = load_events_latest_wins(events_file)
+
+        assert set(entries.keys()) == {"e1", "e2"}
+        assert total_lines == 2
+
 
 # ---------------------------------------------------------------------------
 # Tests — End byte offset
@@ -328,12 +414,11 @@ class TestEndByteOffset:
     def test_end_byte_offset_correct(self, tmp_path):
         """Returned offset matches file size."""
         events_file = tmp_path / "events.jsonl"
-        _write_entries(events_file, [
+        expected_size = _write_entries(events_file, [
             _make_entry("x1"),
             _make_entry("x2"),
             _make_entry("x3"),
         ])
-        expected_size = events_file.stat().st_size
 
         entries, total_lines, end_offset = load_events_latest_wins(events_file)
 
@@ -361,6 +446,38 @@ class TestErrorHandling:
         assert total_lines == 0
         assert end_offset == 0
 
+    def test_gc_state_restored(self, tmp_path):
+        """GC is paused only for the load, also when open() fails."""
+        import gc
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [_make_entry("e1")])
+
+        assert gc.isenabled()
+        load_events_latest_wins(events_file)
+        assert gc.isenabled()
+        with patch("builtins.open", side_effect=OSError("Permission denied")):
+            load_events_latest_wins(events_file)
+        assert gc.isenabled()
+
+        gc.disable()
+        try:
+            load_events_latest_wins(events_file)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_small_read_does_not_import_orjson(self, tmp_path, monkeypatch):
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [_make_entry("e1")])
+        monkeypatch.setattr(events_io, "_orjson_checked", False)
+        monkeypatch.delitem(sys.modules, "orjson", raising=False)
+
+        with patch("builtins.__import__", side_effect=AssertionError("imported")):
+            entries, _, _ = load_events_latest_wins(events_file)
+
+        assert list(entries) == ["e1"]
+        assert events_io._orjson_checked is False
+
 
 # ---------------------------------------------------------------------------
 # Tests — Large file
@@ -399,13 +516,13 @@ class TestIncrementalSync:
             _make_entry("phase1-a", title="Initial A"),
             _make_entry("phase1-b", title="Initial B"),
         ]
-        _write_entries(events_file, initial_entries)
+        initial_size = _write_entries(events_file, initial_entries)
 
         entries1, total_lines1, offset1 = load_events_latest_wins(events_file)
 
         assert len(entries1) == 2
         assert total_lines1 == 2
-        assert offset1 == events_file.stat().st_size
+        assert offset1 == initial_size
 
         # Phase 2: Append new entries
         with open(events_file, "a", encoding="utf-8") as f:
@@ -427,3 +544,148 @@ class TestIncrementalSync:
         assert offset2 == events_file.stat().st_size
         # The new offset should be larger than the old one
         assert offset2 > offset1
+
+
+# ---------------------------------------------------------------------------
+# Tests — Deferred decoding of superseded lines
+# ---------------------------------------------------------------------------
+
+class TestDeferredDecoding:
+    """Lines are indexed by raw id; only the winners are decoded."""
+
+    def test_invalid_latest_line_keeps_previous_version(self, tmp_path):
+        """A corrupt latest line must not hide the last valid version."""
+        events_file = tmp_path / "events.jsonl"
+        _write_jsonl(events_file, [
+            json.dumps(_make_entry("a", title="good")),
+            '{"id": "a", "title": "truncated',
+        ])
+
+        entries, total_lines, _ = load_events_latest_wins(events_file)
+
+        assert entries["a"]["title"] == "good"
+        assert total_lines == 2
+
+    def test_duplicate_id_key_uses_decoded_id(self, tmp_path):
+        """JSON keeps the last duplicate key, so the decoded id wins."""
+        events_file = tmp_path / "events.jsonl"
+        _write_jsonl(events_file, ['{"id": "raw", "title": "t", "id": "real"}'])
+
+        entries, _, _ = load_events_latest_wins(events_file)
+
+        assert set(entries.keys()) == {"real"}
+
+    def test_escaped_and_unicode_ids(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        _write_jsonl(events_file, [
+            json.dumps(_make_entry('quo"te')),
+            json.dumps(_make_entry("缓存-1"), ensure_ascii=False),
+            json.dumps(_make_entry("缓存-2")),
+        ])
+
+        entries, _, _ = load_events_latest_wins(events_file)
+
+        assert set(entries.keys()) == {'quo"te', "缓存-1", "缓存-2"}
+
+    def test_track_lines_points_at_latest_line(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [
+            _make_entry("a", title="v1"),
+            _make_entry("b"),
+            _make_entry("a", title="v2"),
+        ])
+
+        entries, _, _ = load_events_latest_wins(events_file, track_lines=True)
+
+        assert entries["a"]["_line"] == 2
+        assert entries["a"]["title"] == "v2"
+        assert entries["b"]["_line"] == 1
+
+    def test_compact_and_spaced_lines_mixed(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        _write_jsonl(events_file, [
+            json.dumps(_make_entry("a", title="v1")),
+            json.dumps(_make_entry("a", title="v2"), separators=(",", ":")),
+            json.dumps(_make_entry("b"), separators=(",", ":")),
+        ])
+
+        with patch("lib.events_io.get_orjson", return_value=None), \
+                patch("lib.events_io.json.loads", wraps=json.loads) as loads:
+            entries, _, _ = load_events_latest_wins(events_file)
+
+        assert entries["a"]["title"] == "v2"
+        assert set(entries.keys()) == {"a", "b"}
+        assert loads.call_count == 2  # the superseded line is never decoded
+
+
+# ---------------------------------------------------------------------------
+# Tests — append_events
+# ---------------------------------------------------------------------------
+
+class TestAppendEvents:
+    """Tests for the single-write JSONL appender."""
+
+    def test_creates_file_and_round_trips(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        written = append_events(events_file, [_make_entry("a"), _make_entry("b")])
+
+        entries, total_lines, end_offset = load_events_latest_wins(events_file)
+
+        assert set(entries.keys()) == {"a", "b"}
+        assert total_lines == 2
+        assert written == end_offset == events_file.stat().st_size
+
+    def test_appends_after_existing_content(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        offset = _write_entries(events_file, [_make_entry("a", title="old")])
+
+        append_events(events_file, [_make_entry("a", title="new")])
+
+        entries, _, _ = load_events_latest_wins(events_file, byte_offset=offset)
+        assert entries["a"]["title"] == "new"
+
+    def test_empty_batch_writes_nothing(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        assert append_events(events_file, []) == 0
+        assert not events_file.exists()
+
+    def test_unserializable_entry_leaves_file_untouched(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        _write_entries(events_file, [_make_entry("a")])
+        before = events_file.read_bytes()
+
+        with pytest.raises(TypeError):
+            append_events(events_file, [_make_entry("b"), _make_entry("c", bad=object())])
+
+        assert events_file.read_bytes() == before
+
+    def test_non_ascii_preserved(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        append_events(events_file, [_make_entry("u", title="缓存失效")])
+        assert "缓存失效" in events_file.read_text(encoding="utf-8")
+
+    def test_append_lines_single_payload(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        written = append_lines(events_file, [b'{"id": "a"}', b'{"id": "b"}'])
+
+        assert events_file.read_text() == '{"id": "a"}\n{"id": "b"}\n'
+        assert written == events_file.stat().st_size
+        assert append_lines(events_file, []) == 0
+
+    def test_serialize_entry_round_trips(self):
+        entry = _make_entry("u", title="缓存失效")
+        line = serialize_entry(entry)
+        assert isinstance(line, bytes)
+        assert json.loads(line) == entry
+        assert "缓存失效".encode("utf-8") in line
+
+    def test_serialize_entry_is_canonical_stdlib_form(self):
+        entry = _make_entry("u", title="缓存失效")
+        expected = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        assert serialize_entry(entry) == expected
+        # Identical whether or not orjson is installed or already loaded
+        fake_orjson = MagicMock()
+        with patch("lib.events_io.get_orjson", return_value=fake_orjson), \
+                patch.dict("sys.modules", {"orjson": fake_orjson}):
+            assert serialize_entry(entry) == expected
+        fake_orjson.dumps.assert_not_called()
@@ -18,7 +18,7 @@ from lib.generate_rules import (
     _load_hard_entries,
     _generate_domain_markdown,
 )
-from tests.conftest import SAMPLE_ENTRIES
+from tests.conftest import SAMPLE_ENTRIES, SAMPLE_ENTRIES_JSONL
 
 
 class TestExtractDomain(unittest.TestCase):
@@ -78,9 +78,7 @@ class TestLoadHardEntries(unittest.TestCase):
         self.events_path = Path(self.tmpdir) / "events.jsonl"
 
     def test_filters_hard_only(self):
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         entries, total_scanned = _load_hard_entries(self.events_path)
         # SAMPLE_ENTRIES[0] and [1] are hard, [2] is soft
@@ -156,9 +154,7 @@ class TestGenerateRuleFiles(unittest.TestCase):
         self.events_path = Path(self.tmpdir) / "events.jsonl"
         self.output_dir = Path(self.tmpdir) / "rules" / "ef-memory"
 
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
     def test_generates_domain_files(self):
         report = generate_rule_files(self.events_path, self.output_dir)
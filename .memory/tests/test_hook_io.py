@@ -0,0 +1,80 @@
+"""Tests for hook_io module."""
+
+import io
+import json
+from io import StringIO
+
+import pytest
+
+from lib.hook_io import (
+    STOP_HOOK_ACTIVE_MARKERS,
+    read_hook_input,
+    write_hook_output,
+)
+
+
+class TestReadHookInput:
+    def test_parses_object(self):
+        data = read_hook_input(StringIO('{"stop_hook_active": false}'))
+        assert data == {"stop_hook_active": False}
+
+    def test_oversized_returns_none(self):
+        assert read_hook_input(StringIO('{"k": "' + "x" * 64 + '"}'), max_size=16) is None
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            read_hook_input(StringIO("not json"))
+
+    def test_non_object_raises(self):
+        with pytest.raises(ValueError):
+            read_hook_input(StringIO("[1, 2]"))
+
+    def test_reads_binary_buffer(self):
+        stream = io.TextIOWrapper(io.BytesIO('{"t": "缓存"}'.encode("utf-8")))
+        assert read_hook_input(stream) == {"t": "缓存"}
+
+    def test_large_payload(self):
+        body = "x" * (300 * 1024)
+        assert read_hook_input(StringIO('{"t": "' + body + '"}')) == {"t": body}
+
+    def test_orjson_choice_delegated_to_events_io(self, monkeypatch):
+        sizes = []
+        monkeypatch.setattr("lib.hook_io.get_orjson", lambda size=None: sizes.append(size))
+        assert read_hook_input(StringIO('{"a": 1}')) == {"a": 1}
+        assert sizes == [len(b'{"a": 1}')]
+
+    def test_skip_marker_short_circuits(self):
+        for raw in ('{"stop_hook_active": true}', '{"a":1,"stop_hook_active":true}'):
+            assert read_hook_input(StringIO(raw), skip_markers=STOP_HOOK_ACTIVE_MARKERS) is None
+
+    def test_skip_marker_skips_parsing(self):
+        # Not valid JSON, but the marker is found before parsing
+        raw = StringIO('{"stop_hook_active": true, broken')
+        assert read_hook_input(raw, skip_markers=STOP_HOOK_ACTIVE_MARKERS) is None
+
+    def test_skip_marker_ignores_escaped_text(self):
+        raw = json.dumps({"message": '"stop_hook_active": true', "stop_hook_active": False})
+        data = read_hook_input(StringIO(raw), skip_markers=STOP_HOOK_ACTIVE_MARKERS)
+        assert data["stop_hook_active"] is False
+
+    def test_defaults_to_stdin(self, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO('{"a": 1}'))
+        assert read_hook_input() == {"a": 1}
+
+
+class TestWriteHookOutput:
+    def test_text_stream(self):
+        out = StringIO()
+        write_hook_output({"additionalContext": "a\nb"}, out)
+        assert out.getvalue().endswith("\n")
+        assert json.loads(out.getvalue()) == {"additionalContext": "a\nb"}
+
+    def test_binary_buffer_single_line(self):
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("before\n")
+        write_hook_output({"decision": "block", "reason": "缓存"}, stream)
+        stream.flush()
+        first, second = raw.getvalue().decode("utf-8").splitlines()
+        assert first == "before"
+        assert json.loads(second) == {"decision": "block", "reason": "缓存"}
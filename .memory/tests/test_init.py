@@ -512,11 +512,18 @@ class TestScanProject(unittest.TestCase):
             (Path(tmp) / ".gitignore").write_text("node_modules/\n")
             suggestions = scan_project(Path(tmp))
             self.assertTrue(any(".memory/working/" in s for s in suggestions))
+            self.assertTrue(any(".memory/cache/" in s for s in suggestions))
+
+    def test_gitignore_missing_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / ".gitignore").write_text(".memory/working/\nvectors.db\n")
+            suggestions = scan_project(Path(tmp))
+            self.assertIn("Consider adding to .gitignore: .memory/cache/", suggestions)
 
     def test_gitignore_complete(self):
         with tempfile.TemporaryDirectory() as tmp:
             (Path(tmp) / ".gitignore").write_text(
-                ".memory/working/\nvectors.db\n"
+                ".memory/working/\nvectors.db\n.memory/cache/\n"
             )
             suggestions = scan_project(Path(tmp))
             # Should NOT suggest gitignore additions
@@ -619,6 +626,22 @@ class TestRunInit(unittest.TestCase):
         self.assertIn(".claude/hooks.json", report.files_created)
         self.assertIn(".claude/settings.local.json", report.files_created)
 
+    def test_precompiles_memory_lib(self):
+        lib_dir = self.project_root / ".memory" / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "mod.py").write_text("VALUE = 1\n")
+
+        run_init(self.project_root, self.config)
+        self.assertTrue(list((lib_dir / "__pycache__").glob("mod.*.pyc")))
+
+    def test_dry_run_does_not_precompile(self):
+        lib_dir = self.project_root / ".memory" / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "mod.py").write_text("VALUE = 1\n")
+
+        run_init(self.project_root, self.config, dry_run=True)
+        self.assertFalse((lib_dir / "__pycache__").exists())
+
     def test_claude_md_exists(self):
         run_init(self.project_root, self.config)
         self.assertTrue((self.project_root / "CLAUDE.md").exists())
@@ -796,6 +819,12 @@ class TestRunInit(unittest.TestCase):
         # At minimum should suggest gitignore items
         self.assertIsInstance(report.suggestions, list)
 
+    def test_suggests_ignoring_cache_dir(self):
+        """Snapshots and cached LLM output under .memory/cache/ stay out of git."""
+        (self.project_root / ".gitignore").write_text(".memory/working/\nvectors.db\n")
+        report = run_init(self.project_root, self.config)
+        self.assertIn("Consider adding to .gitignore: .memory/cache/", report.suggestions)
+
     def test_creates_claude_dir_structure(self):
         """Ensure .claude/ and .claude/rules/ are created."""
         run_init(self.project_root, self.config)
@@ -862,6 +891,11 @@ class TestRunUpgrade(unittest.TestCase):
         self.assertIn("Session Awareness", content)
         self.assertIn(".claude/rules/ef-memory-startup.md", report.files_merged)
 
+    def test_upgrade_suggests_ignoring_cache_dir(self):
+        (self.project_root / ".gitignore").write_text(".memory/working/\nvectors.db\n")
+        report = run_upgrade(self.project_root, self.config)
+        self.assertIn("Consider adding to .gitignore: .memory/cache/", report.suggestions)
+
     def test_upgrade_preserves_user_claude_md(self):
         # Add user content above EFM section
         claude_md = self.project_root / "CLAUDE.md"
@@ -9,7 +9,7 @@ and are not tested here.
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Import path setup
 _MEMORY_DIR = Path(__file__).resolve().parent.parent
@@ -18,12 +18,28 @@ if str(_MEMORY_DIR) not in sys.path:
 
 from lib.llm_provider import (
     LLMResponse,
+    clear_llm_provider_cache,
     create_llm_provider,
+    invalidate_env_cache,
+    _PROVIDER_CONSTRUCTORS,
+    _provider_cache_key,
     _resolve_api_key,
 )
 from tests.conftest import MockLLMProvider
 
 
+# sys.modules entries that make every provider SDK import fail, so the
+# factory's failure paths never depend on (or pay for importing) SDKs
+# that happen to be installed.
+_NO_SDKS = {
+    "anthropic": None,
+    "openai": None,
+    "google": None,
+    "google.genai": None,
+    "ollama": None,
+}
+
+
 # ---------------------------------------------------------------------------
 # LLMResponse dataclass
 # ---------------------------------------------------------------------------
@@ -66,6 +82,15 @@ class TestResolveApiKey(unittest.TestCase):
         result = _resolve_api_key({})
         self.assertIsNone(result)
 
+    def test_well_known_key_read_from_snapshot(self):
+        self.addCleanup(invalidate_env_cache)
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "before"}):
+            invalidate_env_cache()
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "after"}):
+            self.assertEqual(_resolve_api_key({"api_key_env": "OPENAI_API_KEY"}), "before")
+            invalidate_env_cache()
+            self.assertEqual(_resolve_api_key({"api_key_env": "OPENAI_API_KEY"}), "after")
+
 
 # ---------------------------------------------------------------------------
 # create_llm_provider — factory tests
@@ -98,8 +123,8 @@ class TestCreateLLMProvider(unittest.TestCase):
             "fallback": ["openai", "ollama"],
             "providers": {},
         }
-        result = create_llm_provider(config)
-        # All SDKs should fail to import or fail with missing API key
+        with patch.dict(sys.modules, _NO_SDKS):
+            result = create_llm_provider(config)
         self.assertIsNone(result)
 
     def test_fallback_chain_skips_duplicate_primary(self):
@@ -123,6 +148,110 @@ class TestCreateLLMProvider(unittest.TestCase):
         self.assertIsNone(result)
 
 
+# ---------------------------------------------------------------------------
+# create_llm_provider — memoization
+# ---------------------------------------------------------------------------
+
+class TestProviderCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_llm_provider_cache()
+        self.addCleanup(clear_llm_provider_cache)
+        self.constructed = []
+
+        def _construct(cfg):
+            provider = MockLLMProvider()
+            self.constructed.append(cfg)
+            return provider
+
+        patcher = patch.dict(_PROVIDER_CONSTRUCTORS, {"mock": _construct})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _config(self, **provider_cfg):
+        return {
+            "enabled": True,
+            "provider": "mock",
+            "fallback": [],
+            "providers": {"mock": provider_cfg},
+        }
+
+    def test_same_config_reuses_instance(self):
+        first = create_llm_provider(self._config(model="m1"))
+        second = create_llm_provider(self._config(model="m1"))
+        self.assertIs(first, second)
+        self.assertEqual(len(self.constructed), 1)
+
+    def test_different_model_builds_new_instance(self):
+        first = create_llm_provider(self._config(model="m1"))
+        second = create_llm_provider(self._config(model="m2"))
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.constructed), 2)
+
+    def test_any_setting_change_builds_new_instance(self):
+        first = create_llm_provider(self._config(num_ctx=8192, keep_alive="30m"))
+        second = create_llm_provider(self._config(num_ctx=4096, keep_alive="30m"))
+        third = create_llm_provider(self._config(num_ctx=4096, keep_alive="5m"))
+        self.assertEqual(len({id(first), id(second), id(third)}), 3)
+        self.assertIs(third, create_llm_provider(self._config(keep_alive="5m", num_ctx=4096)))
+
+    def test_rotated_key_builds_new_instance(self):
+        config = self._config(api_key_env="MOCK_LLM_KEY")
+        with patch.dict("os.environ", {"MOCK_LLM_KEY": "key-1"}):
+            first = create_llm_provider(config)
+        with patch.dict("os.environ", {"MOCK_LLM_KEY": "key-2"}):
+            second = create_llm_provider(config)
+        self.assertIsNot(first, second)
+
+    def test_clear_cache(self):
+        first = create_llm_provider(self._config())
+        clear_llm_provider_cache()
+        second = create_llm_provider(self._config())
+        self.assertIsNot(first, second)
+
+    def test_failed_primary_not_retried(self):
+        attempts = []
+
+        def _missing_sdk(cfg):
+            attempts.append(cfg)
+            raise ImportError("No module named 'broken_sdk'")
+
+        config = self._config(model="m1")
+        config["provider"], config["fallback"] = "broken", ["mock"]
+        with patch.dict(_PROVIDER_CONSTRUCTORS, {"broken": _missing_sdk}):
+            first = create_llm_provider(config)
+            second = create_llm_provider(config)
+            self.assertIs(first, second)
+            self.assertEqual(len(attempts), 1)
+
+            clear_llm_provider_cache()
+            create_llm_provider(config)
+            self.assertEqual(len(attempts), 2)
+
+    def test_cache_key_never_contains_raw_key(self):
+        with patch.dict("os.environ", {"MOCK_LLM_KEY": "supersecret"}):
+            key = _provider_cache_key("mock", {"api_key_env": "MOCK_LLM_KEY"})
+        self.assertNotIn("supersecret", key)
+        self.assertEqual(len(key[-1]), 16)
+
+
+# ---------------------------------------------------------------------------
+# Shared httpx client
+# ---------------------------------------------------------------------------
+
+class TestSharedHttpClient(unittest.TestCase):
+
+    def test_timeout_matches_sdk_default(self):
+        from lib.llm_provider import _shared_http_client
+        fake_httpx = MagicMock()
+        with patch.dict(sys.modules, {"httpx": fake_httpx, "h2": None}), \
+                patch("lib.llm_provider._SHARED_HTTP_CLIENT", None):
+            client = _shared_http_client()
+        self.assertIs(client, fake_httpx.Client.return_value)
+        fake_httpx.Timeout.assert_called_once_with(600.0, connect=5.0)
+        self.assertFalse(fake_httpx.Client.call_args.kwargs["http2"])
+
+
 # ---------------------------------------------------------------------------
 # MockLLMProvider (from conftest)
 # ---------------------------------------------------------------------------
@@ -180,49 +309,88 @@ class TestMockLLMProvider(unittest.TestCase):
 class TestProviderImportErrors(unittest.TestCase):
     """Test that each provider raises ImportError when SDK is missing."""
 
-    def test_anthropic_import_error(self):
-        """AnthropicProvider should raise ImportError when SDK not installed."""
-        # The anthropic SDK may or may not be installed; test the factory path
-        config = {
-            "enabled": True,
-            "provider": "anthropic",
-            "fallback": [],
-            "providers": {"anthropic": {}},
+    def setUp(self):
+        clear_llm_provider_cache()
+        self.addCleanup(clear_llm_provider_cache)
+        patcher = patch.dict(sys.modules, _NO_SDKS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_all_providers_graceful(self):
+        """The factory returns None for every provider whose SDK is missing."""
+        for name in ("anthropic", "openai", "gemini", "ollama"):
+            with self.subTest(provider=name):
+                config = {
+                    "enabled": True,
+                    "provider": name,
+                    "fallback": [],
+                    "providers": {name: {}},
+                }
+                self.assertIsNone(create_llm_provider(config))
+
+
+class TestOllamaProvider(unittest.TestCase):
+    """OllamaLLMProvider against a stand-in ollama module."""
+
+    def setUp(self):
+        from lib import llm_provider
+        self._clients = llm_provider._OLLAMA_CLIENTS
+        self._clients.clear()
+        self.sdk = MagicMock()
+        self.sdk.Client.return_value.chat.return_value = {
+            "message": {"content": "ok"},
+            "prompt_eval_count": 3,
+            "eval_count": 1,
         }
-        # Either SDK not installed (ImportError) or no API key (ValueError)
-        # Both are caught by factory → returns None
-        result = create_llm_provider(config)
-        self.assertIsNone(result)
-
-    def test_openai_import_error(self):
-        config = {
-            "enabled": True,
-            "provider": "openai",
-            "fallback": [],
-            "providers": {"openai": {}},
-        }
-        result = create_llm_provider(config)
-        self.assertIsNone(result)
-
-    def test_gemini_import_error(self):
-        config = {
-            "enabled": True,
-            "provider": "gemini",
-            "fallback": [],
-            "providers": {"gemini": {}},
-        }
-        result = create_llm_provider(config)
-        self.assertIsNone(result)
-
-    def test_ollama_import_error(self):
-        config = {
-            "enabled": True,
-            "provider": "ollama",
-            "fallback": [],
-            "providers": {"ollama": {}},
-        }
-        result = create_llm_provider(config)
-        self.assertIsNone(result)
+        patcher = patch.dict(sys.modules, {"ollama": self.sdk})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._clients.clear)
+
+    def test_client_shared_per_host(self):
+        from lib.llm_provider import OllamaLLMProvider
+        self.sdk.Client.side_effect = lambda host: MagicMock(name=host)
+        a = OllamaLLMProvider(model="llama3.1")
+        b = OllamaLLMProvider(model="mistral")
+        c = OllamaLLMProvider(model="llama3.1", host="http://gpu:11434")
+        self.assertIs(a._client, b._client)
+        self.assertIsNot(a._client, c._client)
+        self.assertEqual(self.sdk.Client.call_count, 2)
+
+    def test_complete_pins_num_ctx_and_keep_alive(self):
+        provider = _PROVIDER_CONSTRUCTORS["ollama"]({"num_ctx": 4096})
+        response = provider.complete("sys", "user", max_tokens=128)
+
+        kwargs = self.sdk.Client.return_value.chat.call_args.kwargs
+        self.assertEqual(kwargs["options"], {"num_predict": 128, "num_ctx": 4096})
+        self.assertEqual(kwargs["keep_alive"], "30m")
+        self.assertEqual(response.text, "ok")
+        self.assertEqual(response.input_tokens, 3)
+
+
+class TestAnthropicRequestShape(unittest.TestCase):
+    """AnthropicProvider request shape against a stand-in anthropic module."""
+
+    def setUp(self):
+        self.sdk = MagicMock()
+        create = self.sdk.Anthropic.return_value.messages.create
+        create.return_value = MagicMock(
+            content=[MagicMock(text="{}")],
+            usage=MagicMock(input_tokens=5, output_tokens=2),
+        )
+        self.create = create
+        patcher = patch.dict(sys.modules, {"anthropic": self.sdk})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_plain_string_prompts(self):
+        from lib.llm_provider import AnthropicProvider
+        provider = AnthropicProvider(api_key="k")
+        response = provider.complete("sys", "user")
+        kwargs = self.create.call_args.kwargs
+        self.assertEqual(kwargs["system"], "sys")
+        self.assertEqual(kwargs["messages"], [{"role": "user", "content": "user"}])
+        self.assertEqual(response.input_tokens, 5)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""Tests for prompt_cache module."""
+
+import json
+
+from lib.prompt_cache import (
+    CACHE_FILE,
+    CachedLLMProvider,
+    prompt_cache_key,
+    with_response_cache,
+)
+from tests.conftest import MockLLMProvider
+
+
+class TestPromptCacheKey:
+    def test_key_depends_on_every_part(self):
+        base = prompt_cache_key("p", "m", "sys", "user", 100)
+        assert base == prompt_cache_key("p", "m", "sys", "user", 100)
+        assert base != prompt_cache_key("p", "m2", "sys", "user", 100)
+        assert base != prompt_cache_key("p", "m", "sys", "user2", 100)
+        assert base != prompt_cache_key("p", "m", "sys", "user", 200)
+
+    def test_parts_are_delimited(self):
+        assert prompt_cache_key("p", "m", "ab", "c", 1) != prompt_cache_key("p", "m", "a", "bc", 1)
+
+
+class TestCachedLLMProvider:
+    def test_repeat_prompt_served_from_cache(self, tmp_path):
+        inner = MockLLMProvider()
+        cached = CachedLLMProvider(inner, tmp_path)
+
+        first = cached.complete("sys", "user")
+        second = cached.complete("sys", "user")
+
+        assert inner._call_count == 1
+        assert second.text == first.text
+        assert second.input_tokens == 0
+        assert (cached.hits, cached.misses) == (1, 1)
+
+    def test_different_prompt_misses(self, tmp_path):
+        inner = MockLLMProvider()
+        cached = CachedLLMProvider(inner, tmp_path)
+        cached.complete("sys", "entries a")
+        cached.complete("sys", "entries b")
+        assert inner._call_count == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        CachedLLMProvider(MockLLMProvider(), tmp_path).complete("sys", "user")
+
+        inner = MockLLMProvider()
+        response = CachedLLMProvider(inner, tmp_path).complete("sys", "user")
+
+        assert inner._call_count == 0
+        assert response.text == '{"result": "mock analysis"}'
+
+    def test_compacts_oversized_file(self, tmp_path):
+        cached = CachedLLMProvider(MockLLMProvider(), tmp_path, max_entries=2)
+        for i in range(5):
+            cached.complete("sys", f"user {i}")
+
+        reloaded = CachedLLMProvider(MockLLMProvider(), tmp_path, max_entries=2)
+
+        lines = (tmp_path / CACHE_FILE).read_text().splitlines()
+        assert len(lines) == 2
+        assert len(reloaded._records) == 2
+
+    def test_concurrent_calls_counted(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+        cached = CachedLLMProvider(MockLLMProvider(), tmp_path)
+        prompts = [f"user {i % 4}" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda p: cached.complete("sys", p), prompts))
+        assert cached.hits + cached.misses == 200
+        assert len(cached._records) == 4
+
+    def test_corrupt_lines_ignored(self, tmp_path):
+        cache_file = tmp_path / CACHE_FILE
+        cache_file.write_text("not json\n" + json.dumps({"key": "k"}) + "\n")
+
+        inner = MockLLMProvider()
+        CachedLLMProvider(inner, tmp_path).complete("sys", "user")
+        assert inner._call_count == 1
+
+
+class TestWithResponseCache:
+    def test_off_by_default(self, tmp_path):
+        inner = MockLLMProvider()
+        assert with_response_cache(inner, {}, tmp_path) is inner
+        assert not (tmp_path / CACHE_FILE).exists()
+
+    def test_enabled_by_config(self, tmp_path):
+        wrapped = with_response_cache(MockLLMProvider(), {"response_cache": True}, tmp_path)
+        assert isinstance(wrapped, CachedLLMProvider)
+
+    def test_disabled_by_config(self, tmp_path):
+        inner = MockLLMProvider()
+        assert with_response_cache(inner, {"response_cache": False}, tmp_path) is inner
+
+    def test_none_provider_passthrough(self, tmp_path):
+        assert with_response_cache(None, {}, tmp_path) is None
@@ -200,5 +200,21 @@ class TestDefaults(unittest.TestCase):
         self.assertEqual(_DEFAULT_MAX_INPUT_CHARS, 12000)
 
 
+class TestStableSystemPrompts(unittest.TestCase):
+    """System prompts must not vary with input (provider prefix caching)."""
+
+    def test_system_prompt_independent_of_input(self):
+        builders = [
+            (correlation_prompt, ("a", "b"), ("c" * 500, "d")),
+            (contradiction_prompt, ("a",), ("c" * 500,)),
+            (synthesis_prompt, ("a",), ("c" * 500,)),
+            (risk_prompt, ("q", "r", "c"), ("q2", "r" * 500, "c2")),
+            (single_entry_prompt, ("a", "b"), ("c" * 500, "d")),
+        ]
+        for builder, args_a, args_b in builders:
+            with self.subTest(builder=builder.__name__):
+                self.assertIs(builder(*args_a)[0], builder(*args_b)[0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,7 @@ from tests.conftest import (
     MockLLMProvider,
     SAMPLE_ENTRIES,
     SAMPLE_ENTRIES_EXTENDED,
+    SAMPLE_ENTRIES_EXTENDED_JSONL,
 )
 
 
@@ -546,6 +547,9 @@ class TestRiskHeuristic(unittest.TestCase):
         high_anns = [a for a in report.annotations if a.risk_level == "high"]
         self.assertGreater(len(high_anns), 0)
 
+        by_id = assess_risks("query", ["sup"], entries, _make_config())
+        self.assertEqual(by_id.annotations, report.annotations)
+
     def test_no_risk_for_fresh_entry(self):
         entries = {
             "fresh": {
@@ -648,9 +652,7 @@ class TestBuildReasoningReport(unittest.TestCase):
     def setUp(self):
         self.tmpdir = Path(tempfile.mkdtemp())
         self.events_path = self.tmpdir / "events.jsonl"
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES_EXTENDED:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_EXTENDED_JSONL)
 
     def test_full_report_structure(self):
         report = build_reasoning_report(
@@ -691,6 +693,36 @@ class TestBuildReasoningReport(unittest.TestCase):
         # So mode stays heuristic unless responses are configured
         self.assertIn(report.mode, ("heuristic", "llm_enriched"))
 
+    def test_llm_analyses_run_concurrently(self):
+        import threading
+
+        class BarrierLLM(MockLLMProvider):
+            """Each call waits until all three analyses are calling at once."""
+            def __init__(self):
+                super().__init__()
+                self.barrier = threading.Barrier(3, timeout=5)
+
+            def complete(self, system_prompt, user_prompt, max_tokens=4096):
+                self.barrier.wait()
+                return super().complete(system_prompt, user_prompt, max_tokens)
+
+        mock = BarrierLLM()
+        build_reasoning_report(
+            self.events_path, _make_config(), self.tmpdir, llm_provider=mock,
+        )
+        self.assertEqual(mock._call_count, 3)
+        self.assertFalse(mock.barrier.broken)
+
+    def test_parallel_analyses_disabled_runs_in_order(self):
+        mock = MockLLMProvider()
+        report = build_reasoning_report(
+            self.events_path, _make_config(parallel_analyses=False), self.tmpdir,
+            llm_provider=mock,
+        )
+        self.assertEqual(mock._call_count, 3)
+        self.assertIn("correlat", mock._calls[0][1].lower())
+        self.assertIsNotNone(report.synthesis_report)
+
     def test_deprecated_entries_excluded(self):
         dep_path = self.tmpdir / "with_deprecated.jsonl"
         with open(dep_path, "w") as f:
@@ -704,6 +736,14 @@ class TestBuildReasoningReport(unittest.TestCase):
         # Should have fewer entries due to deprecated filtering
         self.assertEqual(report.total_entries, 2)  # 3 - 1 deprecated
 
+    def test_preloaded_entries_skip_reading(self):
+        preloaded = {e["id"]: e for e in SAMPLE_ENTRIES}
+        missing = self.tmpdir / "missing.jsonl"
+        report = build_reasoning_report(
+            missing, _make_config(), self.tmpdir, _preloaded_entries=preloaded,
+        )
+        self.assertEqual(report.total_entries, len(preloaded))
+
 
 # ---------------------------------------------------------------------------
 # annotate_search_results
@@ -0,0 +1,118 @@
+"""
+EF Memory — Tests for scan_cli JSON I/O helpers
+
+Covers the size-gated orjson path in _print_json / _loads: small payloads
+stay on stdlib json, and large ones produce identical output either way.
+
+Run:
+    cd .memory/tests && python3 -m pytest test_scan_cli.py -v
+"""
+
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure .memory/ is on the import path so 'lib' is importable
+_MEMORY_DIR = Path(__file__).resolve().parent.parent
+if str(_MEMORY_DIR) not in sys.path:
+    sys.path.insert(0, str(_MEMORY_DIR))
+
+from lib.events_io import get_orjson
+
+
+def _load_scan_cli():
+    spec = importlib.util.spec_from_file_location(
+        "scan_cli", _MEMORY_DIR / "scripts" / "scan_cli.py",
+    )
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def scan_cli():
+    return _load_scan_cli()
+
+
+def _captured_print(mod, monkeypatch, output, size_hint):
+    """Run _print_json with a bytes-backed stdout and return what it wrote."""
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+    monkeypatch.setattr(sys, "stdout", stdout)
+    mod._print_json(output, size_hint)
+    stdout.flush()
+    return raw.getvalue()
+
+
+_SAMPLE = {
+    "mode": "full",
+    "documents": [
+        {"path": "docs/incidents/日本語.md", "size": 1234, "score": 0.75},
+        {"path": "a\"quoted\"\\path.md", "tags": [], "meta": {}},
+    ],
+    "nested": {"empty_list": [], "empty_dict": {}, "flags": [True, False, None]},
+    "ratio": 1e-7,
+    "big": 2 ** 63 - 1,
+    "text": "line1\nline2\ttab   emoji \U0001F600",
+}
+
+
+class TestPrintJson:
+    def test_small_output_does_not_request_orjson(self, scan_cli, monkeypatch):
+        sizes = []
+
+        def fake_get_orjson(size=None):
+            sizes.append(size)
+            return None
+
+        monkeypatch.setattr(scan_cli, "get_orjson", fake_get_orjson)
+        _captured_print(scan_cli, monkeypatch, {"written_count": 0}, 0)
+        assert sizes == [0]
+
+    def test_orjson_and_stdlib_output_match(self, scan_cli, monkeypatch):
+        if get_orjson(1 << 30) is None:
+            pytest.skip("orjson not installed")
+        via_stdlib = _captured_print(scan_cli, monkeypatch, _SAMPLE, 0)
+        via_orjson = _captured_print(scan_cli, monkeypatch, _SAMPLE, 1 << 30)
+        assert via_orjson == via_stdlib
+
+
+class TestLoads:
+    def test_passes_input_size_to_get_orjson(self, scan_cli, monkeypatch):
+        sizes = []
+
+        def fake_get_orjson(size=None):
+            sizes.append(size)
+            return None
+
+        monkeypatch.setattr(scan_cli, "get_orjson", fake_get_orjson)
+        data = b'[{"id": "x"}]'
+        assert scan_cli._loads(data) == ([{"id": "x"}], False)
+        assert sizes == [len(data)]
+
+    def test_large_input_matches_stdlib(self, scan_cli):
+        if get_orjson(1 << 30) is None:
+            pytest.skip("orjson not installed")
+        data = json.dumps(
+            [dict(_SAMPLE, big=i, id=f"e{i}") for i in range(2000)],
+            ensure_ascii=False,
+        ).encode("utf-8")
+        value, by_orjson = scan_cli._loads(data)
+        assert by_orjson is True
+        assert value == json.loads(data)
+
+    def test_huge_integer_falls_back_to_stdlib(self, scan_cli):
+        data = b'[{"n": 123456789012345678901234567890}]' + b" " * (1 << 19)
+        value, by_orjson = scan_cli._loads(data)
+        assert value == [{"n": 123456789012345678901234567890}]
+        assert by_orjson is False
+
+    def test_nan_falls_back_to_stdlib(self, scan_cli):
+        data = b'[{"score": NaN}]' + b" " * (1 << 19)
+        value, by_orjson = scan_cli._loads(data)
+        assert by_orjson is False
+        assert value[0]["score"] != value[0]["score"]
@@ -11,6 +11,8 @@ import sys
 import tempfile
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from pathlib import Path
 
 # Import path setup
@@ -23,8 +25,15 @@ from lib.scanner import (
     BatchWriteResult,
     DocumentInfo,
     ScanReport,
+    _build_document_info,
+    _compile_dir_excludes,
+    _compile_excludes,
+    _compile_file_excludes,
+    _count_imported_sources,
     _extract_file_from_source,
     _matches_exclude,
+    _read_sample,
+    _walk_documents,
     batch_validate,
     batch_write,
     check_already_imported,
@@ -98,9 +107,10 @@ def _make_valid_entry(
 def _write_events(events_path: Path, entries: list) -> None:
     """Write entries to events.jsonl."""
     events_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(events_path, "w", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    events_path.write_text(
+        "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries),
+        encoding="utf-8",
+    )
 
 
 def _create_project(tmpdir: Path, files: dict) -> Path:
@@ -139,6 +149,40 @@ class TestMatchesExclude(unittest.TestCase):
     def test_exact_match(self):
         self.assertTrue(_matches_exclude("foo.txt", "foo.txt"))
 
+    def test_extension_pattern(self):
+        self.assertTrue(_matches_exclude("src/app.min.js", "**/*.min.js"))
+        self.assertFalse(_matches_exclude("src/app.js", "**/*.min.js"))
+
+    def test_segment_must_be_whole_directory(self):
+        self.assertFalse(_matches_exclude("a/.gitx/config", "**/.git/**"))
+        self.assertFalse(_matches_exclude("distro/readme.md", "dist/**"))
+
+    def test_regex_metacharacters_literal(self):
+        self.assertFalse(_matches_exclude("fooXtxt", "foo.txt"))
+
+    def test_compiled_union(self):
+        exclude_re = _compile_excludes(("**/node_modules/**", "dist/**"))
+        self.assertIsNotNone(exclude_re.search("src/node_modules/x.js"))
+        self.assertIsNotNone(exclude_re.search("dist/a.js"))
+        self.assertIsNone(exclude_re.search("docs/a.md"))
+        self.assertIsNone(_compile_excludes(()))
+
+    def test_dir_and_file_split_matches_union(self):
+        patterns = ("**/node_modules/**", "dist/**", "**/*.min.js", "foo.txt")
+        union = _compile_excludes(patterns)
+        dir_re = _compile_dir_excludes(patterns)
+        file_re = _compile_file_excludes(patterns)
+        for rel in ("src/node_modules/x.js", "dist/a.js", "dist", "distro/a.js",
+                    "src/app.min.js", "foo.txt", "src/foo.txt", "docs/a.md"):
+            parent = rel.rpartition("/")[0]
+            split = bool(parent and dir_re.search(parent + "/")) or bool(file_re.search(rel))
+            self.assertEqual(split, union.search(rel) is not None, rel)
+
+    def test_windows_separators_normalized(self):
+        with patch("lib.scanner._NEEDS_SEP_NORM", True), patch("lib.scanner.os.sep", "\\"):
+            self.assertTrue(_matches_exclude("src\\node_modules\\x.js", "**/node_modules/**"))
+            self.assertFalse(_matches_exclude("docs\\a.md", "**/node_modules/**"))
+
 
 # ===========================================================================
 # Test: _extract_file_from_source
@@ -185,6 +229,18 @@ class TestExtractFileFromSource(unittest.TestCase):
             "docs/ARCHITECTURE.md",
         )
 
+    def test_single_line_and_padding(self):
+        self.assertEqual(_extract_file_from_source("  src/main.py:L7 "), "src/main.py")
+
+    def test_function_takes_precedence_over_anchor(self):
+        self.assertEqual(
+            _extract_file_from_source("src/a.py::f#note:L1-L2"),
+            "src/a.py",
+        )
+
+    def test_bare_word_returns_none(self):
+        self.assertIsNone(_extract_file_from_source("README"))
+
 
 # ===========================================================================
 # Test: score_relevance
@@ -240,6 +296,29 @@ class TestScoreRelevance(unittest.TestCase):
         # Unknown ext gets 0.05 base
         self.assertGreater(score, 0.0)
 
+    def test_score_scan_threshold_skips_high_value_scan(self):
+        config = _make_config()
+        precise = score_relevance(Path("docs/INCIDENTS.md"), "plain text", config)
+        config["scan"]["score_scan_threshold"] = 0.6
+        fast = score_relevance(Path("docs/INCIDENTS.md"), "plain text", config)
+        other = score_relevance(Path("docs/notes.md"), "plain text", config)
+        self.assertAlmostEqual(precise, 0.60)
+        self.assertAlmostEqual(fast, 1.0)
+        self.assertAlmostEqual(other, 0.30)
+
+    def test_keywords_case_insensitive(self):
+        config = _make_config()
+        lower = score_relevance(Path("docs/guide.md"), "must fix the risk", config)
+        upper = score_relevance(Path("docs/guide.md"), "MUST FIX THE RISK", config)
+        self.assertEqual(lower, upper)
+
+    def test_custom_keywords_counted_per_keyword(self):
+        config = _make_config()
+        config["scan"]["relevance_keywords"] = ["must", "must not"]
+        score = score_relevance(Path("data.csv"), "MUST NOT", config)
+        # Both keywords match: 2 hits → 0.08 density on top of 0.05 base
+        self.assertAlmostEqual(score, 0.05 + 0.08)
+
 
 # ===========================================================================
 # Test: check_already_imported
@@ -308,11 +387,76 @@ class TestCheckAlreadyImported(unittest.TestCase):
         result = check_already_imported(self.events_path)
         self.assertEqual(result.get("src/auth.py"), 1)
 
+    def test_memoized_until_file_changes(self):
+        entry = _make_valid_entry(
+            entry_id="lesson-test1-aabbcc01",
+            sources=["docs/a.md:L1-L2"],
+        )
+        _write_events(self.events_path, [entry])
+        with patch(
+            "lib.scanner._count_imported_sources",
+            wraps=_count_imported_sources,
+        ) as count:
+            first = check_already_imported(self.events_path)
+            second = check_already_imported(self.events_path)
+            self.assertIs(first, second)
+            self.assertEqual(count.call_count, 1)
+
+            other = _make_valid_entry(
+                entry_id="lesson-test2-aabbcc02",
+                sources=["docs/a.md:L5-L9"],
+            )
+            with open(self.events_path, "a") as f:
+                f.write(json.dumps(other) + "\n")
+            third = check_already_imported(self.events_path)
+            self.assertEqual(count.call_count, 2)
+        self.assertEqual(third.get("docs/a.md"), 2)
+
 
 # ===========================================================================
 # Test: discover_documents
 # ===========================================================================
 
+class TestReadSample(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_sample_limited_count_exact(self):
+        path = self.tmpdir / "big.md"
+        path.write_text("".join(f"line {i}\n" for i in range(500)) + "tail")
+        sample, line_count = _read_sample(path)
+        self.assertEqual(sample.count("\n"), 50)
+        self.assertTrue(sample.startswith("line 0\n"))
+        self.assertEqual(line_count, 501)
+
+    def test_crlf_normalized(self):
+        path = self.tmpdir / "win.md"
+        path.write_bytes(b"# Title\r\nMUST do\r\n")
+        sample, line_count = _read_sample(path)
+        self.assertEqual(sample, "# Title\nMUST do\n")
+        self.assertEqual(line_count, 2)
+
+    def test_empty_file(self):
+        path = self.tmpdir / "empty.md"
+        path.write_bytes(b"")
+        self.assertEqual(_read_sample(path), ("", 0))
+
+    def test_counts_across_chunks(self):
+        path = self.tmpdir / "large.txt"
+        long_line = b"x" * (70 * 1024) + b"\n"  # sample spans two 64 KiB reads
+        body = b"short line\n" * 99_000     # >1 MiB, counted in 1 MiB reads
+        path.write_bytes(long_line + body)
+        sample, line_count = _read_sample(path)
+        self.assertEqual(sample.count("\n"), 50)
+        self.assertEqual(len(sample.split("\n", 1)[0]), 70 * 1024)
+        self.assertEqual(line_count, 99_001)
+
+
 class TestDiscoverDocuments(unittest.TestCase):
 
     def setUp(self):
@@ -346,6 +490,120 @@ class TestDiscoverDocuments(unittest.TestCase):
         self.assertIn("docs/guide.md", rel_paths)
         self.assertNotIn("node_modules/pkg/README.md", rel_paths)
 
+    def test_excluded_directories_not_descended(self):
+        _create_project(self.tmpdir, {
+            "docs/guide.md": "# Guide",
+            "docs/node_modules/pkg/README.md": "# Pkg",
+        })
+        config = _make_config()
+        with patch("lib.scanner.os.scandir", wraps=os.scandir) as scandir:
+            report = discover_documents(self.tmpdir, config)
+        listed = {Path(c.args[0]).name for c in scandir.call_args_list}
+        self.assertNotIn("node_modules", listed)
+        self.assertNotIn("pkg", listed)
+        self.assertEqual([d.rel_path for d in report.documents], ["docs/guide.md"])
+        self.assertEqual(report.total_excluded, 1)
+
+    def test_single_walk_matches_all_extensions(self):
+        _create_project(self.tmpdir, {
+            "docs/a.md": "# A",
+            "docs/sub/b.py": "# B",
+            "docs/sub/c.txt": "C",
+        })
+        config = _make_config()
+        config["import"]["supported_sources"] = ["*.md", "**/*.py"]
+        report = discover_documents(self.tmpdir, config)
+        self.assertEqual(
+            sorted(d.rel_path for d in report.documents),
+            ["docs/a.md", "docs/sub/b.py"],
+        )
+
+    def test_nested_doc_roots_walked_once(self):
+        _create_project(self.tmpdir, {
+            "docs/a.md": "# A",
+            "docs/sub/b.md": "# B",
+            "CLAUDE.md": "# Claude",
+        })
+        config = _make_config()
+        config["import"]["doc_roots"] = ["docs/sub/", "docs/", "docs", "CLAUDE.md"]
+        with patch("lib.scanner._walk_documents", wraps=_walk_documents) as walk:
+            report = discover_documents(self.tmpdir, config)
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(
+            sorted(d.rel_path for d in report.documents),
+            ["CLAUDE.md", "docs/a.md", "docs/sub/b.md"],
+        )
+
+    def test_path_patterns_globbed_alongside_walk(self):
+        _create_project(self.tmpdir, {
+            "docs/a.md": "# A",
+            "docs/api/spec.txt": "spec",
+            "docs/other.txt": "other",
+        })
+        config = _make_config()
+        config["import"]["supported_sources"] = ["*.md", "api/*.txt"]
+        with patch("lib.scanner._walk_documents", wraps=_walk_documents) as walk:
+            report = discover_documents(self.tmpdir, config)
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(
+            sorted(d.rel_path for d in report.documents),
+            ["docs/a.md", "docs/api/spec.txt"],
+        )
+
+    def test_sizes_reused_from_discovery(self):
+        _create_project(self.tmpdir, {
+            "docs/a.md": "# A",
+            "docs/api/spec.txt": "spec",
+            "CLAUDE.md": "# Claude",
+        })
+        config = _make_config()
+        config["import"]["supported_sources"] = ["*.md", "api/*.txt"]
+        config["import"]["doc_roots"] = ["docs/", "CLAUDE.md"]
+        with patch("lib.scanner._build_document_info", wraps=_build_document_info) as build:
+            report = discover_documents(self.tmpdir, config)
+        self.assertEqual(len(report.documents), 3)
+        sizes = {c.args[1]: c.kwargs["size"] for c in build.call_args_list}
+        self.assertEqual(sizes, {"docs/a.md": 3, "docs/api/spec.txt": 4, "CLAUDE.md": 8})
+
+    def test_symlinked_directory_not_followed(self):
+        _create_project(self.tmpdir, {
+            "docs/guide.md": "# Guide",
+            "elsewhere/other.md": "# Other",
+        })
+        os.symlink(self.tmpdir / "elsewhere", self.tmpdir / "docs" / "link")
+        report = discover_documents(self.tmpdir, _make_config())
+        self.assertEqual([d.rel_path for d in report.documents], ["docs/guide.md"])
+
+    def test_path_pattern_uses_glob(self):
+        _create_project(self.tmpdir, {
+            "docs/guide.md": "# Guide",
+            "notes/todo.md": "# Todo",
+        })
+        report = discover_documents(self.tmpdir, _make_config(), pattern="notes/*.md")
+        self.assertEqual([d.rel_path for d in report.documents], ["notes/todo.md"])
+
+    def test_parallel_matches_sequential(self):
+        files = {f"docs/n{i:02d}.md": "# N\n" + "MUST fix\n" * (i % 7) for i in range(40)}
+        files["docs/big.md"] = "x" * 300
+        _create_project(self.tmpdir, files)
+        config = _make_config()
+        config["scan"]["max_documents"] = 100
+        config["scan"]["max_file_size_bytes"] = 200
+
+        config["scan"]["parallel_workers"] = 1
+        sequential = discover_documents(self.tmpdir, config)
+        config["scan"]["parallel_workers"] = 8
+        with patch("lib.scanner.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            parallel = discover_documents(self.tmpdir, config)
+
+        pool.assert_called_once_with(max_workers=8)
+        self.assertEqual(
+            [(d.rel_path, d.relevance_score) for d in parallel.documents],
+            [(d.rel_path, d.relevance_score) for d in sequential.documents],
+        )
+        self.assertEqual(parallel.skipped_oversized, 1)
+        self.assertEqual(sequential.skipped_oversized, 1)
+
     def test_relevance_ordering(self):
         _create_project(self.tmpdir, {
             "docs/INCIDENTS.md": "# Incidents\nMUST fix\nNEVER repeat\nALWAYS check",
@@ -484,6 +742,29 @@ class TestBatchValidate(unittest.TestCase):
         # First should be valid, second should be flagged as cross-duplicate
         self.assertEqual(len(result.valid), 1)
         self.assertEqual(len(result.duplicates), 1)
+        _, dedup = result.duplicates[0]
+        self.assertEqual(dedup.similar_entries[0][0], "lesson-first-aabb0001")
+
+    def test_batch_entry_shadows_stored_entry(self):
+        stored = _make_valid_entry(
+            entry_id="lesson-shared-aabb0001",
+            title="Original stored title",
+            rule="MUST keep the original behaviour",
+        )
+        _write_events(self.events_path, [stored])
+        update = _make_valid_entry(
+            entry_id="lesson-shared-aabb0001",
+            title="Rewritten title for the update",
+            rule="NEVER rely on the rewritten behaviour",
+        )
+        # Matches the stored version only, which the update replaces
+        follower = _make_valid_entry(
+            entry_id="lesson-follower-aabb0002",
+            title="Original stored title",
+            rule="MUST keep the original behaviour",
+        )
+        result = batch_validate([update, follower], self.events_path, _make_config())
+        self.assertEqual(len(result.valid), 2)
 
     def test_mixed_batch(self):
         _write_events(self.events_path, [])
@@ -506,6 +787,30 @@ class TestBatchValidate(unittest.TestCase):
         self.assertEqual(len(result.valid), 2)
         self.assertEqual(len(result.duplicates), 0)
 
+    def test_unchanged_events_parsed_once(self):
+        stored = _make_valid_entry(
+            entry_id="lesson-stored-aabb0001",
+            title="Existing entry title",
+            rule="MUST test everything",
+        )
+        _write_events(self.events_path, [stored])
+        batch = [_make_valid_entry(entry_id="lesson-batch-aabb0002", title="Other", rule="NEVER skip it")]
+        config = _make_config()
+
+        from lib.auto_verify import _load_entries_latest_wins
+        with patch("lib.scanner._load_entries_latest_wins",
+                   wraps=_load_entries_latest_wins) as load:
+            batch_validate(batch, self.events_path, config)
+            result = batch_validate(batch, self.events_path, config)
+            self.assertEqual(load.call_count, 1)
+            # Batch entries from the first call did not leak into the cache
+            self.assertEqual(len(result.valid), 1)
+
+            batch_write(batch, self.events_path)
+            result = batch_validate(batch, self.events_path, config)
+            self.assertEqual(load.call_count, 2)
+            self.assertEqual(len(result.valid), 1)
+
 
 # ===========================================================================
 # Test: batch_write
@@ -567,6 +872,26 @@ class TestBatchWrite(unittest.TestCase):
         self.assertEqual(result.written_count, 0)
         self.assertFalse(self.events_path.exists())
 
+    def test_unserializable_entry_skipped(self):
+        entries = [
+            _make_valid_entry(entry_id="lesson-a-aabb0001"),
+            {"id": "lesson-bad-aabb0002", "tags": {object()}},
+            _make_valid_entry(entry_id="lesson-c-aabb0003"),
+        ]
+        result = batch_write(entries, self.events_path)
+        self.assertEqual(result.written_count, 2)
+        self.assertEqual(result.entry_ids, ["lesson-a-aabb0001", "lesson-c-aabb0003"])
+        self.assertEqual(len(result.errors), 1)
+        lines = self.events_path.read_text().splitlines()
+        self.assertEqual([json.loads(l)["id"] for l in lines], result.entry_ids)
+
+    def test_write_error_reported(self):
+        self.events_path.mkdir(parents=True)  # a directory cannot be appended to
+        result = batch_write([_make_valid_entry()], self.events_path)
+        self.assertEqual(result.written_count, 0)
+        self.assertEqual(result.entry_ids, [])
+        self.assertTrue(result.errors[0].startswith("Cannot write to"))
+
 
 # ===========================================================================
 # Test: ScanReport dataclass
@@ -580,6 +905,11 @@ class TestScanReport(unittest.TestCase):
         self.assertEqual(report.total_scanned, 0)
         self.assertEqual(report.duration_ms, 0.0)
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_result_types_use_slots(self):
+        for cls in (DocumentInfo, ScanReport, BatchValidateResult, BatchWriteResult):
+            self.assertFalse(hasattr(cls(), "__dict__"), cls.__name__)
+
 
 # ===========================================================================
 # Test: _extract_snippet
@@ -614,6 +944,15 @@ class TestExtractSnippet(unittest.TestCase):
         if len(parts) > 1:
             self.assertLessEqual(len(parts[1]), 120)
 
+    def test_blank_lines_skipped(self):
+        from lib.scanner import _extract_snippet
+        content = "\n  \n## Sub heading \n\n\tBody line\n# Later"
+        self.assertEqual(_extract_snippet(content), "## Sub heading | Body line")
+
+    def test_heading_only(self):
+        from lib.scanner import _extract_snippet
+        self.assertEqual(_extract_snippet("# Only\n\n"), "# Only")
+
 
 # ===========================================================================
 # Test: File size limits (B1)
@@ -22,7 +22,7 @@ from lib.search import (
 )
 from lib.vectordb import VectorDB
 from lib.sync import sync_embeddings
-from tests.conftest import SAMPLE_ENTRIES, MockEmbedder
+from tests.conftest import SAMPLE_ENTRIES, SAMPLE_ENTRIES_JSONL, MockEmbedder
 
 
 # Default config for testing
@@ -54,9 +54,7 @@ class SearchTestBase(unittest.TestCase):
         self.db_path = Path(self.tmpdir) / "vectors.db"
 
         # Write sample entries to JSONL
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         # Init DB
         self.db = VectorDB(self.db_path)
@@ -154,9 +152,7 @@ class TestLoadEntries(unittest.TestCase):
     def test_load_from_jsonl(self):
         tmpdir = tempfile.mkdtemp()
         path = Path(tmpdir) / "events.jsonl"
-        with open(path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         entries = _load_entries(path)
         self.assertEqual(len(entries), 3)
@@ -416,9 +412,7 @@ class TestMinScoreFilter(unittest.TestCase):
     def test_min_score_filters_low_results(self):
         tmpdir = tempfile.mkdtemp()
         events_path = Path(tmpdir) / "events.jsonl"
-        with open(events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         # High min_score should filter out most basic matches
         config = {
@@ -0,0 +1,65 @@
+"""Tests for snapshot_cache module."""
+
+import json
+import os
+
+import pytest
+
+from lib import snapshot_cache
+from lib.snapshot_cache import _snapshot_path, load_entries_cached
+
+
+@pytest.fixture
+def events_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_cache, "_MIN_SNAPSHOT_BYTES", 0)
+    path = tmp_path / "events.jsonl"
+    _write(path, [{"id": "e1", "title": "one"}, {"id": "e1", "title": "one v2"}])
+    return path
+
+
+def _write(path, entries):
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+
+class TestLoadEntriesCached:
+    def test_miss_writes_snapshot(self, events_path, tmp_path):
+        entries = load_entries_cached(events_path)
+        assert entries == {"e1": {"id": "e1", "title": "one v2"}}
+        assert _snapshot_path(events_path, tmp_path / "cache").exists()
+
+    def test_hit_skips_parsing(self, events_path, monkeypatch):
+        load_entries_cached(events_path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("events.jsonl parsed on a snapshot hit")
+
+        monkeypatch.setattr(snapshot_cache, "load_events_latest_wins", fail)
+        assert load_entries_cached(events_path) == {"e1": {"id": "e1", "title": "one v2"}}
+
+    def test_change_invalidates(self, events_path):
+        load_entries_cached(events_path)
+        _write(events_path, [{"id": "e2", "title": "two"}])
+        assert list(load_entries_cached(events_path)) == ["e2"]
+
+    def test_corrupt_snapshot_is_a_miss(self, events_path, tmp_path):
+        load_entries_cached(events_path)
+        _snapshot_path(events_path, tmp_path / "cache").write_bytes(b"\x00garbage")
+        assert list(load_entries_cached(events_path)) == ["e1"]
+
+    def test_returned_entries_are_fresh(self, events_path):
+        load_entries_cached(events_path)["e1"]["title"] = "mutated"
+        assert load_entries_cached(events_path)["e1"]["title"] == "one v2"
+
+    def test_small_file_not_snapshotted(self, events_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(snapshot_cache, "_MIN_SNAPSHOT_BYTES", 1 << 20)
+        assert list(load_entries_cached(events_path)) == ["e1"]
+        assert not (tmp_path / "cache").exists()
+
+    def test_missing_file(self, tmp_path):
+        assert load_entries_cached(tmp_path / "absent.jsonl") == {}
+
+    def test_unwritable_cache_dir(self, events_path, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        assert list(load_entries_cached(events_path, cache_dir=blocker)) == ["e1"]
+        assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
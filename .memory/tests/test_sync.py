@@ -11,9 +11,20 @@ _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.sync import sync_embeddings
+from lib.sync import _compute_text_hash, _pack_batches, sync_embeddings
 from lib.vectordb import VectorDB
-from tests.conftest import SAMPLE_ENTRIES, MockEmbedder
+from tests.conftest import SAMPLE_ENTRIES, SAMPLE_ENTRIES_JSONL, MockEmbedder
+
+
+class TestComputeTextHash(unittest.TestCase):
+
+    def test_format_stable(self):
+        # Stored in vectors.db: a format change would re-embed every entry
+        import hashlib
+        text = "Title | MUST do the thing | 缓存"
+        expected = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        self.assertEqual(_compute_text_hash(text), expected)
+        self.assertEqual(len(_compute_text_hash("")), 16)
 
 
 class TestSyncEmbeddings(unittest.TestCase):
@@ -24,9 +35,7 @@ class TestSyncEmbeddings(unittest.TestCase):
         self.db_path = Path(self.tmpdir) / "vectors.db"
 
         # Write sample entries to JSONL
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         self.db = VectorDB(self.db_path)
         self.db.open()
@@ -54,6 +63,15 @@ class TestSyncEmbeddings(unittest.TestCase):
         for entry in SAMPLE_ENTRIES:
             self.assertTrue(self.db.has_vector(entry["id"]))
 
+    def test_quantized_sync_stores_int8(self):
+        sync_embeddings(self.events_path, self.db, self.embedder, force_full=True, quantize=True)
+        blob, scale = self.db._conn.execute(
+            "SELECT embedding, scale FROM vectors WHERE entry_id = ?",
+            (SAMPLE_ENTRIES[0]["id"],),
+        ).fetchone()
+        self.assertEqual(len(blob), 8)
+        self.assertIsNotNone(scale)
+
     def test_incremental_sync_skips_unchanged(self):
         # First sync
         sync_embeddings(self.events_path, self.db, self.embedder, force_full=True)
@@ -64,6 +82,22 @@ class TestSyncEmbeddings(unittest.TestCase):
         self.assertEqual(report.entries_skipped, 0)  # Nothing new after cursor
         self.assertEqual(report.entries_added, 0)
 
+    def test_unchanged_entries_skip_fts_field_building(self):
+        sync_embeddings(self.events_path, self.db, self.embedder, force_full=True)
+        from unittest import mock
+        with mock.patch("lib.sync.build_fts_fields") as build_fts:
+            report = sync_embeddings(self.events_path, self.db, self.embedder, force_full=True)
+        build_fts.assert_not_called()
+        self.assertEqual(report.entries_skipped, len(SAMPLE_ENTRIES))
+
+    def test_no_change_incremental_sync_builds_no_text(self):
+        sync_embeddings(self.events_path, self.db, self.embedder)
+        from unittest import mock
+        with mock.patch("lib.sync.build_embedding_text") as build_text:
+            report = sync_embeddings(self.events_path, self.db, self.embedder)
+        build_text.assert_not_called()
+        self.assertEqual(report.entries_scanned, 0)
+
     def test_sync_without_embedder_updates_fts(self):
         report = sync_embeddings(
             events_path=self.events_path,
@@ -133,9 +167,7 @@ class TestSyncErrorPaths(unittest.TestCase):
         self.events_path = Path(self.tmpdir) / "events.jsonl"
         self.db_path = Path(self.tmpdir) / "vectors.db"
 
-        with open(self.events_path, "w") as f:
-            for entry in SAMPLE_ENTRIES:
-                f.write(json.dumps(entry) + "\n")
+        self.events_path.write_bytes(SAMPLE_ENTRIES_JSONL)
 
         self.db = VectorDB(self.db_path)
         self.db.open()
@@ -199,5 +231,86 @@ class TestSyncErrorPaths(unittest.TestCase):
         self.assertGreater(report.duration_ms, 0)
 
 
+class TestEmbedBatching(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.events_path = Path(self.tmpdir) / "events.jsonl"
+        self.db = VectorDB(Path(self.tmpdir) / "vectors.db")
+        self.db.open()
+        self.db.ensure_schema()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _write_entries(self, count):
+        with open(self.events_path, "w") as f:
+            for i in range(count):
+                entry = dict(SAMPLE_ENTRIES[0], id=f"lesson-batch-{i:08x}", title=f"Entry {i}")
+                f.write(json.dumps(entry) + "\n")
+
+    def test_pack_batches_by_count_and_chars(self):
+        items = [(str(i), {}, "x" * size, "h") for i, size in enumerate([4, 4, 4, 10, 1, 1])]
+        batches = _pack_batches(items, batch_size=2, max_chars=8)
+        self.assertEqual([[item[0] for item in b] for b in batches], [["0", "1"], ["2"], ["3"], ["4", "5"]])
+
+    def test_concurrent_batches_store_every_entry(self):
+        self._write_entries(25)
+        report = sync_embeddings(
+            self.events_path, self.db, MockEmbedder(dimensions=8),
+            force_full=True, batch_size=4, concurrency=3,
+        )
+        self.assertEqual(report.entries_added, 25)
+        self.assertEqual(report.errors, [])
+        self.assertEqual(self.db.stats()["vectors_active"], 25)
+
+    def test_failed_batch_reported_with_item_range(self):
+        self._write_entries(6)
+
+        class FlakyEmbedder(MockEmbedder):
+            def embed_documents(self, texts):
+                if any("Entry 3" in t for t in texts):
+                    raise RuntimeError("boom")
+                return super().embed_documents(texts)
+
+        report = sync_embeddings(
+            self.events_path, self.db, FlakyEmbedder(dimensions=8),
+            force_full=True, batch_size=2, concurrency=2,
+        )
+        self.assertEqual(report.entries_added, 4)
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("items 2-4", report.errors[0])
+        self.assertIsNone(self.db.get_sync_cursor())
+
+    def test_embedding_overlaps_preparation(self):
+        """The first batch is embedded while later entries are still prepared."""
+        import threading
+        from unittest import mock
+        from lib import sync as sync_module
+
+        self._write_entries(6)
+        started = threading.Event()
+        seen_during_prep = []
+        real_build = sync_module.build_fts_fields
+
+        class SignallingEmbedder(MockEmbedder):
+            def embed_documents(self, texts):
+                started.set()
+                return super().embed_documents(texts)
+
+        def build_fts_fields(entry):
+            if entry["title"] == "Entry 5":
+                seen_during_prep.append(started.wait(timeout=5))
+            return real_build(entry)
+
+        with mock.patch.object(sync_module, "build_fts_fields", build_fts_fields):
+            report = sync_embeddings(
+                self.events_path, self.db, SignallingEmbedder(dimensions=8),
+                force_full=True, batch_size=2, concurrency=2,
+            )
+        self.assertEqual(seen_during_prep, [True])
+        self.assertEqual(report.entries_added, 6)
+
+
 if __name__ == "__main__":
     unittest.main()
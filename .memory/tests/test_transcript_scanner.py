@@ -137,6 +137,38 @@ class TestReadTranscriptMessages(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0], "Valid message")
 
+    def test_read_compact_json_and_non_object_lines(self):
+        """Compact separators parse; non-object lines mentioning "assistant" are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            compact = json.dumps(
+                {"type": "assistant", "message": {"content": "Compact"}},
+                separators=(",", ":"),
+            )
+            path = _write_transcript(tmpdir, ['["assistant"]', compact])
+            self.assertEqual(read_transcript_messages(path), ["Compact"])
+
+    def test_read_type_key_after_long_message(self):
+        """The "type" key may follow the message body (Claude Code key order)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            line = json.dumps({
+                "parentUuid": "p-1",
+                "message": {"role": "assistant", "content": [{"type": "text", "text": "x" * 4096}]},
+                "type": "assistant",
+            })
+            path = _write_transcript(tmpdir, [line])
+            self.assertEqual(read_transcript_messages(path), ["x" * 4096])
+
+    def test_read_skips_invalid_utf8_line(self):
+        """A line with invalid UTF-8 is skipped, not fatal for the whole transcript."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "transcript.jsonl"
+            path.write_bytes(
+                b'{"type": "assistant", "message": {"content": "\xff"}}\n'
+                + _make_transcript_line("assistant", "Still read").encode("utf-8")
+                + b"\n"
+            )
+            self.assertEqual(read_transcript_messages(path), ["Still read"])
+
     def test_read_handles_string_content(self):
         """Handles messages where content is a plain string (not array)."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -149,6 +181,44 @@ class TestReadTranscriptMessages(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0], "Plain string content")
 
+    def test_read_tail_bytes_skips_partial_first_line(self):
+        """tail_bytes reads only the last complete lines of the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lines = [_make_transcript_line("assistant", f"Message {i}") for i in range(10)]
+            path = _write_transcript(tmpdir, lines)
+            last_two = len(lines[-1]) + len(lines[-2]) + 2
+            # Start mid-way through the third-from-last line
+            result = read_transcript_messages(path, tail_bytes=last_two + 5)
+            self.assertEqual(result, ["Message 8", "Message 9"])
+
+    def test_read_tail_bytes_on_line_boundary(self):
+        """A tail that starts exactly at a line start keeps that line."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lines = [_make_transcript_line("assistant", f"Message {i}") for i in range(5)]
+            path = _write_transcript(tmpdir, lines)
+            last_two = len(lines[-1]) + len(lines[-2]) + 2
+            result = read_transcript_messages(path, tail_bytes=last_two)
+            self.assertEqual(result, ["Message 3", "Message 4"])
+
+    def test_read_tail_bytes_larger_than_file(self):
+        """A tail larger than the file reads everything."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lines = [_make_transcript_line("assistant", f"Message {i}") for i in range(3)]
+            path = _write_transcript(tmpdir, lines)
+            result = read_transcript_messages(path, tail_bytes=1024 * 1024)
+            self.assertEqual(len(result), 3)
+
+    def test_read_tail_bytes_ignores_size_limit(self):
+        """With tail_bytes, oversized transcripts are still scanned (bounded read)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "huge.jsonl"
+            with open(path, "w") as f:
+                f.truncate(_MAX_TRANSCRIPT_BYTES + 1)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n" + _make_transcript_line("assistant", "Recent message") + "\n")
+            result = read_transcript_messages(path, tail_bytes=4096)
+            self.assertEqual(result, ["Recent message"])
+
 
 # ---------------------------------------------------------------------------
 # Tests: scan_conversation_for_drafts
@@ -416,6 +486,10 @@ class TestStripRulesEcho(unittest.TestCase):
         result = _strip_rules_echo(text)
         self.assertEqual(result, text)
 
+    def test_text_without_markers_returned_unchanged(self):
+        text = "line one\r\n\nline two\n"
+        self.assertIs(_strip_rules_echo(text), text)
+
     def test_preserves_similar_but_different_text(self):
         """Text that mentions 'Memory' or 'Implication' without exact marker format is kept."""
         text = (
@@ -11,7 +11,10 @@ _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.vectordb import VectorDB, SCHEMA_VERSION, cosine_similarity, pack_vector, unpack_vector
+from lib.vectordb import (
+    VectorDB, SCHEMA_VERSION, cosine_similarity, dequantize_vector, pack_vector,
+    quantize_vector, unpack_vector,
+)
 
 
 class TestCosineSimiarity(unittest.TestCase):
@@ -57,6 +60,32 @@ class TestPackUnpack(unittest.TestCase):
         self.assertEqual(recovered, [])
 
 
+class TestQuantize(unittest.TestCase):
+
+    def test_roundtrip_within_one_step(self):
+        vec = [0.1, 0.2, 0.3, -0.5, 1.0]
+        blob, scale = quantize_vector(vec)
+        self.assertEqual(len(blob), len(vec))
+        for a, b in zip(vec, dequantize_vector(blob, scale)):
+            self.assertLessEqual(abs(a - b), scale / 2 + 1e-9)
+
+    def test_zero_vector(self):
+        blob, scale = quantize_vector([0.0, 0.0])
+        self.assertEqual(dequantize_vector(blob, scale), [0.0, 0.0])
+
+    def test_int8_rows_searched_and_read_back(self):
+        db = VectorDB(Path(tempfile.mkdtemp()) / "q.db")
+        db.open()
+        db.ensure_schema()
+        db.upsert_vector("x", "h", "mock", "m", 3, [1.0, 0.0, 0.0], quantize=True)
+        db.upsert_vector("y", "h", "mock", "m", 3, [0.0, 1.0, 0.0])
+        results = db.search_vectors([0.9, 0.1, 0.0], limit=2)
+        self.assertEqual(results[0][0], "x")
+        self.assertAlmostEqual(results[0][1], cosine_similarity([0.9, 0.1, 0.0], [1.0, 0.0, 0.0]), places=5)
+        self.assertEqual(db.get_vector("x"), [1.0, 0.0, 0.0])
+        db.close()
+
+
 class TestVectorDB(unittest.TestCase):
 
     def setUp(self):
@@ -99,6 +128,52 @@ class TestVectorDB(unittest.TestCase):
         # Different hash → needs update
         self.assertTrue(self.db.needs_update("entry-1", "hash2"))
 
+    def test_upsert_vectors_skips_unpackable_rows(self):
+        self.db.upsert_vector("a", "old", "mock", "m", 2, [1.0, 0.0])
+        failed = self.db.upsert_vectors(
+            [("a", "new", 2, [0.0, 1.0]), ("bad", "h", 2, ["x", None]), ("b", "h", 2, [0.5, 0.5])],
+            provider="mock", model="m",
+        )
+        self.assertEqual([entry_id for entry_id, _ in failed], ["bad"])
+        self.assertEqual(self.db.get_text_hashes(["a", "b", "bad"]), {"a": "new", "b": "h"})
+        self.assertEqual(self.db.get_vector("a"), [0.0, 1.0])
+
+    def test_bulk_deprecate_and_fts_delete_chunked(self):
+        ids = [f"e-{i}" for i in range(1200)]
+        self.db.begin_batch()
+        for entry_id in ids:
+            self.db.upsert_vector(entry_id, "h", "mock", "m", 1, [0.5])
+        self.db.end_batch()
+        self.db.upsert_fts_many([(entry_id, "title", "text", "tags") for entry_id in ids])
+
+        self.db.mark_deprecated_many(ids[:1100])
+        self.db.delete_fts_many(ids[:1100])
+
+        stats = self.db.stats()
+        self.assertEqual(stats["vectors_deprecated"], 1100)
+        if stats["fts5_available"]:
+            self.assertEqual(stats["fts_entries"], 100)
+
+    def test_hash_lookups_use_covering_index(self):
+        plan = self.db._conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT entry_id, text_hash FROM {self.db._hash_table} "
+            "WHERE entry_id IN (?, ?)",
+            ("a", "b"),
+        ).fetchall()
+        self.assertIn("COVERING INDEX idx_vectors_entry_hash", plan[0][-1])
+
+    def test_get_text_hashes_chunked(self):
+        self.db.begin_batch()
+        for i in range(1200):
+            self.db.upsert_vector(f"e-{i}", f"h-{i}", "mock", "m", 1, [0.5])
+        self.db.end_batch()
+        ids = [f"e-{i}" for i in range(0, 1200, 3)] + ["missing"]
+        hashes = self.db.get_text_hashes(ids)
+        self.assertEqual(len(hashes), 400)
+        self.assertEqual(hashes["e-999"], "h-999")
+        self.assertNotIn("missing", hashes)
+        self.assertEqual(self.db.get_text_hashes([]), {})
+
     def test_search_vectors(self):
         # Insert 3 vectors
         self.db.upsert_vector("a", "h1", "mock", "m", 3, [1.0, 0.0, 0.0])
@@ -132,6 +207,19 @@ class TestVectorDB(unittest.TestCase):
         self.assertTrue(len(results) > 0)
         self.assertEqual(results[0][0], "entry-1")
 
+    def test_fts_upsert_many_replaces_existing_rows(self):
+        self.db.upsert_fts("entry-1", "Old title", "stale wording", "old")
+        self.db.upsert_fts_many([
+            ("entry-1", "Rolling statistics", "shift must precede rolling", "leakage"),
+            ("entry-2", "Cache key collision", "cache invalidation", "cache"),
+        ])
+
+        self.assertEqual(self.db.search_fts("stale", limit=5), [])
+        self.assertEqual([r[0] for r in self.db.search_fts("rolling", limit=5)], ["entry-1"])
+        self.assertEqual([r[0] for r in self.db.search_fts("cache", limit=5)], ["entry-2"])
+        count = self.db._conn.execute("SELECT COUNT(*) FROM fts_entries").fetchone()[0]
+        self.assertEqual(count, 2)
+
     def test_fts_no_match(self):
         self.db.upsert_fts("entry-1", "Rolling statistics", "shift text", "leakage")
         results = self.db.search_fts("nonexistent_term_xyz", limit=5)
@@ -239,6 +327,12 @@ class TestBatchNesting(unittest.TestCase):
         self.db.end_batch()
         self.assertEqual(self.db._batch_depth, 0)
 
+    def test_connection_pragmas(self):
+        conn = self.db._conn
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+        self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)  # MEMORY
+
 
 class TestDeleteVector(unittest.TestCase):
 
@@ -355,6 +449,33 @@ class TestSchemaVersioning(unittest.TestCase):
         self.assertEqual(version, SCHEMA_VERSION)
         db.close()
 
+    def test_v1_db_gains_scale_column(self):
+        """A v1 vectors table is migrated in place and keeps its rows."""
+        import sqlite3
+        db_path = Path(tempfile.mkdtemp()) / "v1.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            CREATE TABLE vectors (
+                entry_id TEXT PRIMARY KEY, text_hash TEXT NOT NULL,
+                provider TEXT NOT NULL, model TEXT NOT NULL,
+                dimensions INTEGER NOT NULL, embedding BLOB NOT NULL,
+                deprecated INTEGER DEFAULT 0,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO vectors VALUES ('old', 'h', 'p', 'm', 2, ?, 0, 't', 't')",
+            (pack_vector([0.5, 0.5]),),
+        )
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        with VectorDB(db_path) as db:
+            self.assertEqual(db.get_vector("old"), [0.5, 0.5])
+            db.upsert_vector("new", "h", "p", "m", 2, [0.5, 0.5], quantize=True)
+            self.assertEqual([r[0] for r in db.search_vectors([1.0, 1.0])], ["old", "new"])
+
     def test_newer_schema_warns(self):
         """DB with higher version logs a warning."""
         import sqlite3
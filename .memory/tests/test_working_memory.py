@@ -617,6 +617,20 @@ class TestExtractCandidates(unittest.TestCase):
         result = _extract_candidates(text, "findings.md")
         self.assertEqual(result[0].source_hint, "findings.md")
 
+    def test_must_statement_inside_earlier_title_skipped(self):
+        text = (
+            "CONSTRAINT: MUST close connections in finally blocks\n"
+            "MUST close connections in finally blocks\n"
+            "NEVER store plaintext passwords in the database\n"
+            "NEVER store plaintext passwords in the database or config\n"
+        )
+        titles = [c.title for c in _extract_candidates(text, "test.md")]
+        self.assertEqual(titles, [
+            "MUST close connections in finally blocks",
+            "NEVER store plaintext passwords in the database",
+            "NEVER store plaintext passwords in the database or config",
+        ])
+
     def test_title_truncation(self):
         long_text = "LESSON: " + "x" * 200
         result = _extract_candidates(long_text, "test.md")
@@ -641,6 +655,49 @@ WARNING: Pool exhaustion under heavy load
         self.assertIn("decision", types)
         self.assertIn("risk", types)
 
+    def test_no_marker_keywords_yields_nothing(self):
+        text = "Refactored the parser and reran the suite; everything passed."
+        self.assertEqual(_extract_candidates(text, "test.md"), [])
+
+    def test_sequence_of_texts_matches_joined_text(self):
+        """Scanning turns one by one gives the candidates of the joined text."""
+        turns = [
+            "ERROR: cursor lost after compaction",
+            "LESSON: Always reset the cursor after compaction",
+            "Nothing to see here",
+            "DECISION: Keep the cursor in vectors.db",
+        ]
+        joined = _extract_candidates("\n\n".join(turns), "t.md")
+        per_turn = _extract_candidates(turns, "t.md")
+        self.assertEqual(
+            [(c.suggested_type, c.title) for c in per_turn],
+            [(c.suggested_type, c.title) for c in joined],
+        )
+
+    def test_harvest_keywords_cover_every_pattern(self):
+        from lib import working_memory as wm
+        for name in ("LESSON", "CONSTRAINT", "DECISION", "WARNING", "MUST", "ERROR_FIX"):
+            keywords = getattr(wm, f"_{name}_KEYWORDS")
+            self.assertTrue(set(keywords) <= set(wm._HARVEST_KEYWORDS), name)
+
+    def test_keyword_gates_match_patterns(self):
+        """Every pattern keyword gate admits the text its regex matches."""
+        from lib.working_memory import (
+            _gated_finditer,
+            _LESSON_PATTERN, _LESSON_KEYWORDS,
+            _DECISION_PATTERN, _DECISION_KEYWORDS,
+            _ERROR_FIX_PATTERN, _ERROR_FIX_KEYWORDS,
+        )
+        samples = [
+            (_LESSON_PATTERN, _LESSON_KEYWORDS, "lesson： full-width colon works"),
+            (_DECISION_PATTERN, _DECISION_KEYWORDS, "decided: keep the cache"),
+            (_ERROR_FIX_PATTERN, _ERROR_FIX_KEYWORDS, "Fixed: stale cursor after compaction"),
+        ]
+        for pattern, keywords, text in samples:
+            gated = [m.group(1) for m in _gated_finditer(pattern, keywords, [text])]
+            self.assertEqual(gated, [m.group(1) for m in pattern.finditer(text)])
+            self.assertEqual(len(gated), 1)
+
 
 # ===========================================================================
 # Test: _extract_field, _count_phases, _get_current_phase